@@ -0,0 +1,197 @@
+# holidays/cache_store.py
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import List, Optional
+
+from .clock import Clock, get_clock
+
+INDEX_NAME = "index.json"
+
+
+class IcsCacheStore:
+    """
+    按内容寻址的 ICS 多版本缓存目录：
+
+        ics_cache/
+          index.json              # 版本列表（新 -> 旧）与当前激活版本
+          <sha256>.ics.gz         # 压缩后的 ICS 原文
+          <sha256>.snapshot.json  # 该版本的预编译快照（可选）
+
+    切换激活版本只改索引中的指针，不需要重新下载或解析。
+    超出数量或体积预算时淘汰最旧的版本（激活版本除外）。
+    同一进程内只应有一个实例（托盘后台刷新线程与主窗口共用），修改索引的操作互斥。
+    """
+
+    def __init__(self, root_dir: str, max_versions: int = 10, max_bytes: int = 2 * 1024 * 1024,
+                 clock: Clock = None):
+        """clock: 记录 fetched_at 用的时钟，默认使用全局时钟"""
+        self.root_dir = root_dir
+        self.clock = clock
+        self.max_versions = max(1, max_versions)
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(root_dir, INDEX_NAME)
+        self._lock = threading.RLock()
+        self.index = self._load_index()
+
+    # ===========================
+    #  索引
+    # ===========================
+    def _load_index(self) -> dict:
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[cache_store] 索引损坏，已重建: {e}")
+        return {"active": None, "pinned": False, "versions": []}
+
+    def _save_index(self):
+        os.makedirs(self.root_dir, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def _path(self, sha: str, suffix: str) -> str:
+        return os.path.join(self.root_dir, sha + suffix)
+
+    def _entry(self, sha: str) -> Optional[dict]:
+        for entry in self.index["versions"]:
+            if entry["sha256"] == sha:
+                return entry
+        return None
+
+    # ===========================
+    #  写入
+    # ===========================
+    def put(self, ics_text: str, etag: Optional[str] = None) -> str:
+        """
+        保存一个 ICS 版本并返回其 sha256。
+        相同内容只存一份；未被手动固定时自动成为激活版本。
+        重新拉取到被固定的版本时它成为最新版本，同时解除固定。
+        """
+        with self._lock:
+            return self._put(ics_text, etag)
+
+    def _put(self, ics_text: str, etag: Optional[str]) -> str:
+        raw = ics_text.encode("utf-8")
+        sha = hashlib.sha256(raw).hexdigest()
+        os.makedirs(self.root_dir, exist_ok=True)
+
+        entry = self._entry(sha)
+        if entry is None:
+            data_path = self._path(sha, ".ics.gz")
+            tmp_path = data_path + ".tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=9) as f:
+                f.write(raw)
+            os.replace(tmp_path, data_path)
+            entry = {
+                "sha256": sha,
+                "size": len(raw),
+                "compressed_size": os.path.getsize(data_path),
+                "snapshot": None,
+            }
+        else:
+            self.index["versions"].remove(entry)
+
+        entry["fetched_at"] = get_clock(self.clock).now().isoformat(timespec="seconds")
+        entry["etag"] = etag
+        self.index["versions"].insert(0, entry)
+
+        if not self.index.get("pinned") or self.index.get("active") is None:
+            self.index["active"] = sha
+        elif self.index["active"] == sha:
+            # 重新拉取到被固定的版本：它已是最新版本，固定不再有意义
+            self.index["pinned"] = False
+        self._evict()
+        self._save_index()
+        return sha
+
+    def attach_snapshot(self, sha: str, snapshot: dict):
+        """为某个版本记录预编译快照，之后切换到该版本无需重新解析"""
+        with self._lock:
+            entry = self._entry(sha)
+            if entry is None:
+                return
+            name = sha + ".snapshot.json"
+            tmp_path = os.path.join(self.root_dir, name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, os.path.join(self.root_dir, name))
+            entry["snapshot"] = name
+            self._save_index()
+
+    # ===========================
+    #  读取 / 切换
+    # ===========================
+    def versions(self) -> List[dict]:
+        """所有版本（新 -> 旧）"""
+        with self._lock:
+            return list(self.index["versions"])
+
+    @property
+    def active(self) -> Optional[str]:
+        return self.index.get("active")
+
+    @property
+    def pinned(self) -> bool:
+        return bool(self.index.get("pinned"))
+
+    def activate(self, sha: str) -> bool:
+        """
+        O(1) 切换激活版本。切到非最新版本时自动固定，
+        之后的远端更新只入库不激活；切回最新版本即解除固定。
+        """
+        with self._lock:
+            if self._entry(sha) is None:
+                return False
+            self.index["active"] = sha
+            self.index["pinned"] = sha != self.index["versions"][0]["sha256"]
+            self._save_index()
+            return True
+
+    def get_text(self, sha: str) -> Optional[str]:
+        path = self._path(sha, ".ics.gz")
+        if self._entry(sha) is None or not os.path.exists(path):
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read().decode("utf-8")
+
+    def active_text(self) -> Optional[str]:
+        return self.get_text(self.active) if self.active else None
+
+    def pinned_text(self) -> Optional[str]:
+        """被手动固定的版本原文；未固定时返回 None"""
+        return self.active_text() if self.pinned else None
+
+    def get_snapshot(self, sha: str) -> Optional[dict]:
+        entry = self._entry(sha)
+        if entry is None or not entry.get("snapshot"):
+            return None
+        try:
+            with open(os.path.join(self.root_dir, entry["snapshot"]), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    # ===========================
+    #  淘汰
+    # ===========================
+    def _evict(self):
+        versions = self.index["versions"]
+
+        def total_bytes():
+            return sum(v["compressed_size"] for v in versions)
+
+        while len(versions) > 1 and (len(versions) > self.max_versions or total_bytes() > self.max_bytes):
+            victim = next((v for v in reversed(versions) if v["sha256"] != self.active), None)
+            if victim is None:
+                break
+            versions.remove(victim)
+            for path in (self._path(victim["sha256"], ".ics.gz"),
+                         os.path.join(self.root_dir, victim.get("snapshot") or "")):
+                if os.path.isfile(path):
+                    os.remove(path)
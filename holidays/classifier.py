@@ -0,0 +1,87 @@
+# holidays/classifier.py
+import re
+from typing import Dict, Iterable, Optional
+
+# 默认关键字（可通过 config.json 的 makeup_keywords / holiday_keywords 覆盖）
+DEFAULT_MAKEUP_KEYWORDS = ("补班", "调休", "上班", "补上班", "调班", "workday", "makeup")
+DEFAULT_HOLIDAY_KEYWORDS = ("放假", "假期", "节日", "休息", "holiday", "festival")
+
+MAKEUP = "makeup"
+HOLIDAY = "holiday"
+OTHER = "other"
+
+
+def _compile(keywords: Iterable[str]) -> Optional[re.Pattern]:
+    """把关键字集合编译成一个正则；长词优先，保证剥离时整词去除"""
+    words = sorted({kw for kw in keywords if kw}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+
+
+class KeywordClassifier:
+    """
+    事件名分类器：每个类别一条预编译正则，结果按事件名（SUMMARY）缓存，
+    同名事件只在第一次出现时付出匹配成本。
+    补班优先于放假，例如 "劳动节 补班" 归为补班。
+    """
+
+    def __init__(self, makeup_keywords: Iterable[str] = DEFAULT_MAKEUP_KEYWORDS,
+                 holiday_keywords: Iterable[str] = DEFAULT_HOLIDAY_KEYWORDS):
+        makeup_keywords = sorted(set(makeup_keywords))
+        holiday_keywords = sorted(set(holiday_keywords))
+        # 关键字签名：预编译快照据此判断是否仍然适用
+        self.signature = "|".join(makeup_keywords) + "#" + "|".join(holiday_keywords)
+        self._makeup_re = _compile(makeup_keywords)
+        self._holiday_re = _compile(holiday_keywords)
+        self._cache: Dict[str, str] = {}
+        self._stripped: Dict[str, str] = {}
+
+    def classify(self, name: Optional[str]) -> str:
+        if not name:
+            return OTHER
+        kind = self._cache.get(name)
+        if kind is None:
+            if self._makeup_re and self._makeup_re.search(name):
+                kind = MAKEUP
+            elif self._holiday_re and self._holiday_re.search(name):
+                kind = HOLIDAY
+            else:
+                kind = OTHER
+            self._cache[name] = kind
+        return kind
+
+    def is_makeup(self, name: Optional[str]) -> bool:
+        return self.classify(name) == MAKEUP
+
+    def is_holiday(self, name: Optional[str]) -> bool:
+        return self.classify(name) == HOLIDAY
+
+    def strip_makeup(self, name: str) -> str:
+        """去掉补班关键字得到所属假期名，如 '劳动节 补班' => '劳动节'"""
+        clean = self._stripped.get(name)
+        if clean is None:
+            clean = self._makeup_re.sub("", name).strip() if self._makeup_re else name.strip()
+            self._stripped[name] = clean
+        return clean
+
+
+_classifier = KeywordClassifier()
+
+
+def get_classifier() -> KeywordClassifier:
+    return _classifier
+
+
+def configure_classifier(makeup_keywords: Optional[Iterable[str]] = None,
+                         holiday_keywords: Optional[Iterable[str]] = None) -> KeywordClassifier:
+    """
+    使用配置中的关键字重建全局分类器。
+    未给出（None）的类别沿用默认值；显式给出空列表则关闭该类别的识别。
+    """
+    global _classifier
+    _classifier = KeywordClassifier(
+        DEFAULT_MAKEUP_KEYWORDS if makeup_keywords is None else makeup_keywords,
+        DEFAULT_HOLIDAY_KEYWORDS if holiday_keywords is None else holiday_keywords,
+    )
+    return _classifier
@@ -0,0 +1,80 @@
+# holidays/clock.py
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from .timezones import DEFAULT_TZ, get_zone
+
+
+class Clock(ABC):
+    """
+    时钟抽象：所有“现在几点”的查询都经过它，
+    测试和模拟时可以换成虚拟时钟，快速回放数月的时间。
+
+    now() 总是返回带时区的 datetime：
+      - 给 tz 时换算到该时区
+      - 不给 tz 时换算到时钟的参考时区 local_tz（默认 Asia/Shanghai），与本机时区无关
+    """
+
+    local_tz: str = DEFAULT_TZ
+
+    @abstractmethod
+    def now(self, tz=None) -> datetime:
+        ...
+
+    def today(self):
+        """参考时区的今天"""
+        return self.now().date()
+
+    def _zone(self, tz):
+        return tz if tz is not None else get_zone(self.local_tz)
+
+
+class SystemClock(Clock):
+    def __init__(self, local_tz: str = DEFAULT_TZ):
+        self.local_tz = local_tz
+
+    def now(self, tz=None) -> datetime:
+        return datetime.now(self._zone(tz))
+
+
+class FixedClock(Clock):
+    """固定在某一时刻的时钟（可 pickle，可传给进程池子进程）；无时区的 instant 视为 local_tz 的墙上时间"""
+
+    def __init__(self, instant: datetime, local_tz: str = DEFAULT_TZ):
+        self.local_tz = local_tz
+        self.instant = self._to_utc(instant)
+
+    def _to_utc(self, instant: datetime) -> datetime:
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=get_zone(self.local_tz))
+        return instant.astimezone(timezone.utc)
+
+    def now(self, tz=None) -> datetime:
+        return self.instant.astimezone(self._zone(tz))
+
+
+class VirtualClock(FixedClock):
+    """可拨动的虚拟时钟，用于模拟运行"""
+
+    def advance(self, delta: timedelta):
+        self.instant += delta
+
+    def set(self, instant: datetime):
+        self.instant = self._to_utc(instant)
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock(clock: Optional[Clock] = None) -> Clock:
+    """显式传入的时钟优先，否则使用全局时钟"""
+    return clock if clock is not None else _clock
+
+
+def set_clock(clock: Optional[Clock]) -> Clock:
+    """替换全局时钟（传 None 恢复系统时钟），返回旧的时钟"""
+    global _clock
+    old = _clock
+    _clock = clock if clock is not None else SystemClock()
+    return old
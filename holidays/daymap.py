@@ -0,0 +1,54 @@
+# holidays/daymap.py
+from datetime import date, timedelta
+from typing import Dict, List, Set, Tuple
+
+from .parser import Holiday
+
+# 日期类型（与热力图配色一一对应）
+WORKDAY = 0
+WEEKEND = 1
+HOLIDAY = 2
+MAKEUP = 3
+
+
+def holiday_day_sets(holidays: List[Holiday]) -> Tuple[Set[date], Set[date]]:
+    """merge_and_filter_holidays 的结果 -> (放假日集合, 补班日集合)"""
+    holiday_days: Set[date] = set()
+    makeup_days: Set[date] = set()
+    for h in holidays:
+        if h.flag_None or h.begin is None:
+            continue
+        begin_d = h.begin.date()
+        holiday_days.update(begin_d + timedelta(days=i) for i in range(h.duration or 0))
+        makeup_days.update(h.makeup_days or ())
+    return holiday_days, makeup_days
+
+
+# ===========================
+#  按年的日期类型表
+# ===========================
+def year_day_types(year: int, holiday_days: Set[date], makeup_days: Set[date]) -> bytes:
+    """
+    一年中每天的类型，下标为当年第几天（0 起）。
+    补班优先于放假，其余按周一~周五工作日、周末休息。
+    """
+    first = date(year, 1, 1)
+    n = (date(year + 1, 1, 1) - first).days
+    types = bytearray(WEEKEND if (first + timedelta(days=i)).weekday() >= 5 else WORKDAY for i in range(n))
+    for d in holiday_days:
+        if d.year == year:
+            types[(d - first).days] = HOLIDAY
+    for d in makeup_days:
+        if d.year == year:
+            types[(d - first).days] = MAKEUP
+    return bytes(types)
+
+
+def build_day_map(holidays: List[Holiday]) -> Dict[int, bytes]:
+    """覆盖假期数据所有年份的日期类型表 {year: bytes}"""
+    holiday_days, makeup_days = holiday_day_sets(holidays)
+    years = {d.year for d in holiday_days | makeup_days}
+    if not years:
+        return {}
+    return {year: year_day_types(year, holiday_days, makeup_days)
+            for year in range(min(years), max(years) + 1)}
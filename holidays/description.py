@@ -0,0 +1,172 @@
+# holidays/description.py
+"""
+VEVENT DESCRIPTION 的惰性存储。
+
+多天假期的每一天都带着同一段很长的放假通知（全文 + 链接），
+解析时不交给 ics 库逐个解码，而是：
+  - 预扫描源文本，只记下 DESCRIPTION 原始值（未反转义、未展开折行的 UTF-8 字节）
+  - 相同的原始值在一次解析内只保留一份（interning），所有事件共享同一个对象
+  - 直到显示或显式读取 .text 时才解码 + 反转义，通知链接 / 日期句子同样按需提取
+
+每个不同的原始值复制成独立的 bytes，而不是保存 (源缓冲区, 起止偏移)：
+偏移方案会让整份 ICS 源文本随任意一个假期对象常驻内存（自带数据约 75KB），
+而去重后的描述总共只有约 5KB。
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+_VEVENT_RE = re.compile(rb"^BEGIN:VEVENT\r?\n(.*?)^END:VEVENT", re.M | re.S)
+_UID_RE = re.compile(rb"^UID:([^\r\n]*)\r?\n(?![ \t])", re.M)
+# DESCRIPTION 可能带参数（DESCRIPTION;LANGUAGE=zh-CN:...），值可能折行（下一行以空格 / Tab 开头）
+_DESC_RE = re.compile(rb"^DESCRIPTION(?:;[^:\r\n]*)?:([^\r\n]*(?:\r?\n[ \t][^\r\n]*)*)\r?\n", re.M | re.I)
+_FOLD_RE = re.compile(r"\r?\n[ \t]")
+_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+_ESCAPES = {"n": "\n", "N": "\n", "\\": "\\", ";": ";", ",": ","}
+
+_URL_RE = re.compile(r"https?://[^\s\"'<>，。；、）)]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[。；;！!？?])|\n+")
+_DATE_RE = re.compile(r"\d{1,2}月\d{1,2}日|\d{4}[-/年]\d{1,2}[-/月]\d{1,2}")
+
+
+def unescape_text(value: str) -> str:
+    """RFC 5545 TEXT：先展开折行，再还原 \\n \\, \\; \\\\"""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group(1)], _FOLD_RE.sub("", value))
+
+
+# ===========================
+#  惰性描述
+# ===========================
+class LazyDescription:
+    """
+    持有 DESCRIPTION 的原始字节，.text / str() 时才解码。
+    行为上尽量像 str：可比较、可判空、可 `in`、可 json 化前 str()。
+    """
+
+    __slots__ = ("_raw", "_text", "_url", "_dates")
+
+    def __init__(self, raw: bytes = b"", text: Optional[str] = None):
+        self._raw = raw
+        self._text = text
+        self._url = None
+        self._dates = None
+
+    @classmethod
+    def from_text(cls, text: Optional[str]) -> "LazyDescription":
+        """已解码好的文本（快照 / 旧数据）直接包一层"""
+        return cls(text=text or "")
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = unescape_text(self._raw.decode("utf-8", errors="replace"))
+        return self._text
+
+    @property
+    def decoded(self) -> bool:
+        return self._text is not None
+
+    @property
+    def notice_url(self) -> Optional[str]:
+        """放假通知链接（第一个 http/https 地址）"""
+        if self._url is None:
+            m = _URL_RE.search(self.text)
+            self._url = m.group(0) if m else ""
+        return self._url or None
+
+    @property
+    def date_sentences(self) -> List[str]:
+        """包含具体日期（如“1月1日”“2026-01-01”）的句子"""
+        if self._dates is None:
+            parts = (s.strip() for s in _SENTENCE_SPLIT_RE.split(self.text))
+            self._dates = [s for s in parts if s and _DATE_RE.search(s) and not _URL_RE.fullmatch(s)]
+        return list(self._dates)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        if self._text is None:
+            return f"LazyDescription(<{len(self._raw)} bytes, undecoded>)"
+        return f"LazyDescription({self._text[:20]!r}...)"
+
+    def __bool__(self) -> bool:
+        return bool(self._raw) if self._text is None else bool(self._text)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.text
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyDescription):
+            if self._text is None and other._text is None:
+                return self._raw == other._raw
+            return self.text == other.text
+        if isinstance(other, str):
+            return self.text == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def __reduce__(self):
+        # 进程池传递时保持未解码状态
+        if self._text is None:
+            return LazyDescription, (self._raw,)
+        return LazyDescription, (b"", self._text)
+
+
+EMPTY = LazyDescription()
+
+
+def as_description(value) -> LazyDescription:
+    if isinstance(value, LazyDescription):
+        return value
+    return LazyDescription.from_text(value) if value else EMPTY
+
+
+# ===========================
+#  预扫描
+# ===========================
+def extract_descriptions(ics_text: str) -> Tuple[str, Dict[str, LazyDescription]]:
+    """
+    从 ICS 中摘出每个 VEVENT 的 DESCRIPTION：
+    返回 (去掉这些 DESCRIPTION 行后的 ICS 文本, {UID: LazyDescription})。
+    没有 UID（或 UID 重复）的 VEVENT 保持原样，交给 ics 库照常解析。
+    """
+    source = ics_text.encode("utf-8")
+    view = memoryview(source)
+
+    found = []
+    uid_counts: Dict[str, int] = {}
+    for block in _VEVENT_RE.finditer(source):
+        body_start, body_end = block.span(1)
+        uid_m = _UID_RE.search(source, body_start, body_end)
+        desc_m = _DESC_RE.search(source, body_start, body_end)
+        if uid_m is None or desc_m is None:
+            continue
+        uid = uid_m.group(1).decode("utf-8", errors="replace").strip()
+        uid_counts[uid] = uid_counts.get(uid, 0) + 1
+        found.append((uid, desc_m))
+
+    interned: Dict[memoryview, LazyDescription] = {}
+    by_uid: Dict[str, LazyDescription] = {}
+    pieces: List[memoryview] = []
+    pos = 0
+    for uid, desc_m in found:
+        if uid_counts[uid] > 1:
+            # 重复 UID 无法一一对应，退回 ics 库解析
+            continue
+        raw = view[desc_m.start(1):desc_m.end(1)]
+        desc = interned.get(raw)
+        if desc is None:
+            desc = interned[raw] = LazyDescription(bytes(raw))
+        by_uid[uid] = desc
+        pieces.append(view[pos:desc_m.start()])
+        pos = desc_m.end()
+
+    if not by_uid:
+        return ics_text, {}
+    pieces.append(view[pos:])
+    return b"".join(pieces).decode("utf-8"), by_uid
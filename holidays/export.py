@@ -0,0 +1,166 @@
+# holidays/export.py
+"""
+为 Android / 小程序客户端预编译假期数据，客户端不必再在设备上解析与合并原始 ICS。
+
+    python -m holidays.export holiday_data.ics --json miniprogram/assets/holidays.json --ics holidayCal.slim.ics
+
+输出两种产物（同一份 parse_ics + merge_and_filter_holidays 结果）：
+  1. 紧凑 JSON（schema 见 ARTIFACT_SCHEMA），每个假期一条记录，带补班日期与预先算好的天数；
+     小程序离线 / 首次启动直接读取 miniprogram/assets/holidays.json，不再解析 ICS
+  2. 精简 ICS：每个假期一个全天 VEVENT，补班日期与天数写在 X- 属性中，
+     只认 SUMMARY/DTSTART/DTEND 的旧解析器也能直接读取
+
+产物中的时间戳（generatedAt / DTSTAMP）取自源 ICS，同一份输入总是生成逐字节相同的产物，
+可以直接提交到仓库。
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from .clock import FixedClock
+from .parser import Holiday, parse_ics
+from .processor import merge_and_filter_holidays
+from .snapshot import source_digest
+from .stats import HolidayStats
+
+# 字段只增不改；不兼容的变更才提升版本号
+ARTIFACT_SCHEMA = 1
+
+_STAMP_RE = {
+    key: re.compile(rf"^{key}:(\d{{8}}T\d{{6}})Z?\s*$", re.M)
+    for key in ("LAST-MODIFIED", "DTSTAMP")
+}
+
+
+def compile_holidays(ics_text: str, tz_str: str = "Asia/Shanghai", since: Optional[date] = None) -> List[Holiday]:
+    """
+    解析并合并假期。客户端自己按当天日期过滤，所以默认保留全部年份；
+    给出 since 时只保留在该日期及之后结束的假期。
+    """
+    clock = FixedClock(datetime.combine(since or date(1970, 1, 1), datetime.min.time()), tz_str)
+    return merge_and_filter_holidays(parse_ics(ics_text, tz_str, clock), tz_str, clock)
+
+
+def source_timestamp(ics_text: str, holidays: List[Holiday] = ()) -> datetime:
+    """
+    源数据的时间戳（UTC）：ICS 中最新的 LAST-MODIFIED，没有时用最新的 DTSTAMP
+    （有些订阅源按事件日期填写 DTSTAMP，所以只作后备）；
+    都没有时退回最晚开始的假期，再没有则为 1970-01-01。
+    """
+    for pattern in _STAMP_RE.values():
+        stamps = [datetime.strptime(m.group(1), "%Y%m%dT%H%M%S") for m in pattern.finditer(ics_text)]
+        if stamps:
+            return max(stamps).replace(tzinfo=timezone.utc)
+    if holidays:
+        return max(h.begin for h in holidays).astimezone(timezone.utc)
+    return datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# ===========================
+#  紧凑 JSON
+# ===========================
+def to_artifact(holidays: List[Holiday], ics_text: str, tz_str: str = "Asia/Shanghai") -> dict:
+    total, excl_makeup, excl_makeup_weekend = HolidayStats(holidays).total()
+    records = []
+    for h in holidays:
+        begin_d, end_d = h.begin.date(), h.end.date()
+        records.append({
+            "name": h.name,
+            "start": begin_d.isoformat(),
+            "end": end_d.isoformat(),                      # 含当天
+            "dateRange": f"{begin_d.month}/{begin_d.day} → {end_d.month}/{end_d.day}",
+            "duration": h.duration,
+            "daysExclMakeup": h.days_excl_makeup,
+            "daysExclMakeupWeekend": h.days_excl_makeup_weekend,
+            "makeupDays": [d.isoformat() for d in h.makeup_days],
+            "uid": h.uid or "",
+            "beginTs": int(h.begin.timestamp() * 1000),    # 毫秒，tz 当地 00:00
+        })
+    return {
+        "schema": ARTIFACT_SCHEMA,
+        "tz": tz_str,
+        "sourceSha256": source_digest(ics_text),
+        "generatedAt": source_timestamp(ics_text, holidays).isoformat(timespec="seconds"),
+        "holidays": records,
+        "stats": {
+            "totalDays": total,
+            "daysExclMakeup": excl_makeup,
+            "daysExclMakeupWeekend": excl_makeup_weekend,
+        },
+    }
+
+
+# ===========================
+#  精简 ICS
+# ===========================
+def _ics_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def to_slim_ics(holidays: List[Holiday], tz_str: str = "Asia/Shanghai", stamp: Optional[datetime] = None) -> str:
+    """stamp: 写入 DTSTAMP 的时刻，默认由 source_timestamp 从假期推出"""
+    stamp = (stamp or source_timestamp("", holidays)).astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "PRODID:-//Null993//HolidayCountdown slim//CN",
+        "VERSION:2.0",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-TIMEZONE:{tz_str}",
+    ]
+    for h in holidays:
+        begin_d, end_d = h.begin.date(), h.end.date()
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{h.uid or begin_d.strftime('%Y%m%d') + '_holiday@holidaycountdown'}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{begin_d:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{end_d + timedelta(days=1):%Y%m%d}",
+            f"SUMMARY:{_ics_escape(h.name)}",
+            f"X-DAYS:{h.duration}",
+            f"X-DAYS-EXCL-MAKEUP:{h.days_excl_makeup}",
+            f"X-DAYS-EXCL-MAKEUP-WEEKEND:{h.days_excl_makeup_weekend}",
+        ]
+        if h.makeup_days:
+            lines.append("X-MAKEUP-DATES:" + ",".join(f"{d:%Y%m%d}" for d in h.makeup_days))
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _write(path: str, text: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="为客户端预编译假期数据")
+    parser.add_argument("ics", help="源 ICS 文件")
+    parser.add_argument("--json", help="输出紧凑 JSON 路径")
+    parser.add_argument("--ics-out", "--slim-ics", dest="ics_out", help="输出精简 ICS 路径")
+    parser.add_argument("--since", type=date.fromisoformat, help="只保留该日期及之后结束的假期（YYYY-MM-DD）")
+    parser.add_argument("--tz", default="Asia/Shanghai")
+    args = parser.parse_args(argv)
+
+    with open(args.ics, "r", encoding="utf-8") as f:
+        ics_text = f.read()
+    holidays = compile_holidays(ics_text, args.tz, args.since)
+
+    if args.json:
+        artifact = to_artifact(holidays, ics_text, args.tz)
+        _write(args.json, json.dumps(artifact, ensure_ascii=False, separators=(",", ":")))
+        print(f"[export] {len(holidays)} holidays -> {args.json} ({os.path.getsize(args.json)} bytes)")
+    if args.ics_out:
+        _write(args.ics_out, to_slim_ics(holidays, args.tz, source_timestamp(ics_text, holidays)))
+        print(f"[export] {len(holidays)} holidays -> {args.ics_out} ({os.path.getsize(args.ics_out)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
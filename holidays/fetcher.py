@@ -1,6 +1,9 @@
 # holidays/fetcher.py
+import os
 import requests
-from typing import Optional
+from typing import List, Optional, Union
+
+from .mirrors import MirrorHealth, MirrorsExhausted, race_fetch
 
 def fetch_ics(url: str, timeout: int = 15) -> Optional[str]:
     """
@@ -13,3 +16,41 @@ def fetch_ics(url: str, timeout: int = 15) -> Optional[str]:
     except Exception as e:
         print(f"[fetcher] failed to fetch {url}: {e}")
         return None
+
+def is_valid_ics(text: str) -> bool:
+    """简单的完整性校验 —— 确保是一个 calendar 且至少有一个 VEVENT"""
+    upper = text.upper()
+    return ("BEGIN:VCALENDAR" in upper) and ("END:VCALENDAR" in upper) and ("BEGIN:VEVENT" in upper)
+
+def mirror_urls(config: dict) -> List[str]:
+    """配置中的镜像列表（ics_mirrors），未配置时退回单个 ics_url"""
+    urls = list(config.get("ics_mirrors") or [])
+    if config.get("ics_url") and config["ics_url"] not in urls:
+        urls.insert(0, config["ics_url"])
+    return urls
+
+def refresh_cache(urls: Union[str, List[str]], cache_path: str, store=None, timeout: int = 10,
+                  health: Optional[MirrorHealth] = None) -> Optional[str]:
+    """
+    无界面的刷新：多镜像竞速下载并校验 ICS，原子写入本地缓存（以及版本库 store）。
+    成功返回 ICS 文本，失败返回 None 且不改动已有缓存。
+    """
+    if isinstance(urls, str):
+        urls = [urls]
+    try:
+        result = race_fetch(urls, is_valid_ics, timeout=timeout, health=health)
+    except MirrorsExhausted as e:
+        print(f"[fetcher] {e}")
+        return None
+    text = result.text
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+        if store is not None:
+            store.put(text, etag=result.etag)
+    except OSError as e:
+        print(f"[fetcher] failed to save {cache_path}: {e}")
+    return text
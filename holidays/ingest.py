@@ -0,0 +1,215 @@
+# holidays/ingest.py
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .clock import Clock, FixedClock, get_clock
+from .parser import Holiday, parse_ics
+from .timezones import get_zone
+
+# 少于该数量的 VEVENT 直接串行解析（进程启动成本比解析本身更高）
+PARALLEL_MIN_EVENTS = 400
+INDEX_VERSION = 1
+
+# 紧凑记录：(uid, name, begin_ts, end_ts, all_day, raw_description, duration)
+# raw_description 在进程间传递时是 LazyDescription（保持未解码），写入索引前才转成 str
+Record = Tuple[str, str, float, float, bool, object, int]
+
+
+# ===========================
+#  记录 <-> Holiday
+# ===========================
+def to_record(h: Holiday) -> Record:
+    return (h.uid, h.name, h.begin.timestamp(), h.end.timestamp(), bool(h.all_day), h.raw_description, h.duration)
+
+
+def to_json_record(rec: Record) -> Record:
+    """索引是 JSON：描述必须先解码成 str"""
+    uid, name, begin_ts, end_ts, all_day, raw_description, duration = rec
+    return uid, name, begin_ts, end_ts, all_day, str(raw_description), duration
+
+
+def from_record(rec: Record, tz_str: str = "Asia/Shanghai") -> Holiday:
+    zone = get_zone(tz_str)
+    uid, name, begin_ts, end_ts, all_day, raw_description, duration = rec
+    return Holiday(
+        uid=uid,
+        name=name,
+        begin=datetime.fromtimestamp(begin_ts, zone),
+        end=datetime.fromtimestamp(end_ts, zone),
+        all_day=all_day,
+        raw_description=raw_description,
+        duration=duration,
+        days_excl_makeup=0,
+        days_excl_makeup_weekend=0,
+    )
+
+
+def _sort_key(h: Holiday):
+    return h.begin, h.uid
+
+
+# ===========================
+#  VEVENT 切分
+# ===========================
+def split_vevents(ics_text: str) -> Tuple[str, List[str]]:
+    """
+    把 ICS 文本切成 (日历头, [VEVENT 块...])。
+    日历头包含 VCALENDAR 属性和 VTIMEZONE，每个分块都会带上它以保证时区解析一致。
+    """
+    header: List[str] = []
+    blocks: List[str] = []
+    current: Optional[List[str]] = None
+
+    for line in ics_text.splitlines():
+        key = line.strip().upper()
+        if key == "BEGIN:VEVENT":
+            current = [line]
+        elif current is not None:
+            current.append(line)
+            if key == "END:VEVENT":
+                blocks.append("\n".join(current))
+                current = None
+        elif key != "END:VCALENDAR":
+            header.append(line)
+
+    return "\n".join(header), blocks
+
+
+def _parse_chunk(args: Tuple[str, str, Optional[Clock]]) -> List[Record]:
+    text, tz_str, clock = args
+    return [to_record(h) for h in parse_ics(text, tz_str, clock)]
+
+
+def _chunk_texts(header: str, blocks: List[str], n_chunks: int) -> List[str]:
+    size = max(1, -(-len(blocks) // n_chunks))
+    return [
+        "\n".join([header, *blocks[i:i + size], "END:VCALENDAR"])
+        for i in range(0, len(blocks), size)
+    ]
+
+
+# ===========================
+#  单个大 ICS 并行解析
+# ===========================
+def parse_ics_parallel(ics_text: str, tz_str: str = "Asia/Shanghai",
+                       workers: Optional[int] = None, clock: Clock = None) -> List[Holiday]:
+    """
+    按 VEVENT 分块，在进程池中解析；结果与 parse_ics 完全一致。
+    事件数量较少时直接走串行路径。
+    子进程拿到的是当前时刻的 FixedClock，保证与串行路径用同一个“现在”。
+    """
+    header, blocks = split_vevents(ics_text)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(blocks) < PARALLEL_MIN_EVENTS:
+        return parse_ics(ics_text, tz_str, clock)
+    frozen = FixedClock(get_clock(clock).now(get_zone(tz_str)))
+
+    chunks = _chunk_texts(header, blocks, workers * 4)
+    records: List[Record] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_parse_chunk, [(c, tz_str, frozen) for c in chunks]):
+            records.extend(part)
+
+    events = [from_record(r, tz_str) for r in records]
+    events.sort(key=_sort_key)
+    return events
+
+
+# ===========================
+#  多文件解析（mtime/size 索引）
+# ===========================
+def _read_and_parse(args: Tuple[str, str, Optional[Clock]]) -> List[Record]:
+    path, tz_str, clock = args
+    with open(path, "r", encoding="utf-8") as f:
+        return _parse_chunk((f.read(), tz_str, clock))
+
+
+def collect_ics_paths(paths: Iterable[str]) -> List[str]:
+    """展开目录，返回所有 .ics 文件的绝对路径（排序）"""
+    result = []
+    for p in paths:
+        if os.path.isdir(p):
+            for name in os.listdir(p):
+                if name.lower().endswith(".ics"):
+                    result.append(os.path.abspath(os.path.join(p, name)))
+        elif os.path.isfile(p):
+            result.append(os.path.abspath(p))
+    return sorted(set(result))
+
+
+def _load_index(index_path: Optional[str], tz_str: str, year: int) -> Dict[str, dict]:
+    if not index_path or not os.path.exists(index_path):
+        return {}
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[ingest] 索引读取失败，将全部重新解析: {e}")
+        return {}
+    # parse_ics 会按当前年份过滤事件，跨年后索引作废
+    if (data.get("version") != INDEX_VERSION or data.get("tz") != tz_str
+            or data.get("year") != year):
+        return {}
+    return data.get("files", {})
+
+
+def _save_index(index_path: Optional[str], tz_str: str, year: int, files: Dict[str, dict]):
+    if not index_path:
+        return
+    tmp_path = index_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "tz": tz_str, "year": year, "files": files},
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, index_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"[ingest] 索引保存失败: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def parse_ics_files(paths: Iterable[str], tz_str: str = "Asia/Shanghai",
+                    workers: Optional[int] = None, index_path: Optional[str] = None,
+                    clock: Clock = None) -> List[Holiday]:
+    """
+    解析多个 ICS 文件 / 目录，每个文件一个进程池任务。
+    index_path 记录每个文件的 mtime/size 与解析结果，未变化的文件直接复用，不再读取。
+    返回所有文件事件的合并列表（按开始时间排序）。
+    """
+    files = collect_ics_paths(paths)
+    frozen = FixedClock(get_clock(clock).now(get_zone(tz_str)))
+    year = frozen.now().year
+    old_index = _load_index(index_path, tz_str, year)
+    new_index: Dict[str, dict] = {}
+    todo: List[Tuple[str, os.stat_result]] = []
+
+    for path in files:
+        st = os.stat(path)
+        entry = old_index.get(path)
+        if entry and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            new_index[path] = entry
+        else:
+            todo.append((path, st))
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(todo)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_read_and_parse, [(p, tz_str, frozen) for p, _ in todo]))
+    else:
+        parsed = [_read_and_parse((p, tz_str, frozen)) for p, _ in todo]
+
+    for (path, st), records in zip(todo, parsed):
+        new_index[path] = {"mtime": st.st_mtime, "size": st.st_size,
+                           "records": [to_json_record(r) for r in records]}
+
+    if todo or set(new_index) != set(old_index):
+        _save_index(index_path, tz_str, year, new_index)
+
+    events = [from_record(r, tz_str) for path in files for r in new_index[path]["records"]]
+    events.sort(key=_sort_key)
+    return events
@@ -0,0 +1,286 @@
+# holidays/mirrors.py
+import codecs
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 上游仓库的 GitHub raw 地址，作为默认镜像之一
+GITHUB_RAW_URL = "https://raw.githubusercontent.com/lanceliao/china-holiday-calender/master/holidayCal.ics"
+
+# 健康分数的指数滑动平均系数
+_ALPHA = 0.3
+# 单个镜像建立连接的超时（秒）；连接阶段无法取消，只能靠它限制输家线程的存活时间
+CONNECT_TIMEOUT = 3.0
+
+
+class MirrorsExhausted(requests.RequestException):
+    """所有镜像都失败（网络错误 / 超时 / 内容校验失败）"""
+
+    def __init__(self, errors: Dict[str, str], all_invalid: bool = False):
+        self.errors = errors
+        self.all_invalid = all_invalid
+        detail = "; ".join(f"{url}: {err}" for url, err in errors.items())
+        super().__init__(f"所有镜像均失败：{detail}")
+
+
+class _Cancelled(Exception):
+    pass
+
+
+@dataclass
+class FetchResult:
+    text: str
+    url: str
+    etag: Optional[str]
+    latency: float      # 秒
+    size: int           # 字节
+
+
+# ===========================
+#  镜像健康度
+# ===========================
+class MirrorHealth:
+    """
+    记录每个镜像的延迟与出错率（指数滑动平均），持久化到 JSON，
+    下次优先尝试又快又稳的镜像。从未尝试过的镜像保持配置中的顺序。
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.scores: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.scores = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[mirrors] 健康度记录损坏，已重置: {e}")
+
+    def record_success(self, url: str, latency: float):
+        with self._lock:
+            s = self.scores.setdefault(url, {"latency": latency, "error": 0.0})
+            s["latency"] = (1 - _ALPHA) * s["latency"] + _ALPHA * latency
+            s["error"] = (1 - _ALPHA) * s["error"]
+
+    def record_failure(self, url: str, timeout: float):
+        with self._lock:
+            s = self.scores.setdefault(url, {"latency": timeout, "error": 1.0})
+            s["latency"] = (1 - _ALPHA) * s["latency"] + _ALPHA * timeout
+            s["error"] = (1 - _ALPHA) * s["error"] + _ALPHA
+
+    def score(self, url: str) -> Optional[float]:
+        s = self.scores.get(url)
+        if s is None:
+            return None
+        # 出错率高的镜像按延迟放大惩罚
+        return s["latency"] * (1 + 4 * s["error"])
+
+    def order(self, urls: List[str]) -> List[str]:
+        """已知镜像按分数升序排在前面，未知镜像按原顺序排在后面"""
+        known = [u for u in urls if self.score(u) is not None]
+        unknown = [u for u in urls if self.score(u) is None]
+        return sorted(known, key=self.score) + unknown
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        try:
+            with self._lock, open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.scores, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[mirrors] 保存健康度失败: {e}")
+
+
+# ===========================
+#  竞速下载
+# ===========================
+def _decode(resp: requests.Response, body: bytes) -> str:
+    # text/calendar 不带 charset 时 requests 会按 ISO-8859-1 解码，ICS 实际都是 UTF-8
+    encoding = "utf-8"
+    if "charset" in resp.headers.get("Content-Type", "").lower() and resp.encoding:
+        encoding = resp.encoding
+    if codecs.lookup(encoding).name == "utf-8":
+        # 去掉 BOM，否则 ICS 解析器认不出第一行 BEGIN:VCALENDAR
+        encoding = "utf-8-sig"
+    # 严格解码：编码不对时宁可算作该镜像失败，也不把乱码写进本地缓存
+    return body.decode(encoding)
+
+
+class _Attempt:
+    """
+    一次镜像请求。连接建立后记下底层 socket，竞速结束时直接 shutdown：
+    阻塞在等响应头或读数据上的输家线程立即报错返回，不会占着 socket 等到超时。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sockets = []
+        self.cancelled = False
+
+    def attach(self, sock):
+        with self._lock:
+            self._sockets.append(sock)
+            cancelled = self.cancelled
+        if cancelled:
+            _shutdown(sock)
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            sockets = list(self._sockets)
+        for sock in sockets:
+            _shutdown(sock)
+
+    def session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = _TrackingAdapter(self)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+def _shutdown(sock):
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class _TrackingAdapter(HTTPAdapter):
+    """每个请求独占的连接池，连接类换成连上后向 _Attempt 登记 socket 的子类"""
+
+    def __init__(self, attempt: _Attempt):
+        self.attempt = attempt
+        super().__init__()
+
+    def get_connection_with_tls_context(self, *args, **kwargs):
+        pool = super().get_connection_with_tls_context(*args, **kwargs)
+        if not getattr(pool.ConnectionCls, "_tracked", False):
+            attempt = self.attempt
+
+            class TrackedConnection(pool.ConnectionCls):
+                _tracked = True
+
+                def connect(self):
+                    super().connect()
+                    attempt.attach(self.sock)
+
+            pool.ConnectionCls = TrackedConnection
+        return pool
+
+
+def _fetch_one(url: str, timeout: float, cancel: threading.Event, max_bytes: int,
+               attempt: Optional[_Attempt] = None) -> FetchResult:
+    start = time.monotonic()
+    attempt = attempt or _Attempt()
+    with attempt.session() as session, \
+            session.get(url, timeout=(min(CONNECT_TIMEOUT, timeout), timeout), stream=True) as resp:
+        if cancel.is_set():
+            raise _Cancelled()
+        resp.raise_for_status()
+        chunks = []
+        size = 0
+        for chunk in resp.iter_content(chunk_size=16384):
+            if cancel.is_set():
+                raise _Cancelled()
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"响应超过 {max_bytes} 字节")
+            if time.monotonic() - start > timeout:
+                raise requests.Timeout(f"下载超过 {timeout} 秒")
+            chunks.append(chunk)
+        body = b"".join(chunks)
+        return FetchResult(_decode(resp, body), url, resp.headers.get("ETag"), time.monotonic() - start, size)
+
+
+def race_fetch(urls: List[str], validate: Callable[[str], bool], timeout: float = 10,
+               stagger: float = 0.3, health: Optional[MirrorHealth] = None,
+               max_bytes: int = 8 * 1024 * 1024) -> FetchResult:
+    """
+    happy-eyeballs 式镜像竞速：按健康度顺序，每隔 stagger 秒（或前一个失败时立即）
+    启动下一个镜像；第一个通过 validate 的响应胜出，其余请求的 socket 随即被 shutdown。
+    全部失败抛 MirrorsExhausted（requests.RequestException 子类）。
+    """
+    urls = [u for u in dict.fromkeys(urls) if u]
+    if health is not None:
+        urls = health.order(urls)
+    if not urls:
+        raise MirrorsExhausted({}, all_invalid=False)
+
+    cancel = threading.Event()
+    results: "queue.Queue" = queue.Queue()
+    errors: Dict[str, str] = {}
+    invalid: List[str] = []
+    attempts: List[_Attempt] = []
+    deadline = time.monotonic() + timeout
+
+    def worker(url, attempt):
+        try:
+            results.put((url, _fetch_one(url, timeout, cancel, max_bytes, attempt), None))
+        except Exception as e:
+            results.put((url, None, "cancelled" if cancel.is_set() else e))
+
+    next_index = 0
+    pending = 0
+    next_start_at = 0.0
+    try:
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            # 没有在途请求，或距上一个启动已过 stagger：启动下一个镜像
+            if next_index < len(urls) and (pending == 0 or now >= next_start_at):
+                attempt = _Attempt()
+                attempts.append(attempt)
+                threading.Thread(target=worker, args=(urls[next_index], attempt), name="ics-mirror",
+                                 daemon=True).start()
+                next_index += 1
+                pending += 1
+                next_start_at = now + stagger
+            if pending == 0:
+                break
+
+            wait = deadline - now
+            if next_index < len(urls):
+                wait = min(wait, next_start_at - now)
+            try:
+                url, result, error = results.get(timeout=max(wait, 0.01))
+            except queue.Empty:
+                continue
+
+            pending -= 1
+            if result is not None and validate(result.text):
+                if health is not None:
+                    health.record_success(url, result.latency)
+                return result
+
+            if result is not None:
+                errors[url] = "内容校验失败"
+                invalid.append(url)
+            else:
+                errors[url] = str(error)
+            if health is not None:
+                health.record_failure(url, timeout)
+
+        for url in urls[:next_index]:
+            if url not in errors:
+                errors[url] = "超时"
+                if health is not None:
+                    health.record_failure(url, timeout)
+        raise MirrorsExhausted(errors, all_invalid=bool(invalid) and len(invalid) == len(errors))
+    finally:
+        cancel.set()
+        for attempt in attempts:
+            attempt.cancel()
+        if health is not None:
+            health.save()
@@ -0,0 +1,136 @@
+# holidays/offwork.py
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+
+from .daymap import holiday_day_sets
+from .parser import Holiday
+from .timezones import get_zone, localize
+
+SLOTS = ("mid", "night")
+_SLOT_KEYS = {"mid": "offwork_mid_time", "night": "offwork_time"}
+_SLOT_DEFAULTS = {"mid": "12:00", "night": "18:00"}
+_WEEKDAY_KEYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def parse_hhmm(text: str) -> time:
+    """'HH:MM' -> time，格式不对抛 ValueError"""
+    hh, mm = map(int, text.strip().split(":"))
+    if not (0 <= hh < 24 and 0 <= mm < 60):
+        raise ValueError(f"时间超出范围: {text}")
+    return time(hh, mm)
+
+
+# ===========================
+#  作息表
+# ===========================
+class OffworkSchedule:
+    """
+    每天的下班时间由三层规则决定（优先级从高到低）：
+      1. 节假日不上班；merge_and_filter_holidays 给出的补班日照常上班（按周一~周五的默认时间）
+      2. 轮班表 offwork_shift：{"anchor": "2026-01-05", "cycle": [{...}, null, ...]}，null 为休息日
+      3. 按星期覆盖 offwork_weekdays：{"fri": {"offwork_time": "17:00"}, "sat": {...}, "sun": null}
+         未覆盖时周一~周五上班、周末休息
+    每条规则的值里可写 offwork_mid_time / offwork_time，缺省沿用全局设置，写 null 表示该段不下班。
+    """
+
+    def __init__(self, config: dict, holidays: List[Holiday] = ()):
+        self.defaults = {slot: self._parse_slot(config, slot, _SLOT_DEFAULTS[slot]) for slot in SLOTS}
+
+        self.weekdays: Dict[int, Optional[dict]] = {}
+        overrides = config.get("offwork_weekdays") or {}
+        for i, key in enumerate(_WEEKDAY_KEYS):
+            if key in overrides:
+                self.weekdays[i] = self._parse_rule(overrides[key])
+            elif i < 5:
+                self.weekdays[i] = dict(self.defaults)
+            else:
+                self.weekdays[i] = None
+
+        shift = config.get("offwork_shift") or {}
+        self.shift_anchor = date.fromisoformat(shift["anchor"]) if shift.get("cycle") else None
+        self.shift_cycle = [self._parse_rule(r) for r in shift.get("cycle", [])]
+
+        self.holiday_days, self.makeup_days = holiday_day_sets(holidays)
+
+    def _parse_slot(self, rule: dict, slot: str, fallback) -> Optional[time]:
+        key = _SLOT_KEYS[slot]
+        if key not in rule:
+            return fallback if not isinstance(fallback, str) else parse_hhmm(fallback)
+        value = rule[key]
+        return parse_hhmm(value) if value else None
+
+    def _parse_rule(self, rule: Optional[dict]) -> Optional[dict]:
+        if rule is None:
+            return None
+        return {slot: self._parse_slot(rule, slot, self.defaults[slot]) for slot in SLOTS}
+
+    def rule_for(self, d: date) -> Optional[dict]:
+        """当天的下班时间 {slot: time|None}；不上班返回 None"""
+        if d in self.makeup_days:
+            return dict(self.defaults)
+        if d in self.holiday_days:
+            return None
+        if self.shift_anchor is not None:
+            return self.shift_cycle[(d - self.shift_anchor).days % len(self.shift_cycle)]
+        return self.weekdays[d.weekday()]
+
+    def is_workday(self, d: date) -> bool:
+        return self.rule_for(d) is not None
+
+
+# ===========================
+#  下次下班时刻表
+# ===========================
+class OffworkTable:
+    """
+    预先算好每段（中午 / 晚上）接下来 N 次下班时刻。
+    每秒刷新只需丢掉已过去的表头并与新表头比较；
+    仅在跨天或数据 / 配置变化时（invalidate）重建。
+    """
+
+    def __init__(self, schedule: OffworkSchedule, size: int = 14, tz_str: str = "Asia/Shanghai",
+                 max_scan_days: int = 400):
+        self.schedule = schedule
+        self.size = size
+        self.tz_str = tz_str
+        self.max_scan_days = max_scan_days
+        self.built_for: Optional[date] = None
+        self._table: Dict[str, List[datetime]] = {slot: [] for slot in SLOTS}
+        self._head: Dict[str, int] = {slot: 0 for slot in SLOTS}
+
+    def invalidate(self, schedule: Optional[OffworkSchedule] = None):
+        if schedule is not None:
+            self.schedule = schedule
+        self.built_for = None
+
+    def rebuild(self, now: datetime):
+        zone = get_zone(self.tz_str)
+        today = now.date()
+        table: Dict[str, List[datetime]] = {slot: [] for slot in SLOTS}
+
+        for offset in range(self.max_scan_days):
+            d = today + timedelta(days=offset)
+            rule = self.schedule.rule_for(d)
+            if rule:
+                for slot in SLOTS:
+                    if rule[slot] is not None and len(table[slot]) < self.size:
+                        table[slot].append(datetime.combine(d, rule[slot], tzinfo=zone))
+            if all(len(v) >= self.size for v in table.values()):
+                break
+
+        self._table = table
+        self._head = {slot: 0 for slot in SLOTS}
+        self.built_for = today
+
+    def next(self, slot: str, now: datetime) -> Optional[datetime]:
+        """该段下一次下班时刻（严格晚于 now）；now 无时区时视为 tz_str 的墙上时间"""
+        now = localize(now, self.tz_str)
+        if self.built_for != now.date():
+            self.rebuild(now)
+
+        entries = self._table[slot]
+        i = self._head[slot]
+        while i < len(entries) and entries[i] <= now:
+            i += 1
+        self._head[slot] = i
+        return entries[i] if i < len(entries) else None
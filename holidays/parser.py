@@ -1,11 +1,15 @@
 # holidays/parser.py
+import sys
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from itertools import count
 
 from ics import Calendar
 from typing import List
-import pytz
+
+from .clock import Clock, get_clock
+from .description import LazyDescription, as_description, extract_descriptions
+from .timezones import get_zone, localize
 
 @dataclass
 class Holiday:
@@ -14,47 +18,65 @@ class Holiday:
     begin: datetime   # start datetime
     end: datetime     # end datetime (exclusive)
     all_day: bool
-    raw_description: str
+    raw_description: LazyDescription   # 未解码的 DESCRIPTION，str() / .text 时才解码
     duration: int
     days_excl_makeup: int
     days_excl_makeup_weekend: int
     flag_None: bool
+    makeup_days: List[date]   # 归属该假期的补班日期
 
 
-    def __init__(self, flag_None=False, uid=None, name=None, begin=None, end=None, all_day=None, raw_description=None, duration=None, days_excl_makeup=None,days_excl_makeup_weekend=None):
+    def __init__(self, flag_None=False, uid=None, name=None, begin=None, end=None, all_day=None, raw_description=None, duration=None, days_excl_makeup=None,days_excl_makeup_weekend=None, makeup_days=None):
 
         self.uid = uid
         self.name = name
         self.begin = begin
         self.end = end
         self.all_day = all_day
-        self.raw_description = raw_description
+        self.raw_description = as_description(raw_description)
         self.duration = duration
         self.days_excl_makeup = days_excl_makeup
         self.days_excl_makeup_weekend = days_excl_makeup_weekend
         self.flag_None = flag_None
+        self.makeup_days = makeup_days or []
+
+    # ===========================
+    #  放假通知（按需解码 / 提取）
+    # ===========================
+    @property
+    def description(self) -> str:
+        return self.raw_description.text
+
+    @property
+    def notice_url(self):
+        return self.raw_description.notice_url
+
+    @property
+    def notice_dates(self) -> List[str]:
+        return self.raw_description.date_sentences
 
 
 def ensure_timezone(dt, tz_str="Asia/Shanghai"):
     """确保 datetime 带上时区信息"""
     if not dt:
         return None
-    tz = pytz.timezone(tz_str)
-    if dt.tzinfo is None:
-        return tz.localize(dt)
-    else:
-        return dt.astimezone(tz)
+    return localize(dt, tz_str)
 
-def parse_ics(ics_text: str, tz_str: str = "Asia/Shanghai") -> List[Holiday]:
+def parse_ics(ics_text: str, tz_str: str = "Asia/Shanghai", clock: Clock = None) -> List[Holiday]:
     """
     使用 ics 库解析 ICS 文本，返回 Holiday 列表
+    clock: 决定“今年”的时钟，默认使用全局时钟
     """
-    cal = Calendar(ics_text)
+    # DESCRIPTION 不交给 ics 库解码：预扫描摘出原始字节，相同通知只存一份
+    stripped_text, descriptions = extract_descriptions(ics_text)
+    cal = Calendar(stripped_text)
     events = []
+    zone = get_zone(tz_str)
+    this_year = get_clock(clock).now(zone).year
 
 
     for ev in cal.events:
-        if ev.end.datetime.year + 1 < datetime.now().year:
+        if ev.end.datetime.year + 1 < this_year:
             continue
         begin = ensure_timezone(ev.begin.datetime, tz_str)
         end = ensure_timezone(ev.end.datetime if ev.end else ev.begin.datetime, tz_str)
@@ -65,21 +87,27 @@ def parse_ics(ics_text: str, tz_str: str = "Asia/Shanghai") -> List[Holiday]:
         if is_all_day:
             # 全天事件：设为当天 00:00 → 当天 23:59:59
 
-            begin = datetime.combine(begin.date(), time(0, 0, 0, tzinfo=pytz.timezone(tz_str)))
-            end = datetime.combine(end.date() - timedelta(days=1), time(23, 59, 59, tzinfo=pytz.timezone(tz_str)))
+            begin = datetime.combine(begin.date(), time(0, 0, 0), tzinfo=zone)
+            end = datetime.combine(end.date() - timedelta(days=1), time(23, 59, 59), tzinfo=zone)
+
+        uid = getattr(ev.uid, "value", str(ev.uid)) if ev.uid else ""
+        description = descriptions.get(uid)
+        if description is None:
+            description = getattr(ev.description, "value", str(ev.description)) if ev.description else ""
 
         events.append(Holiday(
-            uid=getattr(ev.uid, "value", str(ev.uid)) if ev.uid else "",
-            name=getattr(ev.name, "value", str(ev.name)) if ev.name else "",
+            uid=uid,
+            # 多天假期 / 补班的标题大量重复，驻留后共享同一个 str
+            name=sys.intern(getattr(ev.name, "value", str(ev.name))) if ev.name else "",
             begin=begin,
             end=end,
             all_day=all_day,
-            raw_description=getattr(ev.description, "value", str(ev.description)) if ev.description else "",
+            raw_description=description,
             duration= (ev.end - ev.begin).days+1,
             days_excl_makeup=0,
             days_excl_makeup_weekend=0,
         ))
 
     # 按开始时间排序
-    events.sort(key=lambda e: e.begin)
+    events.sort(key=lambda e: (e.begin, e.uid))
     return events
@@ -1,18 +1,24 @@
 # processor.py
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional
-import pytz
 
+from .classifier import get_classifier
+from .clock import Clock, get_clock
 from .parser import Holiday
+from .timezones import get_zone
 
-# 补班/调休关键字
-_MAKEUP_KEYWORDS = {"补班", "调休", "上班", "补上班", "调班", "workday", "makeup"}
+# 名称规范化用到的正则（预编译）
+_DAY_SUFFIX_RE = re.compile(r"\s第")
+_SPACES_RE = re.compile(r"\s+")
+_HOLIDAY_WORDS_RE = re.compile(r"\b(假期|假日|放假)\b")
 
 
 # ===========================
 #  名称处理
 # ===========================
+@lru_cache(maxsize=1024)
 def normalize_name(raw_name: Optional[str]) -> str:
     """
     将事件名规范化，例如：
@@ -27,25 +33,22 @@ def normalize_name(raw_name: Optional[str]) -> str:
     s = raw_name.strip()
 
     # 截断 Day、"第x天" 之类
-    m = re.search(r"\s第", s)
+    m = _DAY_SUFFIX_RE.search(s)
     if m:
         s = s[:m.start()].strip()
 
     # 多空白合并
-    s = re.sub(r"\s+", " ", s)
+    s = _SPACES_RE.sub(" ", s)
 
     # 删除“假期/假日/放假”等描述词
-    s = re.sub(r"\b(假期|假日|放假)\b", "", s)
+    s = _HOLIDAY_WORDS_RE.sub("", s)
 
     return s.strip()
 
 
 def is_makeup_event(raw_name: Optional[str]) -> bool:
     """判断是否为补班/调休事件"""
-    if not raw_name:
-        return False
-    t = raw_name.lower()
-    return any(kw in t for kw in _MAKEUP_KEYWORDS)
+    return get_classifier().is_makeup(raw_name)
 
 
 # ===========================
@@ -62,10 +65,16 @@ def to_local(dt: datetime, target_tzinfo) -> datetime:
 # ===========================
 #  主函数
 # ===========================
-def merge_and_filter_holidays(holidays: List[Holiday], tz_str="Asia/Shanghai") -> List[Holiday]:
+def merge_and_filter_holidays(holidays: List[Holiday], tz_str="Asia/Shanghai", clock: Clock = None,
+                              keep_ended: bool = False) -> List[Holiday]:
+    """
+    默认用 drop_ended 去掉今天之前已经结束的假期；
+    keep_ended=True 时保留今年已经结束的假期（日历热力图 / 全年统计需要）。
+    """
 
-    system_now = datetime.now().astimezone()
-    local_tz = pytz.timezone(tz_str)
+    local_tz = get_zone(tz_str)
+    system_now = get_clock(clock).now(local_tz)
+    classifier = get_classifier()
 
     merged: Dict[str, dict] = {}        # 假期合并表
     makeup_days: Dict[str, set] = {}    # key → {补班日期}
@@ -90,15 +99,10 @@ def merge_and_filter_holidays(holidays: List[Holiday], tz_str="Asia/Shanghai") -
             continue
 
         # ====== (1) 遇到调休，不生成 key，必须先暂存 ======
-        if is_makeup_event(base_name):
+        if classifier.is_makeup(base_name):
 
             # 洁名（假期名，不带“补班/调休”）
-            clean_name = (
-                base_name.replace("补班", "")
-                .replace("调休", "")
-                .replace("上班", "")
-                .strip()
-            )
+            clean_name = classifier.strip_makeup(base_name)
 
             makeup_pending.append({
                 "base_name": base_name,      # 如 "劳动节 调休"
@@ -161,9 +165,6 @@ def merge_and_filter_holidays(holidays: List[Holiday], tz_str="Asia/Shanghai") -
         begin_local = data["begin"]
         end_local = data["end"]
 
-        if end_local.date() < system_now.date():
-            continue
-
         # 假期总天数
         total_days = (end_local.date() - begin_local.date()).days + 1
 
@@ -189,9 +190,17 @@ def merge_and_filter_holidays(holidays: List[Holiday], tz_str="Asia/Shanghai") -
             raw_description=data.get("raw_description", ""),
             duration=total_days,
             days_excl_makeup=days_excl_makeup,
-            days_excl_makeup_weekend=days_excl_makeup_weekend
+            days_excl_makeup_weekend=days_excl_makeup_weekend,
+            makeup_days=sorted(workday_set)
         ))
 
     # 排序
     result.sort(key=lambda h: h.begin)
+    if not keep_ended:
+        result = drop_ended(result, system_now.date())
     return result
+
+
+def drop_ended(holidays: List[Holiday], today) -> List[Holiday]:
+    """去掉 today 之前已经结束的假期"""
+    return [h for h in holidays if h.end is None or h.end.date() >= today]
@@ -1,47 +1,43 @@
 # holidays/scheduler.py
 from datetime import datetime, timedelta, date
 from typing import List, Tuple
+from .classifier import HOLIDAY, MAKEUP, get_classifier
+from .clock import Clock, get_clock
 from .parser import Holiday
-import re
-import pytz
+from .timezones import get_zone
 
-def time_until(dt: datetime, now: datetime = None, tz_str="Asia/Shanghai") -> timedelta:
-    tz = pytz.timezone(tz_str)
+def time_until(dt: datetime, now: datetime = None, tz_str="Asia/Shanghai", clock: Clock = None) -> timedelta:
+    tz = get_zone(tz_str)
 
     # 若目标时间没有时区，则补全
     if dt.tzinfo is None:
-        dt = tz.localize(dt)
+        dt = dt.replace(tzinfo=tz)
 
     # 当前时间
     if now is None:
-        now = datetime.now(tz)
+        now = get_clock(clock).now(tz)
     elif now.tzinfo is None:
-        now = tz.localize(now)
+        now = now.replace(tzinfo=tz)
 
     return dt - now
 
 def is_makeup_event(holiday: Holiday) -> bool:
     """
     判断事件是否为“调休/补班/上班”事件的 heuristic。
-    ICS 的描述/标题里常含“调休/补班/上班/补班”字样。
+    只看标题（SUMMARY）：放假事件的描述里同样写着“放假调休…上班”，不能作为依据。
     """
-    keywords = ["调休", "补班", "补上班", "上班调休", "上班日"]
-    txt = (holiday.name + " " + holiday.raw_description).lower()
-    for kw in keywords:
-        if kw in txt:
-            return True
-    return False
+    return get_classifier().is_makeup(holiday.name)
 
 def is_holiday_event(holiday: Holiday) -> bool:
     """
     判断事件是否是节假日（放假）事件。
-    标题/描述包含“放假/节日/假期”等关键字。
+    标题包含“放假/节日/假期”等关键字。
     """
-    keywords = ["放假", "假期", "节日", "休息", "holiday", "festival"]
-    txt = (holiday.name + " " + holiday.raw_description).lower()
-    for kw in keywords:
-        if kw in txt:
-            return True
+    kind = get_classifier().classify(holiday.name)
+    if kind == MAKEUP:
+        return False
+    if kind == HOLIDAY:
+        return True
     # 如果既不是明显调休也不是明显放假，则依赖时间长度（全天/多天）判断
     # e.g. 连续多天的事件通常是放假
     duration_days = (holiday.end.date() - holiday.begin.date()).days + 1
@@ -62,7 +58,7 @@ def compute_smart_holiday_days(holidays: List[Holiday]) -> Tuple[int, int, int]:
     days_excl_makeup = 0
     days_excl_makeup_weekend = 0
     for h in holidays:
-        total_days += (h.end - h.begin).days + 1
+        total_days += h.duration
         days_excl_makeup += h.days_excl_makeup
         days_excl_makeup_weekend += h.days_excl_makeup_weekend
 
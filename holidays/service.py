@@ -0,0 +1,215 @@
+# holidays/service.py
+"""
+假期查询门面：持有当前数据版本，把 parse_ics / merge_and_filter_holidays /
+统计 / 倒计时串起来，查询结果按数据版本缓存在有界 LRU 中。
+
+命令行：
+    python -m holidays.service holiday_data.ics [--month 2026-10]
+"""
+import argparse
+import calendar
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Callable, Hashable, List, NamedTuple, Optional, Tuple
+
+from .clock import Clock, get_clock
+from .parser import Holiday, parse_ics
+from .processor import merge_and_filter_holidays
+from .scheduler import time_until
+from .snapshot import source_digest
+from .stats import HolidayStats
+from .timezones import DEFAULT_TZ, get_zone
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _DataState:
+    """一个数据版本的全部只读索引；刷新时整体替换"""
+
+    def __init__(self, version: str, holidays: List[Holiday]):
+        self.version = version
+        self.holidays: Tuple[Holiday, ...] = tuple(
+            sorted((h for h in holidays if not h.flag_None and h.begin is not None), key=lambda h: h.begin)
+        )
+        # 结束时刻单独排序：来自 extra_ics_paths 的假期可能互相重叠，按开始排序时结束时刻并不单调
+        self.end_order: List[int] = sorted(range(len(self.holidays)), key=lambda i: self.holidays[i].end)
+        self.ends: List[datetime] = [self.holidays[i].end for i in self.end_order]
+        self.stats = HolidayStats(list(self.holidays))
+
+
+# ===========================
+#  查询门面
+# ===========================
+class HolidayService:
+    """
+    - load_ics / set_holidays 先在旁边建好新版本的索引，再一次性替换 _state 并清空缓存
+    - 缓存键带数据版本：刷新前开始的查询即使在刷新后才写回缓存，也不会被新版本命中
+    - 与当前时刻有关的查询（upcoming / next_holiday / countdowns）只缓存“已结束几个假期”，
+      定位用二分，剩余时间每次现算
+    """
+
+    def __init__(self, tz_str: str = DEFAULT_TZ, clock: Clock = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.tz_str = tz_str
+        self.clock = get_clock(clock)
+        self.cache_size = cache_size
+        self._state = _DataState("empty", [])
+        self._cache: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local_versions = 0
+        self._hits = 0
+        self._misses = 0
+
+    # ===========================
+    #  数据版本
+    # ===========================
+    @property
+    def version(self) -> str:
+        return self._state.version
+
+    def load_ics(self, ics_text: str) -> str:
+        """解析 + 合并 ICS 并切换到新版本，返回版本号（ICS 的 sha256）；今年已结束的假期也保留"""
+        holidays = merge_and_filter_holidays(parse_ics(ics_text, self.tz_str, clock=self.clock),
+                                             self.tz_str, clock=self.clock, keep_ended=True)
+        return self.set_holidays(holidays, version=source_digest(ics_text))
+
+    def set_holidays(self, holidays: List[Holiday], version: Optional[str] = None) -> str:
+        """安装已合并好的假期（如来自快照）；未给版本号时生成一个本地递增版本"""
+        if version is None:
+            with self._lock:
+                self._local_versions += 1
+                version = f"local-{self._local_versions}"
+        state = _DataState(version, holidays)
+        with self._lock:
+            self._state = state
+            self._cache.clear()
+        return version
+
+    def holidays(self) -> List[Holiday]:
+        return list(self._state.holidays)
+
+    # ===========================
+    #  有界 LRU
+    # ===========================
+    def _memo(self, state: _DataState, key: tuple, compute: Callable[[], object]):
+        key = (state.version,) + key
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+            self._misses += 1
+        value = compute()
+        with self._lock:
+            # 计算期间数据已刷新：结果照常返回，但不写入新版本的缓存
+            if state is self._state:
+                self._cache[key] = value
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.cache_size, len(self._cache))
+
+    # ===========================
+    #  查询
+    # ===========================
+    def _now(self, now: Optional[datetime]) -> datetime:
+        zone = get_zone(self.tz_str)
+        if now is None:
+            return self.clock.now(zone)
+        return now if now.tzinfo is not None else now.replace(tzinfo=zone)
+
+    def _upcoming(self, state: _DataState, now: datetime) -> Tuple[Holiday, ...]:
+        """尚未结束（进行中或未开始）的假期，按开始时间排序"""
+        ended = bisect_left(state.ends, now)
+
+        def compute():
+            skip = set(state.end_order[:ended])
+            return tuple(h for i, h in enumerate(state.holidays) if i not in skip)
+
+        return self._memo(state, ("upcoming", ended), compute)
+
+    def upcoming(self, now: Optional[datetime] = None) -> List[Holiday]:
+        return list(self._upcoming(self._state, self._now(now)))
+
+    def next_holiday(self, now: Optional[datetime] = None) -> Optional[Holiday]:
+        """进行中或下一个假期；没有返回 None"""
+        upcoming = self._upcoming(self._state, self._now(now))
+        return upcoming[0] if upcoming else None
+
+    def countdowns(self, now: Optional[datetime] = None) -> List[Tuple[Holiday, timedelta]]:
+        """[(假期, 距开始的剩余时间)]，进行中的假期剩余时间为负"""
+        now = self._now(now)
+        return [(h, time_until(h.begin, now, self.tz_str)) for h in self._upcoming(self._state, now)]
+
+    def holidays_between(self, start: date, end: date) -> List[Holiday]:
+        """与闭区间 [start, end] 有交集的假期"""
+        state = self._state
+        return list(self._memo(state, ("between", start, end), lambda: tuple(
+            h for h in state.holidays if h.begin.date() <= end and h.end.date() >= start
+        )))
+
+    def holidays_in_month(self, year: int, month: int) -> List[Holiday]:
+        return self.holidays_between(date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1]))
+
+    def stats(self, year: Optional[int] = None, quarter: Optional[int] = None,
+              month: Optional[int] = None) -> Tuple[int, int, int]:
+        """(总天数, 排除调休, 排除调休和双休)；不给年份即全部数据"""
+        state = self._state
+
+        def compute():
+            if year is None:
+                return state.stats.total()
+            if month is not None:
+                return state.stats.month(year, month)
+            if quarter is not None:
+                return state.stats.quarter(year, quarter)
+            return state.stats.year(year)
+
+        return self._memo(state, ("stats", year, quarter, month), compute)
+
+    def years(self) -> List[int]:
+        state = self._state
+        return list(self._memo(state, ("years",), lambda: tuple(state.stats.years())))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="查询假期数据")
+    parser.add_argument("ics", help="ICS 文件")
+    parser.add_argument("--month", help="列出某月的假期（YYYY-MM）")
+    parser.add_argument("--tz", default=DEFAULT_TZ)
+    args = parser.parse_args(argv)
+
+    with open(args.ics, "r", encoding="utf-8") as f:
+        ics_text = f.read()
+    service = HolidayService(args.tz)
+    version = service.load_ics(ics_text)
+    print(f"[service] 数据版本 {version[:12]}，共 {len(service.holidays())} 个假期")
+
+    upcoming = service.countdowns()
+    if upcoming:
+        h, remaining = upcoming[0]
+        print(f"下一个假期：{h.name} {h.begin:%Y-%m-%d}（{h.duration} 天），还有 {max(remaining.days, 0)} 天")
+    total, excl_makeup, excl_makeup_weekend = service.stats()
+    print(f"总天数: {total}  排除调休: {excl_makeup}  排除调休和双休: {excl_makeup_weekend}")
+
+    if args.month:
+        year, month = map(int, args.month.split("-"))
+        for h in service.holidays_in_month(year, month):
+            print(f"  {h.name} {h.begin:%m-%d} ~ {h.end:%m-%d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
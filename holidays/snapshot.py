@@ -0,0 +1,135 @@
+# holidays/snapshot.py
+"""
+预编译假期快照：把 ICS 解析 + 合并的结果存成紧凑 JSON，
+打包时随 exe 一起分发，启动时若远端 ICS 未变化即可跳过解析。
+
+构建：
+    python -m holidays.snapshot holiday_data.ics holiday_snapshot.json
+"""
+import hashlib
+import json
+import os
+import sys
+from datetime import date, datetime
+from typing import List, Optional
+
+from .classifier import get_classifier
+from .clock import Clock, get_clock
+from .parser import Holiday, parse_ics
+from .processor import merge_and_filter_holidays
+from .timezones import get_zone
+
+SNAPSHOT_VERSION = 2   # 2：包含今年已结束的假期
+
+
+def source_digest(ics_text: str) -> str:
+    return hashlib.sha256(ics_text.encode("utf-8")).hexdigest()
+
+
+# ===========================
+#  构建 / 保存
+# ===========================
+def build_snapshot(ics_text: str, tz_str: str = "Asia/Shanghai",
+                   holidays: Optional[List[Holiday]] = None, clock: Clock = None) -> dict:
+    """
+    生成快照；已合并好的 holidays 可直接传入以免重复解析。
+    clock: 决定“今年”与 built_at 的时钟，默认使用全局时钟
+    """
+    if holidays is None:
+        holidays = merge_and_filter_holidays(parse_ics(ics_text, tz_str, clock=clock), tz_str,
+                                             clock=clock, keep_ended=True)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "tz": tz_str,
+        "keywords": get_classifier().signature,
+        "source_sha256": source_digest(ics_text),
+        "built_at": get_clock(clock).now(get_zone(tz_str)).isoformat(timespec="seconds"),
+        # [uid, name, begin_ts, end_ts, all_day, description, 总天数, 排除调休, 排除调休和双休, [补班日期]]
+        "holidays": [
+            [h.uid, h.name, h.begin.timestamp(), h.end.timestamp(), bool(h.all_day), str(h.raw_description),
+             h.duration, h.days_excl_makeup, h.days_excl_makeup_weekend,
+             [d.isoformat() for d in h.makeup_days]]
+            for h in holidays
+        ],
+    }
+
+
+def save_snapshot(snapshot: dict, path: str):
+    """原子写入快照文件"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+# ===========================
+#  读取
+# ===========================
+def load_snapshot(path: str) -> Optional[dict]:
+    """读取快照；不存在、损坏或版本不符时返回 None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[snapshot] 读取快照失败: {e}")
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def snapshot_matches(snapshot: Optional[dict], ics_text: str, tz_str: str = "Asia/Shanghai") -> bool:
+    """快照是否由同一份 ICS、同一时区、同一套分类关键字生成"""
+    return (
+        snapshot is not None
+        and snapshot.get("tz") == tz_str
+        and snapshot.get("keywords") == get_classifier().signature
+        and snapshot.get("source_sha256") == source_digest(ics_text)
+    )
+
+
+def snapshot_holidays(snapshot: dict, today: Optional[date] = None, keep_ended: bool = False) -> List[Holiday]:
+    """还原 Holiday 列表，并与 merge_and_filter_holidays 一样去掉已结束的假期（keep_ended=True 时保留）"""
+    zone = get_zone(snapshot.get("tz", "Asia/Shanghai"))
+    if today is None:
+        today = get_clock().now(zone).date()
+
+    result = []
+    for (uid, name, begin_ts, end_ts, all_day, description,
+         duration, excl_makeup, excl_makeup_weekend, makeup_days) in snapshot["holidays"]:
+        end = datetime.fromtimestamp(end_ts, zone)
+        # 与 merge_and_filter_holidays 一致：早于今年的一律不要，keep_ended 只保留今年已结束的
+        if end.year < today.year or (not keep_ended and end.date() < today):
+            continue
+        result.append(Holiday(
+            uid=uid,
+            name=name,
+            begin=datetime.fromtimestamp(begin_ts, zone),
+            end=end,
+            all_day=all_day,
+            raw_description=description,
+            duration=duration,
+            days_excl_makeup=excl_makeup,
+            days_excl_makeup_weekend=excl_makeup_weekend,
+            makeup_days=[date.fromisoformat(d) for d in makeup_days],
+        ))
+    return result
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 2:
+        print("usage: python -m holidays.snapshot <input.ics> <output.json>")
+        return 2
+    src, dst = argv
+    with open(src, "r", encoding="utf-8") as f:
+        ics_text = f.read()
+    snapshot = build_snapshot(ics_text)
+    save_snapshot(snapshot, dst)
+    print(f"[snapshot] {len(snapshot['holidays'])} holidays -> {dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
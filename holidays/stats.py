@@ -0,0 +1,88 @@
+# holidays/stats.py
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from .parser import Holiday
+
+
+# ===========================
+#  统计索引
+# ===========================
+class HolidayStats:
+    """
+    假期统计索引：按日期构建三组前缀和数组，
+    任意日期区间 / 月 / 季度 / 年的统计均为 O(log n)。
+
+    每个假期日贡献 (+1, +1, +1 或 0[周末])；补班日不在自己的日期上扣减，
+    而是从所属假期的前几天里扣掉（排除调休列扣前 m 天，排除双休列扣前 m 个工作日，
+    m 为补班天数），这样任何区间都不会出现负数，
+    并且按假期求和与 merge_and_filter_holidays 生成的
+    duration / days_excl_makeup / days_excl_makeup_weekend 逐行一致。
+    """
+
+    def __init__(self, holidays: List[Holiday]):
+        deltas: Dict[date, List[int]] = {}
+
+        for h in holidays:
+            if h.flag_None or h.begin is None or h.end is None:
+                continue
+            begin_d = h.begin.date()
+            days = [begin_d + timedelta(days=i) for i in range(h.duration or 0)]
+            weekdays = [d for d in days if d.weekday() < 5]
+            makeups = len(h.makeup_days or ())
+            for d in days:
+                deltas.setdefault(d, [0, 0, 0])[0] += 1
+            for d in days[makeups:]:
+                deltas[d][1] += 1
+            for d in weekdays[makeups:]:
+                deltas[d][2] += 1
+
+        self._days: List[date] = sorted(deltas)
+        self._cum_total = [0]
+        self._cum_excl_makeup = [0]
+        self._cum_excl_makeup_weekend = [0]
+        for d in self._days:
+            t, m, w = deltas[d]
+            self._cum_total.append(self._cum_total[-1] + t)
+            self._cum_excl_makeup.append(self._cum_excl_makeup[-1] + m)
+            self._cum_excl_makeup_weekend.append(self._cum_excl_makeup_weekend[-1] + w)
+
+    def between(self, start: date, end: date) -> Tuple[int, int, int]:
+        """闭区间 [start, end] 内的 (总天数, 排除调休, 排除调休和双休)"""
+        lo = bisect_left(self._days, start)
+        hi = bisect_right(self._days, end)
+        if hi <= lo:
+            return 0, 0, 0
+        return (
+            self._cum_total[hi] - self._cum_total[lo],
+            self._cum_excl_makeup[hi] - self._cum_excl_makeup[lo],
+            self._cum_excl_makeup_weekend[hi] - self._cum_excl_makeup_weekend[lo],
+        )
+
+    def total(self) -> Tuple[int, int, int]:
+        return (
+            self._cum_total[-1],
+            self._cum_excl_makeup[-1],
+            self._cum_excl_makeup_weekend[-1],
+        )
+
+    def year(self, year: int) -> Tuple[int, int, int]:
+        return self.between(date(year, 1, 1), date(year, 12, 31))
+
+    def quarter(self, year: int, quarter: int) -> Tuple[int, int, int]:
+        first_month = (quarter - 1) * 3 + 1
+        return self.between(date(year, first_month, 1), _month_end(year, first_month + 2))
+
+    def month(self, year: int, month: int) -> Tuple[int, int, int]:
+        return self.between(date(year, month, 1), _month_end(year, month))
+
+    def years(self) -> List[int]:
+        """索引覆盖的年份（升序）"""
+        return sorted({d.year for d in self._days})
+
+
+def _month_end(year: int, month: int) -> date:
+    if month == 12:
+        return date(year, 12, 31)
+    return date(year, month + 1, 1) - timedelta(days=1)
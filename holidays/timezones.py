@@ -0,0 +1,154 @@
+# holidays/timezones.py
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_TZ = "Asia/Shanghai"
+
+
+# ===========================
+#  时区对象缓存
+# ===========================
+@lru_cache(maxsize=None)
+def get_zone(tz_str: str = DEFAULT_TZ) -> ZoneInfo:
+    """按名称缓存 ZoneInfo 对象，整个进程内每个时区只构造一次"""
+    return ZoneInfo(tz_str)
+
+
+def valid_zones(zones: Sequence[str]) -> List[str]:
+    """过滤掉空的 / 无法识别的时区名（打印提示，不抛异常）"""
+    result = []
+    for z in zones:
+        if not z:
+            continue
+        try:
+            get_zone(z)
+        except (ZoneInfoNotFoundError, ValueError, TypeError) as e:
+            print(f"[timezones] 忽略无效时区 {z!r}: {e}")
+            continue
+        result.append(z)
+    return result
+
+
+def localize(dt: Optional[datetime], tz_str: str = DEFAULT_TZ) -> Optional[datetime]:
+    """无时区的 datetime 视为该时区的墙上时间；有时区的换算到该时区"""
+    if dt is None:
+        return None
+    zone = get_zone(tz_str)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=zone)
+    return dt.astimezone(zone)
+
+
+# ===========================
+#  UTC 偏移预计算
+# ===========================
+class ZoneOffsetTable:
+    """
+    某时区在一段日期范围内的 UTC 偏移表。
+    以“偏移不变的区间”存储（中国全年只有一段，有夏令时的时区每年两次切换），
+    之后的换算只需一次二分查找，不再走 tzinfo 的规则计算。
+    """
+
+    def __init__(self, tz_str: str, start: date, end: date):
+        self.tz_str = tz_str
+        zone = get_zone(tz_str)
+        self._starts: List[float] = []          # 每段起点的 UTC 时间戳
+        self._offsets: List[timedelta] = []
+
+        day = start - timedelta(days=1)
+        last_day = end + timedelta(days=1)
+        prev_ts = datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+        prev_offset = _offset_at(zone, prev_ts)
+        self._starts.append(float("-inf"))
+        self._offsets.append(prev_offset)
+
+        while day < last_day:
+            day += timedelta(days=1)
+            ts = datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+            offset = _offset_at(zone, ts)
+            if offset != prev_offset:
+                # 当天发生切换：按秒二分定位切换时刻
+                lo, hi = prev_ts, ts
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if _offset_at(zone, mid) == prev_offset:
+                        lo = mid
+                    else:
+                        hi = mid
+                self._starts.append(hi)
+                self._offsets.append(offset)
+                prev_offset = offset
+            prev_ts = ts
+
+    def offset_at(self, dt: datetime) -> timedelta:
+        return self._offsets[bisect_right(self._starts, dt.timestamp()) - 1]
+
+    def to_local(self, dt: datetime) -> datetime:
+        """把带时区的时刻换算成该时区的墙上时间（固定偏移 tzinfo）"""
+        offset = self.offset_at(dt)
+        return dt.astimezone(timezone(offset))
+
+
+def _offset_at(zone: ZoneInfo, ts: float) -> timedelta:
+    return datetime.fromtimestamp(ts, zone).utcoffset()
+
+
+# ===========================
+#  多时区倒计时
+# ===========================
+class MultiZoneCountdown:
+    """
+    同一目标时刻在多个时区的展示。
+    目标切换时为每个时区算好一次墙上时间；每秒刷新只做一次减法，
+    与展示的时区数量无关。
+    """
+
+    def __init__(self, zones: Sequence[str], home_tz: str = DEFAULT_TZ):
+        # 配置里写错一个时区名不应影响数据加载：构造时就剔除
+        self.zones = valid_zones(zones)
+        self.home_tz = home_tz
+        self.target: Optional[datetime] = None
+        self.local_times: List[Tuple[str, datetime]] = []
+        self._tables: Dict[str, ZoneOffsetTable] = {}
+
+    def prepare(self, begins: Sequence[datetime]):
+        """按数据覆盖的日期范围预计算每个时区的偏移表（数据变化时调用）"""
+        if not begins:
+            self._tables = {}
+            return
+        first = min(b.date() for b in begins)
+        last = max(b.date() for b in begins)
+        self._tables = {z: ZoneOffsetTable(z, first, last) for z in self.zones}
+
+    def set_target(self, target: Optional[datetime]):
+        if target is not None and target.tzinfo is None:
+            target = localize(target, self.home_tz)
+        if target == self.target:
+            return
+        self.target = target
+        self.local_times = []
+        if target is None:
+            return
+        for z in self.zones:
+            table = self._tables.get(z)
+            if table is None:
+                local = target.astimezone(get_zone(z))
+            else:
+                local = table.to_local(target)
+            self.local_times.append((z, local))
+
+    def remaining(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """
+        now 应带时区（如 clock.now(timezone.utc)）；无时区时视为 home_tz 的墙上时间，
+        本机不在 home_tz 时调用方不能直接传 datetime.now()。
+        """
+        if self.target is None:
+            return None
+        if now is None:
+            now = datetime.now(timezone.utc)
+        elif now.tzinfo is None:
+            now = localize(now, self.home_tz)
+        return self.target - now
@@ -1,13 +1,22 @@
 # main.py
 import sys
+from multiprocessing import freeze_support
 from PyQt6 import QtWidgets
-from ui.main_window import MainWindow
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
+    if "--tray" in sys.argv:
+        # 仅托盘模式（开机自启）：主窗口延迟到第一次显示时再构建
+        from ui.tray_launcher import TrayLauncher
+        app.setQuitOnLastWindowClosed(False)
+        launcher = TrayLauncher()
+    else:
+        from ui.main_window import MainWindow
+        window = MainWindow()
+        window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # 打包后的 exe 中进程池子进程需要
+    freeze_support()
     main()
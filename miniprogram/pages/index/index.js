@@ -21,6 +21,7 @@ const WELCOME_MSGS = [
 ];
 
 const HOLIDAY_CACHE_KEY = 'holiday_parsed_cache'; // 存预解析 JSON，而非原始 ICS
+const BUNDLED_HOLIDAYS = 'assets/holidays.json';   // python -m holidays.export 预编译的内置数据
 const CONFIG_KEY = 'app_config';
 const DEFAULT_ICS_URL = 'https://www.shuyz.com/githubfiles/china-holiday-calender/master/holidayCal.ics';
 
@@ -60,7 +61,8 @@ Page({
 
     // 分批执行，不给主线程连续 >5s 的任务
     setTimeout(() => {
-      this.loadCachedHolidays();
+      // 首次启动没有缓存时先显示内置数据，联网成功后再覆盖
+      if (!this.loadCachedHolidays()) this.loadBundledHolidays();
       setTimeout(() => {
         this.fetchIcs(false);
         setTimeout(() => this.startCountdownTimer(), 50);
@@ -103,32 +105,72 @@ Page({
   // ========================================
   loadCachedHolidays() {
     const cached = loadConfig(HOLIDAY_CACHE_KEY, '');
-    if (!cached) return;
+    if (!cached) return false;
     try {
       const data = JSON.parse(cached);
-      if (!data || !data.holidays || data.holidays.length === 0) return;
-
-      const now = new Date();
-      const countdownTexts = data.holidays.map(h => {
-        const cd = timeUntil(new Date(h.beginTs), now);
-        return formatCountdown(cd);
-      });
-      const midText = formatHourCountdown(timeUntil(getTodayTime(this.data.offworkMidTime), now));
-      const nightText = formatHourCountdown(timeUntil(getTodayTime(this.data.offworkTime), now));
-
-      this.setData({
-        holidays: data.holidays,
-        countdownTexts: countdownTexts,
-        stats: data.stats,
-        midCountdown: midText,
-        nightCountdown: nightText,
-        loading: false
-      });
+      if (!data || !data.holidays || data.holidays.length === 0) return false;
+      this.applyHolidays(data.holidays, data.stats);
+      return true;
     } catch (e) {
       console.error('缓存数据异常', e);
+      return false;
     }
   },
 
+  /**
+   * 读取内置的预编译 JSON（schema 见 holidays/export.py），只保留未结束的假期，
+   * 字段与缓存格式兼容，无需解析 ICS
+   */
+  loadBundledHolidays(onFail) {
+    const fs = wx.getFileSystemManager();
+    fs.readFile({
+      filePath: BUNDLED_HOLIDAYS,
+      encoding: 'utf-8',
+      success: (res) => {
+        try {
+          const now = new Date();
+          const pad = (n) => (n < 10 ? '0' : '') + n;
+          const today = now.getFullYear() + '-' + pad(now.getMonth() + 1) + '-' + pad(now.getDate());
+          const holidays = JSON.parse(res.data).holidays.filter(h => h.end >= today);
+          if (holidays.length === 0) { if (onFail) onFail(); return; }
+          // 产物里的 stats 覆盖全部记录，过滤后重新累加
+          const stats = { totalDays: 0, daysExclMakeup: 0, daysExclMakeupWeekend: 0 };
+          holidays.forEach(h => {
+            stats.totalDays += h.duration;
+            stats.daysExclMakeup += h.daysExclMakeup;
+            stats.daysExclMakeupWeekend += h.daysExclMakeupWeekend;
+          });
+          saveConfig(HOLIDAY_CACHE_KEY, JSON.stringify({ holidays: holidays, stats: stats }));
+          this.applyHolidays(holidays, stats);
+          this.showToast('已加载内置假期数据');
+        } catch (e) {
+          console.error('内置数据异常', e);
+          if (onFail) onFail();
+        }
+      },
+      fail: () => { if (onFail) onFail(); }
+    });
+  },
+
+  /**
+   * 渲染假期列表与倒计时（缓存、内置数据、联网解析共用）
+   */
+  applyHolidays(holidays, stats) {
+    const now = new Date();
+    const countdownTexts = holidays.map(h => formatCountdown(timeUntil(new Date(h.beginTs), now)));
+    const midText = formatHourCountdown(timeUntil(getTodayTime(this.data.offworkMidTime), now));
+    const nightText = formatHourCountdown(timeUntil(getTodayTime(this.data.offworkTime), now));
+
+    this.setData({
+      holidays: holidays,
+      countdownTexts: countdownTexts,
+      stats: stats,
+      midCountdown: midText,
+      nightCountdown: nightText,
+      loading: false
+    });
+  },
+
   /**
    * 解析 ICS → holiday JSON → 缓存 + 渲染（用 nextTick 拆分为两步，避免阻塞）
    */
@@ -161,18 +203,7 @@ Page({
         // 用 nextTick 拆分 setData，避免渲染卡死
         wx.nextTick(() => {
           if (this._destroyed) { wx.hideLoading(); return; }
-          const now = new Date();
-          const countdownTexts = displayHolidays.map(h => formatCountdown(timeUntil(new Date(h.beginTs), now)));
-          const midText = formatHourCountdown(timeUntil(getTodayTime(this.data.offworkMidTime), now));
-          const nightText = formatHourCountdown(timeUntil(getTodayTime(this.data.offworkTime), now));
-
-          this.setData({
-            holidays: displayHolidays,
-            countdownTexts: countdownTexts,
-            stats: stats,
-            midCountdown: midText,
-            nightCountdown: nightText
-          });
+          this.applyHolidays(displayHolidays, stats);
           wx.hideLoading();
         });
       } catch (e) {
@@ -207,19 +238,10 @@ Page({
         }
       },
       fail: () => {
-        // 网络失败时尝试用内置文件回退
+        // 网络失败时尝试用内置数据回退
         if (!loadConfig(HOLIDAY_CACHE_KEY, '')) {
-          const fs = wx.getFileSystemManager();
-          fs.readFile({
-            filePath: 'assets/holidayCal.ics',
-            encoding: 'utf-8',
-            success: (res) => {
-              this.processIcsData(res.data);
-              this.showToast('已加载内置假期数据');
-            },
-            fail: () => {
-              this.setData({ errorMsg: '无法获取假期数据，请检查网络' });
-            }
+          this.loadBundledHolidays(() => {
+            this.setData({ errorMsg: '无法获取假期数据，请检查网络' });
           });
         } else if (isManualRefresh) {
           this.showToast('网络失败，已用缓存');
@@ -0,0 +1,35 @@
+# tests/conftest.py
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from holidays.clock import FixedClock
+from holidays.parser import parse_ics
+from holidays.processor import merge_and_filter_holidays
+
+# 测试统一的“现在”：2026 年的元旦、春节已结束，下一个假期是清明节
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+@pytest.fixture(scope="session")
+def bundled_ics() -> str:
+    """仓库自带的 holiday_data.ics"""
+    with open(os.path.join(ROOT, "holiday_data.ics"), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def clock() -> FixedClock:
+    return FixedClock(NOW)
+
+
+@pytest.fixture(scope="session")
+def merged(bundled_ics, clock):
+    """合并后的打包数据，保留今年已结束的假期（不要在测试里修改）"""
+    return merge_and_filter_holidays(parse_ics(bundled_ics, clock=clock), clock=clock, keep_ended=True)
@@ -0,0 +1,26 @@
+# tests/test_autostart.py
+import os
+import platform
+
+import pytest
+
+from utils import autostart
+
+pytestmark = pytest.mark.skipif(platform.system() != "Linux", reason="启动项路径按 Linux 断言")
+
+
+def test_launch_command():
+    assert autostart.launch_command("C:/app/Holiday.exe") == '"C:/app/Holiday.exe" --tray'
+    assert autostart.launch_command("/src/main.py", tray_only=False, python="py") == 'py "/src/main.py"'
+
+
+def test_enable_disable_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert not autostart.is_autostart_enabled("Demo")
+    assert autostart.enable_autostart("Demo", autostart.app_entry())
+    assert autostart.is_autostart_enabled("Demo")
+    with open(os.path.join(tmp_path, ".config", "autostart", "Demo.desktop"), encoding="utf-8") as f:
+        assert "main.py\" --tray" in f.read()
+    assert autostart.disable_autostart("Demo")
+    assert not autostart.is_autostart_enabled("Demo")
+    assert autostart.disable_autostart("Demo")
@@ -0,0 +1,84 @@
+# tests/test_cache_store.py
+import os
+from datetime import datetime
+
+from holidays.cache_store import IcsCacheStore
+from holidays.clock import FixedClock
+
+V1 = "BEGIN:VCALENDAR\nBEGIN:VEVENT\nUID:1\nEND:VEVENT\nEND:VCALENDAR\n"
+V2 = V1.replace("UID:1", "UID:2")
+V3 = V1.replace("UID:1", "UID:3")
+
+
+def test_put_dedupes_and_activates_newest(tmp_path):
+    store = IcsCacheStore(str(tmp_path))
+    a = store.put(V1)
+    b = store.put(V2)
+    assert store.active == b and not store.pinned
+    assert store.put(V1) == a
+    assert [v["sha256"] for v in store.versions()] == [a, b]
+    assert store.active_text() == V1
+
+
+def test_pinned_version_survives_new_fetches(tmp_path):
+    store = IcsCacheStore(str(tmp_path))
+    a = store.put(V1)
+    store.put(V2)
+    assert store.activate(a) and store.pinned
+    c = store.put(V3)
+    assert store.active == a and store.pinned_text() == V1
+    assert store.versions()[0]["sha256"] == c
+    # 切回最新版本即解除固定
+    assert store.activate(c) and not store.pinned
+
+
+def test_refetching_pinned_version_clears_pin(tmp_path):
+    store = IcsCacheStore(str(tmp_path))
+    a = store.put(V1)
+    b = store.put(V2)
+    store.activate(a)
+    assert store.put(V1) == a
+    assert store.versions()[0]["sha256"] == a
+    assert store.active == a and not store.pinned
+    assert store.pinned_text() is None
+    # 之后的新版本照常激活
+    store.put(V3)
+    assert store.active != a and store.active != b
+
+
+def test_index_persists(tmp_path):
+    store = IcsCacheStore(str(tmp_path))
+    a = store.put(V1)
+    store.put(V2)
+    store.activate(a)
+    reopened = IcsCacheStore(str(tmp_path))
+    assert reopened.active == a and reopened.pinned
+    assert reopened.get_text(a) == V1
+
+
+def test_snapshot_attach_and_evict(tmp_path):
+    store = IcsCacheStore(str(tmp_path), max_versions=2)
+    a = store.put(V1)
+    store.attach_snapshot(a, {"version": 2, "holidays": []})
+    assert store.get_snapshot(a) == {"version": 2, "holidays": []}
+    store.put(V2)
+    store.put(V3)
+    assert store.get_text(a) is None and store.get_snapshot(a) is None
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["index.json"] + [v["sha256"] + ".ics.gz" for v in store.versions()])
+
+
+def test_active_version_is_never_evicted(tmp_path):
+    store = IcsCacheStore(str(tmp_path), max_versions=1)
+    a = store.put(V1)
+    store.index["pinned"] = True
+    b = store.put(V2)
+    assert store.active == a and store.get_text(a) == V1
+    assert [v["sha256"] for v in store.versions()] == [a]
+    assert store.get_text(b) is None
+
+
+def test_fetched_at_uses_injected_clock(tmp_path):
+    store = IcsCacheStore(str(tmp_path), clock=FixedClock(datetime(2023, 1, 1, 8, 0)))
+    store.put(V1)
+    assert store.versions()[0]["fetched_at"] == "2023-01-01T08:00:00+08:00"
@@ -0,0 +1,60 @@
+# tests/test_classifier.py
+import pytest
+
+from holidays import classifier
+from holidays.classifier import HOLIDAY, MAKEUP, OTHER, KeywordClassifier, configure_classifier, get_classifier
+
+
+@pytest.fixture
+def restore_classifier():
+    old = classifier._classifier
+    yield
+    classifier._classifier = old
+
+
+def test_classify_defaults():
+    c = KeywordClassifier()
+    assert c.classify("劳动节 补班") == MAKEUP
+    assert c.classify("国庆节 调休") == MAKEUP
+    assert c.classify("春节 放假") == HOLIDAY
+    assert c.classify("Spring Festival") == HOLIDAY
+    assert c.classify("劳动节") == OTHER
+    assert c.classify("") == OTHER and c.classify(None) == OTHER
+
+
+def test_makeup_wins_over_holiday():
+    c = KeywordClassifier()
+    assert c.classify("假期 补班") == MAKEUP
+    assert c.is_makeup("假期 补班") and not c.is_holiday("假期 补班")
+
+
+def test_strip_makeup_prefers_longest_keyword():
+    c = KeywordClassifier()
+    assert c.strip_makeup("劳动节 补班") == "劳动节"
+    # "补上班" 整词去除，不会只去掉 "上班" 留下 "补"
+    assert c.strip_makeup("劳动节 补上班") == "劳动节"
+    assert KeywordClassifier(makeup_keywords=()).strip_makeup(" 劳动节 ") == "劳动节"
+
+
+def test_signature_ignores_order_and_duplicates():
+    a = KeywordClassifier(["补班", "调休"], ["放假"])
+    b = KeywordClassifier(["调休", "补班", "补班"], ["放假"])
+    assert a.signature == b.signature
+    assert a.signature != KeywordClassifier(["补班"], ["放假"]).signature
+
+
+def test_configure_classifier(restore_classifier):
+    c = configure_classifier(["值班"], None)
+    assert get_classifier() is c
+    assert c.is_makeup("春节 值班")
+    assert not c.is_makeup("春节 补班")
+    assert c.is_holiday("春节 放假")
+
+
+def test_configure_classifier_empty_list_disables_category(restore_classifier):
+    c = configure_classifier([], None)
+    assert not c.is_makeup("劳动节 补班")
+    assert c.classify("劳动节 补班") == OTHER
+    assert c.is_holiday("春节 放假")
+    assert c.signature != KeywordClassifier().signature
+    assert configure_classifier(None, None).signature == KeywordClassifier().signature
@@ -0,0 +1,64 @@
+# tests/test_clock.py
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from holidays.clock import Clock, FixedClock, SystemClock, VirtualClock, get_clock, set_clock
+from holidays.timezones import get_zone
+
+SHANGHAI = get_zone("Asia/Shanghai")
+
+
+def test_clock_is_abstract():
+    with pytest.raises(TypeError):
+        Clock()
+
+
+@pytest.mark.parametrize("clock", [SystemClock(), FixedClock(datetime(2026, 3, 1, 12, 0))])
+def test_all_clocks_return_aware_reference_time(clock):
+    now = clock.now()
+    assert now.tzinfo is not None
+    assert now.utcoffset() == timedelta(hours=8)
+    assert clock.now(timezone.utc).utcoffset() == timedelta(0)
+    assert clock.today() == now.date()
+
+
+def test_fixed_clock_naive_instant_is_reference_wall_time():
+    clock = FixedClock(datetime(2026, 3, 1, 12, 0))
+    assert clock.now() == datetime(2026, 3, 1, 12, 0, tzinfo=SHANGHAI)
+    assert clock.now(timezone.utc).hour == 4
+    assert FixedClock(datetime(2026, 3, 1, 4, 0, tzinfo=timezone.utc)).now() == clock.now()
+
+
+def test_fixed_clock_other_reference_zone():
+    clock = FixedClock(datetime(2026, 7, 1, 9, 0), local_tz="Europe/London")
+    assert clock.now().hour == 9
+    assert clock.now(SHANGHAI).hour == 16
+
+
+def test_virtual_clock_advance_and_set():
+    clock = VirtualClock(datetime(2026, 12, 31, 23, 0))
+    clock.advance(timedelta(hours=2))
+    assert clock.today().isoformat() == "2027-01-01"
+    clock.set(datetime(2026, 5, 1, 0, 0))
+    assert clock.now() == datetime(2026, 5, 1, tzinfo=SHANGHAI)
+
+
+def test_fixed_clock_pickles():
+    clock = FixedClock(datetime(2026, 3, 1, 12, 0))
+    assert pickle.loads(pickle.dumps(clock)).now() == clock.now()
+
+
+def test_set_clock_restores():
+    fixed = FixedClock(datetime(2026, 3, 1, 12, 0))
+    old = set_clock(fixed)
+    try:
+        assert get_clock() is fixed
+        other = SystemClock()
+        assert get_clock(other) is other
+    finally:
+        set_clock(old)
+    assert set_clock(None) is old
+    assert isinstance(get_clock(), SystemClock)
+    set_clock(old)
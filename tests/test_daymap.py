@@ -0,0 +1,42 @@
+# tests/test_daymap.py
+from datetime import date
+
+from holidays.daymap import HOLIDAY, MAKEUP, WEEKEND, WORKDAY, build_day_map, holiday_day_sets, year_day_types
+from holidays.parser import Holiday
+
+
+def _type(day_map, d: date) -> int:
+    return day_map[d.year][d.timetuple().tm_yday - 1]
+
+
+def test_year_day_types_plain_year():
+    types = year_day_types(2026, set(), set())
+    assert len(types) == 365 and len(year_day_types(2024, set(), set())) == 366
+    assert types[0] == WORKDAY                 # 2026-01-01 周四
+    assert types[2] == WEEKEND                 # 2026-01-03 周六
+
+
+def test_makeup_wins_over_holiday():
+    d = date(2026, 5, 9)
+    types = year_day_types(2026, {d, date(2027, 1, 1)}, {d})
+    assert types[d.timetuple().tm_yday - 1] == MAKEUP
+
+
+def test_day_sets_skip_placeholder():
+    holiday_days, makeup_days = holiday_day_sets([Holiday(True)])
+    assert holiday_days == set() and makeup_days == set()
+
+
+def test_build_day_map_from_bundled_data(merged):
+    day_map = build_day_map(merged)
+    assert list(day_map) == [2026]
+    assert _type(day_map, date(2026, 10, 1)) == HOLIDAY
+    assert _type(day_map, date(2026, 10, 3)) == HOLIDAY      # 周六，假期内
+    assert _type(day_map, date(2026, 9, 20)) == MAKEUP       # 周日补班
+    assert _type(day_map, date(2026, 10, 9)) == WORKDAY
+    assert _type(day_map, date(2026, 10, 11)) == WEEKEND
+    assert sum(t == HOLIDAY for t in day_map[2026]) == sum(h.duration for h in merged)
+
+
+def test_build_day_map_empty():
+    assert build_day_map([]) == {}
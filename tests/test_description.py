@@ -0,0 +1,70 @@
+# tests/test_description.py
+import pickle
+
+from holidays.description import LazyDescription, as_description, extract_descriptions, unescape_text
+
+ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:a
+DESCRIPTION:元旦：1月1日放假\\, 共1天。\\n放假通知: https://www.gov.cn/x.htm
+SUMMARY:元旦
+END:VEVENT
+BEGIN:VEVENT
+UID:b
+DESCRIPTION:元旦：1月1日放假\\, 共1天。\\n放假通知: https://www.gov.cn/x.htm
+SUMMARY:元旦
+END:VEVENT
+BEGIN:VEVENT
+UID:c
+DESCRIPTION;LANGUAGE=zh-CN:第一行
+  折行
+SUMMARY:其它
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_unescape_text():
+    assert unescape_text("a\\,b\\;c\\nd\\\\e") == "a,b;c\nd\\e"
+    assert unescape_text("ab\r\n c") == "abc"
+
+
+def test_extract_strips_and_interns():
+    stripped, by_uid = extract_descriptions(ICS)
+    assert "DESCRIPTION" not in stripped
+    assert "SUMMARY:元旦" in stripped
+    assert set(by_uid) == {"a", "b", "c"}
+    assert by_uid["a"] is by_uid["b"]
+    assert not by_uid["a"].decoded
+    assert by_uid["c"].text == "第一行 折行"
+
+
+def test_lazy_text_and_notice():
+    desc = extract_descriptions(ICS)[1]["a"]
+    assert desc.text == "元旦：1月1日放假, 共1天。\n放假通知: https://www.gov.cn/x.htm"
+    assert desc.notice_url == "https://www.gov.cn/x.htm"
+    assert desc.date_sentences == ["元旦：1月1日放假, 共1天。"]
+    assert desc == desc.text and "元旦" in desc
+
+
+def test_duplicate_uid_left_to_ics_library():
+    text = ICS.replace("UID:b", "UID:a")
+    stripped, by_uid = extract_descriptions(text)
+    assert "a" not in by_uid
+    assert stripped.count("DESCRIPTION") == 2
+
+
+def test_pickle_keeps_undecoded():
+    desc = LazyDescription("放假\\n通知".encode("utf-8"))
+    clone = pickle.loads(pickle.dumps(desc))
+    assert not clone.decoded
+    assert clone.text == "放假\n通知"
+    assert pickle.loads(pickle.dumps(as_description("已解码"))).text == "已解码"
+
+
+def test_as_description():
+    assert not as_description(None)
+    assert as_description("x") == "x"
+    desc = LazyDescription(b"y")
+    assert as_description(desc) is desc
@@ -0,0 +1,74 @@
+# tests/test_export.py
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+
+from holidays.clock import FixedClock
+from holidays.export import ARTIFACT_SCHEMA, compile_holidays, main, source_timestamp, to_artifact, to_slim_ics
+from holidays.parser import parse_ics
+from holidays.processor import merge_and_filter_holidays
+from holidays.snapshot import source_digest
+
+SINCE = date(2026, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def compiled(bundled_ics):
+    return compile_holidays(bundled_ics, since=SINCE)
+
+
+def test_compile_keeps_holidays_ending_since(compiled):
+    assert compiled and all(h.end.date() >= SINCE for h in compiled)
+    assert [h.name for h in compiled][:2] == ["元旦", "春节"]
+
+
+def test_artifact_records_and_stats(compiled, bundled_ics):
+    artifact = to_artifact(compiled, bundled_ics)
+    assert artifact["schema"] == ARTIFACT_SCHEMA
+    assert artifact["sourceSha256"] == source_digest(bundled_ics)
+    records = artifact["holidays"]
+    assert len(records) == len(compiled)
+    national = next(r for r in records if r["name"] == "国庆节")
+    assert national["start"] == "2026-10-01" and national["end"] == "2026-10-07"
+    assert national["makeupDays"] == ["2026-09-20", "2026-10-10"]
+    assert national["daysExclMakeup"] == 5
+    stats = artifact["stats"]
+    assert stats["totalDays"] == sum(r["duration"] for r in records)
+    assert stats["daysExclMakeup"] == sum(r["daysExclMakeup"] for r in records)
+    assert stats["daysExclMakeupWeekend"] == sum(r["daysExclMakeupWeekend"] for r in records)
+    json.dumps(artifact)
+
+
+def test_timestamps_come_from_source(compiled, bundled_ics):
+    # 打包数据所有事件的 LAST-MODIFIED 相同
+    assert source_timestamp(bundled_ics) == datetime(2025, 11, 4, 23, 59, 4, tzinfo=timezone.utc)
+    assert to_artifact(compiled, bundled_ics)["generatedAt"] == "2025-11-04T23:59:04+00:00"
+    assert "DTSTAMP:20251104T235904Z" in to_slim_ics(compiled, stamp=source_timestamp(bundled_ics))
+    # 没有 LAST-MODIFIED / DTSTAMP 时退回最晚开始的假期
+    latest = max(h.begin for h in compiled).astimezone(timezone.utc)
+    assert source_timestamp("", compiled) == latest
+
+
+def test_slim_ics_round_trips_through_parser(compiled):
+    slim = to_slim_ics(compiled)
+    assert slim.count("BEGIN:VEVENT") == len(compiled)
+    assert "X-MAKEUP-DATES:20260920,20261010" in slim
+    clock = FixedClock(datetime(2026, 1, 1))
+    reparsed = merge_and_filter_holidays(parse_ics(slim, clock=clock), clock=clock, keep_ended=True)
+    assert [(h.name, h.begin.date(), h.duration) for h in reparsed] == \
+        [(h.name, h.begin.date(), h.duration) for h in compiled]
+
+
+def test_main_writes_both_artifacts(tmp_path, bundled_ics):
+    src = tmp_path / "holiday_data.ics"
+    src.write_text(bundled_ics, encoding="utf-8")
+    out_json = tmp_path / "out" / "holidays.json"
+    out_ics = tmp_path / "out" / "slim.ics"
+    assert main([str(src), "--since", "2026-01-01", "--json", str(out_json), "--ics-out", str(out_ics)]) == 0
+    assert json.loads(out_json.read_text(encoding="utf-8"))["holidays"]
+    assert out_ics.read_bytes().endswith(b"END:VCALENDAR\r\n")
+
+    first = (out_json.read_bytes(), out_ics.read_bytes())
+    main([str(src), "--since", "2026-01-01", "--json", str(out_json), "--ics-out", str(out_ics)])
+    assert (out_json.read_bytes(), out_ics.read_bytes()) == first
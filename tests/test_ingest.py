@@ -0,0 +1,41 @@
+# tests/test_ingest.py
+import json
+import os
+
+from holidays.ingest import parse_ics_files, parse_ics_parallel, split_vevents
+from holidays.parser import parse_ics
+
+
+def _key(h):
+    return h.uid, h.name, h.begin, h.end, h.duration, str(h.raw_description)
+
+
+def test_split_vevents(bundled_ics):
+    header, blocks = split_vevents(bundled_ics)
+    assert "BEGIN:VTIMEZONE" in header
+    assert len(blocks) == bundled_ics.count("BEGIN:VEVENT")
+
+
+def test_parallel_matches_serial(bundled_ics, clock, monkeypatch):
+    monkeypatch.setattr("holidays.ingest.PARALLEL_MIN_EVENTS", 1)
+    serial = parse_ics(bundled_ics, clock=clock)
+    parallel = parse_ics_parallel(bundled_ics, workers=2, clock=clock)
+    assert [_key(h) for h in parallel] == [_key(h) for h in serial]
+
+
+def test_index_round_trip(bundled_ics, clock, tmp_path):
+    ics_path = tmp_path / "extra.ics"
+    ics_path.write_text(bundled_ics, encoding="utf-8")
+    index_path = str(tmp_path / "idx.json")
+
+    first = parse_ics_files([str(tmp_path)], workers=1, index_path=index_path, clock=clock)
+    assert os.path.exists(index_path)
+    assert not os.path.exists(index_path + ".tmp")
+    with open(index_path, "r", encoding="utf-8") as f:
+        records = json.load(f)["files"][str(ics_path)]["records"]
+    assert len(records) == len(first)
+
+    # 第二次命中索引：描述来自 JSON 中的 str
+    second = parse_ics_files([str(tmp_path)], workers=1, index_path=index_path, clock=clock)
+    assert [_key(h) for h in second] == [_key(h) for h in first]
+    assert any(h.notice_url for h in second)
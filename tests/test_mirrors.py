@@ -0,0 +1,115 @@
+# tests/test_mirrors.py
+import threading
+import time
+
+import pytest
+import requests
+
+from holidays.fetcher import is_valid_ics
+from holidays.mirrors import MirrorHealth, MirrorsExhausted, _decode, race_fetch
+from utils.faultnet import Fault, FaultServer
+
+ICS = "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:元旦\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+
+
+def _response(content_type: str) -> requests.Response:
+    resp = requests.Response()
+    resp.headers["Content-Type"] = content_type
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    return resp
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(fault=None, text=ICS):
+        server = FaultServer(text, fault).start()
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.stop()
+
+
+def test_decode_defaults_to_utf8_and_strips_bom():
+    body = "\ufeff元旦".encode("utf-8")
+    assert _decode(_response("text/calendar"), body) == "元旦"
+    assert _decode(_response("text/calendar; charset=utf-8"), body) == "元旦"
+    assert _decode(_response("text/calendar; charset=gbk"), "元旦".encode("gbk")) == "元旦"
+    with pytest.raises(UnicodeDecodeError):
+        _decode(_response("text/calendar"), "元旦".encode("gbk"))
+
+
+def test_health_orders_known_mirrors_first(tmp_path):
+    path = str(tmp_path / "mirror_health.json")
+    health = MirrorHealth(path)
+    health.record_success("fast", 0.1)
+    health.record_success("slow", 2.0)
+    health.record_failure("flaky", 10)
+    assert health.order(["new", "flaky", "slow", "fast"]) == ["fast", "slow", "flaky", "new"]
+    health.save()
+    assert MirrorHealth(path).order(["new", "slow", "fast"]) == ["fast", "slow", "new"]
+
+
+def test_corrupt_health_file_is_reset(tmp_path, capsys):
+    path = tmp_path / "mirror_health.json"
+    path.write_text("{", encoding="utf-8")
+    assert MirrorHealth(str(path)).scores == {}
+    assert "已重置" in capsys.readouterr().out
+
+
+def test_race_prefers_first_valid_response(servers):
+    slow = servers(Fault(latency=1.5))
+    fast = servers()
+    health = MirrorHealth()
+    result = race_fetch([slow.url, fast.url], is_valid_ics, timeout=5, stagger=0.05, health=health)
+    assert result.url == fast.url and result.text == ICS
+    assert health.order([slow.url, fast.url])[0] == fast.url
+
+
+def test_race_skips_invalid_and_failing_mirrors(servers):
+    portal = servers(Fault(content_type="text/html", body="<html>login</html>"))
+    broken = servers(Fault(status=503))
+    good = servers()
+    result = race_fetch([portal.url, broken.url, good.url], is_valid_ics, timeout=5, stagger=0.05)
+    assert result.url == good.url
+
+
+def test_race_exhausted(servers):
+    portal = servers(Fault(content_type="text/html", body="<html>login</html>"))
+    with pytest.raises(MirrorsExhausted) as info:
+        race_fetch([portal.url], is_valid_ics, timeout=5)
+    assert info.value.all_invalid
+
+    missing = servers(Fault(status=404))
+    with pytest.raises(MirrorsExhausted) as info:
+        race_fetch([portal.url, missing.url], is_valid_ics, timeout=5, stagger=0.05)
+    assert not info.value.all_invalid and set(info.value.errors) == {portal.url, missing.url}
+
+    with pytest.raises(MirrorsExhausted):
+        race_fetch(["", None], is_valid_ics)
+
+
+def test_oversized_response_fails(servers):
+    big = servers(Fault(pad_to=64 * 1024))
+    with pytest.raises(MirrorsExhausted) as info:
+        race_fetch([big.url], is_valid_ics, timeout=5, max_bytes=16 * 1024)
+    assert "字节" in info.value.errors[big.url]
+
+
+def _mirror_threads():
+    return [t for t in threading.enumerate() if t.name == "ics-mirror" and t.is_alive()]
+
+
+@pytest.mark.parametrize("fault", [Fault(latency=8), Fault(bandwidth=2048, pad_to=256 * 1024)])
+def test_losers_are_cancelled_promptly(servers, fault):
+    stuck = servers(fault)
+    fast = servers(Fault(latency=0.3))
+    result = race_fetch([stuck.url, fast.url], is_valid_ics, timeout=10, stagger=0.05)
+    assert result.url == fast.url
+    deadline = time.monotonic() + 2
+    while _mirror_threads() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _mirror_threads()
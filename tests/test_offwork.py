@@ -0,0 +1,71 @@
+# tests/test_offwork.py
+from datetime import date, datetime, time
+
+import pytest
+
+from holidays.offwork import OffworkSchedule, OffworkTable, parse_hhmm
+from holidays.timezones import get_zone
+
+ZONE = get_zone("Asia/Shanghai")
+
+
+def test_parse_hhmm():
+    assert parse_hhmm(" 09:05 ") == time(9, 5)
+    for bad in ("24:00", "12:60", "noon", "12"):
+        with pytest.raises(ValueError):
+            parse_hhmm(bad)
+
+
+def test_default_rules_follow_holidays_and_makeups(merged):
+    schedule = OffworkSchedule({}, merged)
+    assert schedule.rule_for(date(2026, 4, 30)) == {"mid": time(12, 0), "night": time(18, 0)}
+    assert schedule.rule_for(date(2026, 5, 1)) is None          # 劳动节
+    assert schedule.rule_for(date(2026, 5, 2)) is None          # 周六，假期内
+    assert schedule.is_workday(date(2026, 5, 9))                # 周六补班
+    assert not schedule.is_workday(date(2026, 5, 16))           # 普通周六
+
+
+def test_weekday_overrides():
+    config = {
+        "offwork_time": "18:30",
+        "offwork_weekdays": {"fri": {"offwork_time": "17:00"}, "sat": {"offwork_time": None}, "mon": None},
+    }
+    schedule = OffworkSchedule(config)
+    assert schedule.rule_for(date(2026, 3, 6)) == {"mid": time(12, 0), "night": time(17, 0)}
+    assert schedule.rule_for(date(2026, 3, 7)) == {"mid": time(12, 0), "night": None}
+    assert schedule.rule_for(date(2026, 3, 9)) is None
+    assert schedule.rule_for(date(2026, 3, 10))["night"] == time(18, 30)
+
+
+def test_shift_cycle_ignores_weekdays():
+    config = {"offwork_shift": {"anchor": "2026-03-02", "cycle": [{"offwork_time": "20:00"}, {}, None]}}
+    schedule = OffworkSchedule(config)
+    assert schedule.rule_for(date(2026, 3, 2))["night"] == time(20, 0)
+    assert schedule.rule_for(date(2026, 3, 3))["night"] == time(18, 0)
+    assert schedule.rule_for(date(2026, 3, 4)) is None
+    assert schedule.rule_for(date(2026, 3, 1)) is None                    # anchor 之前同样按周期回推
+    assert schedule.rule_for(date(2026, 3, 8))["night"] == time(20, 0)  # 周日照常轮班
+
+
+def test_table_skips_holidays(merged):
+    table = OffworkTable(OffworkSchedule({}, merged))
+    assert table.next("night", datetime(2026, 4, 30, 18, 30, tzinfo=ZONE)) == datetime(2026, 5, 6, 18, 0, tzinfo=ZONE)
+    assert table.next("mid", datetime(2026, 4, 30, 12, 30)) == datetime(2026, 5, 6, 12, 0, tzinfo=ZONE)
+    # 补班的周六照常下班
+    assert table.next("night", datetime(2026, 5, 8, 18, 0, tzinfo=ZONE)) == datetime(2026, 5, 9, 18, 0, tzinfo=ZONE)
+
+
+def test_table_is_strictly_after_now_and_rebuilds_daily():
+    table = OffworkTable(OffworkSchedule({}), size=2)
+    monday_noon = datetime(2026, 3, 2, 12, 0, tzinfo=ZONE)
+    assert table.next("mid", monday_noon) == datetime(2026, 3, 3, 12, 0, tzinfo=ZONE)
+    assert table.built_for == date(2026, 3, 2)
+    # 同一天内只前移表头；跨天后重建
+    assert table.next("mid", datetime(2026, 3, 5, 9, 0, tzinfo=ZONE)) == datetime(2026, 3, 5, 12, 0, tzinfo=ZONE)
+    assert table.built_for == date(2026, 3, 5)
+
+
+def test_table_empty_slot_returns_none():
+    table = OffworkTable(OffworkSchedule({"offwork_mid_time": ""}))
+    assert table.next("mid", datetime(2026, 3, 2, 9, 0, tzinfo=ZONE)) is None
+    assert table.next("night", datetime(2026, 3, 2, 9, 0, tzinfo=ZONE)) == datetime(2026, 3, 2, 18, 0, tzinfo=ZONE)
@@ -0,0 +1,23 @@
+# tests/test_paths.py
+import os
+import sys
+
+from utils import paths
+
+
+def test_user_data_dir_is_cwd_from_source(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert paths.user_data_dir() == str(tmp_path)
+    assert paths.user_data_path("holiday_snapshot.json") == os.path.join(str(tmp_path), "holiday_snapshot.json")
+
+
+def test_user_data_dir_when_frozen(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "_MEIPASS", str(tmp_path / "bundle"), raising=False)
+    monkeypatch.setenv("APPDATA", str(tmp_path / "appdata"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "xdg"))
+
+    path = paths.user_data_path("holiday_snapshot.json")
+    assert not path.startswith(paths.resource_path(""))
+    assert os.path.basename(os.path.dirname(path)) == paths.APP_DIR_NAME
+    assert os.path.isdir(os.path.dirname(path))
@@ -0,0 +1,38 @@
+# tests/test_processor.py
+from datetime import date
+
+import pytest
+
+from holidays.parser import parse_ics
+from holidays.processor import drop_ended, merge_and_filter_holidays, normalize_name
+
+@pytest.fixture(scope="module")
+def events(bundled_ics, clock):
+    return parse_ics(bundled_ics, clock=clock)
+
+
+def test_normalize_name():
+    assert normalize_name("劳动节 第1天/共3天") == "劳动节"
+    assert normalize_name("劳动节 补班 第1天/共1天") == "劳动节 补班"
+    assert normalize_name("元旦 假期 第1天") == "元旦"
+    assert normalize_name(None) == ""
+
+
+def test_merge_drops_ended_by_default(events, clock):
+    names = [h.name for h in merge_and_filter_holidays(events, clock=clock)]
+    assert "元旦" not in names and "春节" not in names
+    assert names[0] == "清明节"
+
+
+def test_keep_ended_keeps_this_year_only(events, clock):
+    merged = merge_and_filter_holidays(events, clock=clock, keep_ended=True)
+    assert [h.name for h in merged[:2]] == ["元旦", "春节"]
+    assert all(h.end.year >= 2026 for h in merged)
+    upcoming = merge_and_filter_holidays(events, clock=clock)
+    assert [h.name for h in drop_ended(merged, date(2026, 3, 1))] == [h.name for h in upcoming]
+
+
+def test_makeup_days_attached(merged):
+    spring = next(h for h in merged if h.name == "春节")
+    assert spring.makeup_days
+    assert spring.days_excl_makeup == spring.duration - len(spring.makeup_days)
@@ -0,0 +1,86 @@
+# tests/test_service.py
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from holidays.parser import Holiday
+from holidays.service import HolidayService
+from holidays.timezones import get_zone
+
+ZONE = get_zone("Asia/Shanghai")
+
+
+def _holiday(name: str, begin: date, days: int) -> Holiday:
+    end = begin + timedelta(days=days - 1)
+    return Holiday(
+        name=name,
+        begin=datetime(begin.year, begin.month, begin.day, tzinfo=ZONE),
+        end=datetime(end.year, end.month, end.day, 23, 59, 59, tzinfo=ZONE),
+        duration=days,
+        days_excl_makeup=days,
+        days_excl_makeup_weekend=days,
+    )
+
+
+def _at(d: date, hour: int = 12) -> datetime:
+    return datetime(d.year, d.month, d.day, hour, tzinfo=ZONE)
+
+
+@pytest.fixture
+def service(bundled_ics, clock):
+    svc = HolidayService(clock=clock)
+    svc.load_ics(bundled_ics)
+    return svc
+
+
+def test_upcoming_and_next(service):
+    assert service.next_holiday().name == "清明节"
+    names = [h.name for h in service.upcoming()]
+    assert names[0] == "清明节" and "春节" not in names
+    assert service.next_holiday(_at(date(2027, 1, 1))) is None
+    # 进行中的假期仍是“下一个”，剩余时间为负
+    h, left = service.countdowns(_at(date(2026, 4, 5)))[0]
+    assert h.name == "清明节" and left < timedelta(0)
+
+
+def test_overlapping_holidays(clock):
+    long = _holiday("长假", date(2026, 5, 1), 10)     # 5/1 ~ 5/10
+    short = _holiday("短假", date(2026, 5, 2), 2)     # 5/2 ~ 5/3，比长假先结束
+    later = _holiday("后面", date(2026, 6, 1), 1)
+    svc = HolidayService(clock=clock)
+    svc.set_holidays([later, short, long])
+
+    assert [h.name for h in svc.upcoming(_at(date(2026, 5, 2)))] == ["长假", "短假", "后面"]
+    assert [h.name for h in svc.upcoming(_at(date(2026, 5, 5)))] == ["长假", "后面"]
+    assert svc.next_holiday(_at(date(2026, 5, 5))).name == "长假"
+    assert [h.name for h in svc.upcoming(_at(date(2026, 5, 20)))] == ["后面"]
+
+
+def test_cache_is_versioned(service, bundled_ics):
+    first = service.stats()
+    assert service.stats() == first
+    hits = service.cache_info().hits
+    assert hits >= 1
+
+    service.set_holidays([_holiday("只有一个", date(2026, 7, 1), 3)])
+    assert service.cache_info().currsize == 0
+    assert service.stats() == (3, 3, 3)
+    assert service.holidays_in_month(2026, 7)[0].name == "只有一个"
+    assert service.holidays_in_month(2026, 8) == []
+    assert service.years() == [2026]
+
+
+def test_stats_ranges(service):
+    total = service.stats()
+    assert total == tuple(map(sum, zip(*(service.stats(y) for y in service.years()))))
+    assert service.stats(2026, month=1)[0] > 0      # 元旦虽已结束，仍计入 2026 年
+    assert service.stats(2026, quarter=1) == tuple(
+        map(sum, zip(*(service.stats(2026, month=m) for m in (1, 2, 3)))))
+
+
+def test_cache_bounded(service, clock):
+    small = HolidayService(clock=clock, cache_size=4)
+    small.set_holidays(service.holidays())
+    for m in range(1, 13):
+        small.holidays_in_month(2026, m)
+    assert small.cache_info().currsize == 4
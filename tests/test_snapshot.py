@@ -0,0 +1,40 @@
+# tests/test_snapshot.py
+from datetime import date
+
+from holidays.snapshot import build_snapshot, load_snapshot, save_snapshot, snapshot_holidays, snapshot_matches
+
+
+def test_round_trip(bundled_ics, merged, tmp_path):
+    path = str(tmp_path / "snap.json")
+    save_snapshot(build_snapshot(bundled_ics, holidays=merged), path)
+    snapshot = load_snapshot(path)
+    assert snapshot_matches(snapshot, bundled_ics)
+    assert not snapshot_matches(snapshot, bundled_ics + "\n")
+
+    restored = snapshot_holidays(snapshot, today=date(2026, 3, 1), keep_ended=True)
+    assert [(h.name, h.begin, h.end, h.duration, h.days_excl_makeup, h.days_excl_makeup_weekend,
+             h.makeup_days, h.description) for h in restored] == \
+           [(h.name, h.begin, h.end, h.duration, h.days_excl_makeup, h.days_excl_makeup_weekend,
+             h.makeup_days, h.description) for h in merged]
+
+
+def test_built_at_uses_injected_clock(bundled_ics, clock, merged):
+    snapshot = build_snapshot(bundled_ics, clock=clock)
+    assert snapshot["built_at"] == "2026-03-01T12:00:00+08:00"
+    assert len(snapshot["holidays"]) == len(merged)
+
+
+def test_restore_filters_ended(bundled_ics, merged):
+    snapshot = build_snapshot(bundled_ics, holidays=merged)
+    upcoming = snapshot_holidays(snapshot, today=date(2026, 3, 1))
+    assert upcoming[0].name == "清明节"
+    assert snapshot_holidays(snapshot, today=date(2027, 1, 1), keep_ended=True) == []
+
+
+def test_load_rejects_corrupt_or_old(tmp_path):
+    path = tmp_path / "snap.json"
+    assert load_snapshot(str(path)) is None
+    path.write_text("{", encoding="utf-8")
+    assert load_snapshot(str(path)) is None
+    path.write_text('{"version": 1}', encoding="utf-8")
+    assert load_snapshot(str(path)) is None
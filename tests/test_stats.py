@@ -0,0 +1,75 @@
+# tests/test_stats.py
+from datetime import date, datetime
+
+from holidays.parser import Holiday
+from holidays.stats import HolidayStats
+from holidays.timezones import get_zone
+
+ZONE = get_zone("Asia/Shanghai")
+
+
+def _holiday(begin: date, days: int, makeup_days=()):
+    end = date.fromordinal(begin.toordinal() + days - 1)
+    return Holiday(
+        name="假期",
+        begin=datetime(begin.year, begin.month, begin.day, tzinfo=ZONE),
+        end=datetime(end.year, end.month, end.day, 23, 59, 59, tzinfo=ZONE),
+        duration=days,
+        makeup_days=list(makeup_days),
+    )
+
+
+def test_total_matches_rows(merged):
+    stats = HolidayStats(merged)
+    assert stats.total() == (
+        sum(h.duration for h in merged),
+        sum(h.days_excl_makeup for h in merged),
+        sum(h.days_excl_makeup_weekend for h in merged),
+    )
+
+
+def test_months_never_negative_and_add_up(merged):
+    stats = HolidayStats(merged)
+    for year in stats.years():
+        months = [stats.month(year, m) for m in range(1, 13)]
+        quarters = [stats.quarter(year, q) for q in range(1, 5)]
+        assert all(v >= 0 for row in months + quarters for v in row)
+        assert tuple(map(sum, zip(*months))) == stats.year(year)
+        assert tuple(map(sum, zip(*quarters))) == stats.year(year)
+
+
+def test_makeup_day_in_other_month_is_credited_to_its_holiday(merged):
+    # 2026 国庆 10/1~10/7，补班 9/20 与 10/10；9 月只有中秋 9/25~9/27，不受国庆补班影响
+    stats = HolidayStats(merged)
+    mid_autumn = next(h for h in merged if h.begin.date() == date(2026, 9, 25))
+    assert stats.month(2026, 9) == (mid_autumn.duration, mid_autumn.days_excl_makeup,
+                                     mid_autumn.days_excl_makeup_weekend)
+    assert stats.quarter(2026, 3) == stats.month(2026, 9)
+    national = next(h for h in merged if h.begin.date() == date(2026, 10, 1))
+    assert stats.month(2026, 10) == (national.duration, national.days_excl_makeup,
+                                      national.days_excl_makeup_weekend)
+    qingming = next(h for h in merged if h.begin.date() == date(2026, 4, 4))
+    assert stats.month(2026, 4) == (qingming.duration, qingming.days_excl_makeup,
+                                     qingming.days_excl_makeup_weekend)
+
+
+def test_holiday_split_across_months():
+    # 周五 ~ 下周五共 8 天，补班 2 天，第一个月只占 2 天
+    h = _holiday(date(2023, 9, 29), 8, [date(2023, 10, 7), date(2023, 10, 8)])
+    stats = HolidayStats([h])
+    assert stats.total() == (8, 6, 4)
+    assert stats.month(2023, 9) == (2, 0, 0)
+    assert stats.month(2023, 10) == (6, 6, 4)
+    assert stats.between(date(2023, 10, 7), date(2023, 10, 8)) == (0, 0, 0)
+
+
+def test_more_makeups_than_weekdays_clamps_to_zero():
+    h = _holiday(date(2025, 6, 7), 2, [date(2025, 6, 9)])   # 周六、周日
+    assert HolidayStats([h]).total() == (2, 1, 0)
+
+
+def test_empty():
+    stats = HolidayStats([])
+    assert stats.total() == (0, 0, 0)
+    assert stats.month(2025, 1) == (0, 0, 0)
+    assert stats.years() == []
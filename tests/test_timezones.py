@@ -0,0 +1,42 @@
+# tests/test_timezones.py
+from datetime import date, datetime, timedelta, timezone
+
+from holidays.timezones import MultiZoneCountdown, ZoneOffsetTable, get_zone, localize, valid_zones
+
+SHANGHAI = get_zone("Asia/Shanghai")
+
+
+def test_localize():
+    naive = datetime(2026, 10, 1, 8, 0)
+    assert localize(naive).utcoffset() == timedelta(hours=8)
+    aware = datetime(2026, 10, 1, 0, 0, tzinfo=timezone.utc)
+    assert localize(aware) == aware and localize(aware).hour == 8
+    assert localize(None) is None
+
+
+def test_offset_table_matches_zoneinfo_across_dst():
+    table = ZoneOffsetTable("America/New_York", date(2026, 1, 1), date(2026, 12, 31))
+    zone = get_zone("America/New_York")
+    for hours in range(0, 365 * 24, 7):
+        t = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(hours=hours)
+        assert table.offset_at(t) == t.astimezone(zone).utcoffset()
+
+
+def test_invalid_zones_are_skipped(capsys):
+    assert valid_zones(["Europe/London", "Mars/Olympus", "", "../etc"]) == ["Europe/London"]
+    zc = MultiZoneCountdown(["Mars/Olympus", "America/New_York"])
+    assert zc.zones == ["America/New_York"]
+    zc.prepare([datetime(2026, 10, 1, tzinfo=SHANGHAI)])
+    assert "Mars/Olympus" in capsys.readouterr().out
+
+
+def test_remaining_uses_absolute_time():
+    target = datetime(2026, 10, 1, 0, 0, tzinfo=SHANGHAI)
+    zc = MultiZoneCountdown(["America/New_York", "Europe/London"])
+    zc.prepare([target])
+    zc.set_target(target)
+    assert [local.strftime("%m-%d %H:%M") for _, local in zc.local_times] == ["09-30 12:00", "09-30 17:00"]
+
+    now_utc = datetime(2026, 9, 30, 12, 0, tzinfo=timezone.utc)
+    now_ny = now_utc.astimezone(get_zone("America/New_York"))
+    assert zc.remaining(now_utc) == zc.remaining(now_ny) == timedelta(hours=4)
@@ -0,0 +1,89 @@
+# tests/test_tray_badge.py
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+QtGui = pytest.importorskip("PyQt6.QtGui")
+
+from holidays.clock import VirtualClock
+from holidays.service import HolidayService
+from holidays.timezones import localize
+from ui.tray_badge import ICON_CACHE_SIZE, TrayBadge
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def make_badge(app, bundled_ics):
+    badges = []
+
+    def make(start: datetime):
+        clock = VirtualClock(start)
+        service = HolidayService(clock=clock)
+        service.load_ics(bundled_ics)
+        badge = TrayBadge(QtWidgets.QSystemTrayIcon(), service, QtGui.QIcon())
+        badges.append(badge)
+        return badge, clock
+
+    yield make
+    for badge in badges:
+        badge._timer.stop()
+
+
+def test_deadline_crosses_midnight_then_holiday_start(make_badge):
+    # 国庆节 2026-10-01 开始；中秋节（9-25 ~ 9-27）已结束
+    badge, clock = make_badge(datetime(2026, 9, 29, 23, 0))
+    text, tooltip, deadline = badge.compute(localize(clock.now()))
+    assert text == "1" and "国庆节" in tooltip
+    assert deadline == localize(datetime(2026, 9, 30))          # 过了午夜显示值减一
+
+    clock.set(deadline + timedelta(seconds=1))
+    text, _, deadline = badge.compute(localize(clock.now()))
+    assert text == "0"
+    assert deadline == localize(datetime(2026, 10, 1))          # 下一次变化是假期开始
+
+    clock.set(deadline + timedelta(seconds=1))
+    text, tooltip, deadline = badge.compute(localize(clock.now()))
+    assert text == "休" and "假期中" in tooltip
+    assert deadline == localize(datetime(2026, 10, 7, 23, 59, 59)) + timedelta(seconds=1)
+
+
+def test_update_waits_until_deadline(make_badge):
+    badge, clock = make_badge(datetime(2026, 9, 29, 23, 0))
+    badge.update()
+    assert badge._shown_text == "1"
+    # 一小时后到午夜（+50ms 余量），而不是每秒轮询
+    assert badge._timer.isActive()
+    assert abs(badge._timer.interval() - 3600 * 1000) <= 100
+
+
+def test_icon_cache_reused_across_ticks(make_badge, monkeypatch):
+    rendered = []
+    original = TrayBadge.render
+    monkeypatch.setattr(TrayBadge, "render", staticmethod(lambda text: rendered.append(text) or original(text)))
+
+    badge, clock = make_badge(datetime(2026, 9, 29, 23, 0))
+    badge.update()
+    first = badge._icons["1"]
+    for _ in range(5):
+        clock.advance(timedelta(minutes=5))
+        badge.update()
+    assert rendered == ["1"]
+    assert badge.icon_for("1") is first
+
+
+def test_icon_cache_evicts_least_recently_used(make_badge):
+    badge, _ = make_badge(datetime(2026, 9, 29, 23, 0))
+    keep = badge.icon_for("0")
+    for days in range(1, ICON_CACHE_SIZE + 1):
+        badge.icon_for(str(days))
+        if days == ICON_CACHE_SIZE - 1:
+            assert badge.icon_for("0") is keep   # 刚用过，移到队尾
+    assert len(badge._icons) == ICON_CACHE_SIZE
+    assert "1" not in badge._icons and "0" in badge._icons
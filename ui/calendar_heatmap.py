@@ -0,0 +1,210 @@
+# ui/calendar_heatmap.py
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from PyQt6 import QtWidgets, QtGui, QtCore
+
+from holidays.daymap import HOLIDAY, MAKEUP, WEEKEND, WORKDAY, build_day_map
+from holidays.parser import Holiday
+
+CELL = 11
+GAP = 2
+STEP = CELL + GAP
+LEFT = 26           # 星期标签宽度
+TITLE_H = 22        # 年份标题
+MONTH_H = 14        # 月份标签
+YEAR_GAP = 14
+WEEKS = 54          # 一年最多跨 54 个周列
+YEAR_W = LEFT + WEEKS * STEP
+YEAR_H = TITLE_H + MONTH_H + 7 * STEP + YEAR_GAP
+
+COLORS = {
+    WORKDAY: "#e6e8eb",
+    WEEKEND: "#b7d3ee",
+    HOLIDAY: "#e4574e",
+    MAKEUP: "#f2a541",
+}
+LABELS = {
+    WORKDAY: "工作日",
+    WEEKEND: "周末",
+    HOLIDAY: "放假",
+    MAKEUP: "补班",
+}
+
+
+def _cell_origin(year: int, day_index: int):
+    """当年第 day_index 天所在的 (周列, 星期行)，周一为第 0 行"""
+    offset = date(year, 1, 1).weekday() + day_index
+    return offset // 7, offset % 7
+
+
+# ===========================
+#  全年日历热力图
+# ===========================
+class CalendarHeatmap(QtWidgets.QWidget):
+    """
+    按年排列的日历热力图：每格一天，按 工作日 / 周末 / 放假 / 补班 着色。
+    - 每一年只在数据变化后首次进入可视区域时用 QPainter 画一次 QPixmap
+    - paintEvent 只把可视区域内的年份 pixmap 贴上去，滚动 / 缩放窗口不重画格子
+    - “今天”的描边单独叠加，不进缓存，跨天时也无需失效
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.day_map: Dict[int, bytes] = {}
+        self.years: List[int] = []
+        self.today: Optional[date] = None
+        self._pixmaps: Dict[int, QtGui.QPixmap] = {}
+        self._pixmap_dpr = 1.0
+        self._colors = {k: QtGui.QColor(v) for k, v in COLORS.items()}
+        self.setMouseTracking(True)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+
+    def set_holidays(self, holidays: List[Holiday]):
+        day_map = build_day_map(holidays)
+        if day_map == self.day_map:
+            return
+        self.day_map = day_map
+        self.years = sorted(day_map)
+        self.invalidate()
+        self.updateGeometry()
+        self.setFixedHeight(max(len(self.years), 1) * YEAR_H)
+        self.update()
+
+    def set_today(self, today: date):
+        if today == self.today:
+            return
+        previous, self.today = self.today, today
+        for d in (previous, today):
+            rect = self.day_rect(d)
+            if rect is not None:
+                self.update(rect.adjusted(-2, -2, 2, 2))
+
+    def invalidate(self):
+        """丢弃所有缓存的年份 pixmap（仅在数据变化时调用）"""
+        self._pixmaps.clear()
+
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(YEAR_W, max(len(self.years), 1) * YEAR_H)
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(YEAR_W, YEAR_H)
+
+    # ===========================
+    #  坐标换算
+    # ===========================
+    def _x0(self) -> int:
+        """整体水平居中"""
+        return max((self.width() - YEAR_W) // 2, 0)
+
+    def year_top(self, year: int) -> int:
+        return self.years.index(year) * YEAR_H
+
+    def day_rect(self, d: Optional[date]) -> Optional[QtCore.QRect]:
+        if d is None or d.year not in self.day_map:
+            return None
+        col, row = _cell_origin(d.year, (d - date(d.year, 1, 1)).days)
+        x = self._x0() + LEFT + col * STEP
+        y = self.year_top(d.year) + TITLE_H + MONTH_H + row * STEP
+        return QtCore.QRect(x, y, CELL, CELL)
+
+    def date_at(self, pos: QtCore.QPoint) -> Optional[date]:
+        if not self.years:
+            return None
+        index = pos.y() // YEAR_H
+        if not (0 <= index < len(self.years)):
+            return None
+        year = self.years[index]
+        x = pos.x() - self._x0() - LEFT
+        y = pos.y() - index * YEAR_H - TITLE_H - MONTH_H
+        if x < 0 or y < 0 or x % STEP >= CELL or y % STEP >= CELL:
+            return None
+        col, row = x // STEP, y // STEP
+        if row >= 7:
+            return None
+        day_index = col * 7 + row - date(year, 1, 1).weekday()
+        if not (0 <= day_index < len(self.day_map[year])):
+            return None
+        return date(year, 1, 1) + timedelta(days=day_index)
+
+    # ===========================
+    #  渲染
+    # ===========================
+    def render_year(self, year: int, dpr: float) -> QtGui.QPixmap:
+        pix = QtGui.QPixmap(int(YEAR_W * dpr), int(YEAR_H * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+
+        p = QtGui.QPainter(pix)
+        p.setPen(self.palette().color(QtGui.QPalette.ColorRole.WindowText))
+        font = p.font()
+        font.setBold(True)
+        p.setFont(font)
+        p.drawText(QtCore.QRect(0, 0, YEAR_W, TITLE_H),
+                   QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, f"{year}年")
+        font.setBold(False)
+        font.setPointSizeF(max(font.pointSizeF() - 2, 6))
+        p.setFont(font)
+
+        top = TITLE_H + MONTH_H
+        for row, label in ((0, "一"), (2, "三"), (4, "五"), (6, "日")):
+            p.drawText(QtCore.QRect(0, top + row * STEP - 2, LEFT - 4, STEP),
+                       QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter, label)
+        for month in range(1, 13):
+            col, _ = _cell_origin(year, (date(year, month, 1) - date(year, 1, 1)).days)
+            p.drawText(QtCore.QRect(LEFT + col * STEP, TITLE_H, 4 * STEP, MONTH_H),
+                       QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, f"{month}月")
+
+        p.setPen(QtCore.Qt.PenStyle.NoPen)
+        for i, kind in enumerate(self.day_map[year]):
+            col, row = _cell_origin(year, i)
+            p.fillRect(LEFT + col * STEP, top + row * STEP, CELL, CELL, self._colors[kind])
+        p.end()
+        return pix
+
+    def pixmap_for(self, year: int) -> QtGui.QPixmap:
+        dpr = self.devicePixelRatioF()
+        if dpr != self._pixmap_dpr:
+            # 窗口被拖到缩放比例不同的屏幕上
+            self._pixmaps.clear()
+            self._pixmap_dpr = dpr
+        pix = self._pixmaps.get(year)
+        if pix is None:
+            pix = self._pixmaps[year] = self.render_year(year, dpr)
+        return pix
+
+    def paintEvent(self, event):
+        if not self.years:
+            return
+        exposed = event.rect()
+        first = max(exposed.top() // YEAR_H, 0)
+        last = min(exposed.bottom() // YEAR_H, len(self.years) - 1)
+        x0 = self._x0()
+
+        p = QtGui.QPainter(self)
+        for index in range(first, last + 1):
+            p.drawPixmap(x0, index * YEAR_H, self.pixmap_for(self.years[index]))
+
+        rect = self.day_rect(self.today)
+        if rect is not None and rect.intersects(exposed):
+            pen = QtGui.QPen(self.palette().color(QtGui.QPalette.ColorRole.WindowText))
+            pen.setWidth(2)
+            p.setPen(pen)
+            p.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+            p.drawRect(rect.adjusted(-1, -1, 1, 1))
+        p.end()
+
+    def mouseMoveEvent(self, event):
+        d = self.date_at(event.position().toPoint())
+        if d is None:
+            QtWidgets.QToolTip.hideText()
+            return
+        kind = self.day_map[d.year][(d - date(d.year, 1, 1)).days]
+        QtWidgets.QToolTip.showText(event.globalPosition().toPoint(), f"{d:%Y-%m-%d}  {LABELS[kind]}", self)
+
+
+def legend_html() -> str:
+    """图例（彩色方块 + 文字）"""
+    return "&nbsp;&nbsp;".join(
+        f'<span style="color:{COLORS[k]}">■</span> {LABELS[k]}' for k in (WORKDAY, WEEKEND, HOLIDAY, MAKEUP)
+    )
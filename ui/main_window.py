@@ -1,30 +1,49 @@
 # ui/main_window.py
-import sys
-
 import requests
+from datetime import datetime, timezone
 from PyQt6 import QtWidgets, QtGui, QtCore
 from typing import List
 
 from PyQt6.QtWidgets import QApplication
 
+from holidays.cache_store import IcsCacheStore
+from holidays.classifier import configure_classifier
+from holidays.clock import get_clock
+from holidays.fetcher import is_valid_ics, mirror_urls
+from holidays.mirrors import GITHUB_RAW_URL, MirrorHealth, MirrorsExhausted, race_fetch
 from holidays.parser import Holiday
-from holidays.parser import parse_ics
+from holidays.ingest import parse_ics_files, parse_ics_parallel
 from holidays.processor import merge_and_filter_holidays
-from holidays.scheduler import time_until, compute_smart_holiday_days
+from holidays.snapshot import (build_snapshot, load_snapshot, save_snapshot, snapshot_holidays, snapshot_matches,
+                               source_digest)
+from holidays.scheduler import time_until
+from holidays.service import HolidayService
+from holidays.offwork import OffworkSchedule, OffworkTable
+from holidays.timezones import MultiZoneCountdown, localize
+from ui.calendar_heatmap import CalendarHeatmap, legend_html
+from ui.tray_badge import TrayBadge
+from utils.autostart import app_entry, disable_autostart, enable_autostart
+from utils.paths import resource_path, user_data_path
 import json
-from datetime import datetime, time as dt_time
 import os
+import threading
 
 ICS_CACHE_PATH =  "holiday_data.ics"
+ICS_INDEX_PATH = "ics_index.json"
+SNAPSHOT_PATH = "holiday_snapshot.json"
+ICS_STORE_DIR = "ics_cache"
+MIRROR_HEALTH_PATH = "mirror_health.json"
 CONFIG_PATH = "config.json"
 ICON_PATH = "icon.ico"
+APP_NAME = "HolidayCountdown"
 
 
-def resource_path(relative_path):
-    """获取打包后资源的正确路径"""
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.join(os.path.abspath("."), relative_path)
+def read_cached_ics(cache_path):
+    """读取本地 ICS 缓存，不存在返回 None"""
+    if not os.path.exists(cache_path):
+        return None
+    with open(cache_path, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 class HolidayItemWidget(QtWidgets.QWidget):
@@ -85,9 +104,19 @@ class MainWindow(QtWidgets.QMainWindow):
     REFRESH_ICS = QtCore.QTimer
     UPDATE_UI_TIMER = QtCore.QTimer
     HOLIDAY_HAED = Holiday(True)
+    # 后台解析完成：(请求序号, 假期列表 | None, 异常 | None)
+    holidays_parsed = QtCore.pyqtSignal(int, object, object)
 
-    def __init__(self, config_path=CONFIG_PATH):
+    def __init__(self, config_path=CONFIG_PATH, tray=None, offline_first=False, clock=None,
+                 cache_store=None, mirror_health=None):
+        """
+        tray: 复用已有的托盘图标（仅托盘模式启动时由 TrayLauncher 传入）
+        cache_store / mirror_health: 与 TrayLauncher 的后台刷新共用同一个实例，避免两份索引互相覆盖
+        offline_first: 首次加载只读本地缓存，不联网
+        clock: 时钟（模拟运行时传入虚拟时钟），默认使用全局时钟
+        """
         super().__init__()
+        self.clock = get_clock(clock)
         self.status_bar = None
         self.night_countdown_label = None
         self.mid_countdown_label = None
@@ -96,11 +125,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.refresh_timer = None
         self.excl_makeup_label = None
         self.ui_timer = None
-        self.tray = None
+        self.tray = tray
         self.off_apply_btn = None
         self.excl_makeup_weekend_label = None
         self.off_countdown_label = None
         self.total_label = None
+        self.stats_range_combo = None
+        self.zone_label = None
+        self.version_menu = None
+        self.autostart_action = None
+        self.tray_badge = None
         self.off_mid_time_edit = None
         self.list_layout = None
         self.pin_chk = None
@@ -120,12 +154,39 @@ class MainWindow(QtWidgets.QMainWindow):
         self.locked = self.config.get("locked", False)
         self.opacity = self.config.get("opacity", 1.0)
 
+        # 多版本 ICS 缓存（可离线回滚）
+        self.cache_store = cache_store or IcsCacheStore(
+            user_data_path(ICS_STORE_DIR),
+            max_versions=int(self.config.get("ics_cache_versions", 10)),
+            max_bytes=int(self.config.get("ics_cache_max_kb", 2048)) * 1024,
+            clock=self.clock,
+        )
+
+        # 镜像延迟 / 出错率记录
+        self.mirror_health = mirror_health or MirrorHealth(user_data_path(MIRROR_HEALTH_PATH))
+
+        # 可配置的补班 / 放假关键字
+        configure_classifier(self.config.get("makeup_keywords"), self.config.get("holiday_keywords"))
+
         # 其他初始化
-        self.holidays: List[Holiday] = []
+        self._calendar_year = None
+        # 查询门面：持有全部假期（含今年已结束的），列表 / 托盘 / 热力图 / 统计 / 倒计时都经由它查询，
+        # 结果按数据版本缓存，刷新时整体失效
+        self.service = HolidayService(clock=self.clock)
+        self.zone_countdown = MultiZoneCountdown(self.config.get("extra_timezones", []))
+        self._zone_holiday = None
+        self._zone_prefix = ""
+        self.offwork_table = None
+        self.rebuild_offwork_schedule()
         self.items: List[HolidayItemWidget] = []
+        # 快照未命中时 ICS 在后台线程解析，结果经信号回到 GUI 线程；只应用最新一次请求的结果
+        self._ingest_generation = 0
+        self._ingest_thread = None
+        self._ingest_done = (None, None)
+        self.holidays_parsed.connect(self.on_holidays_parsed)
         self.init_ui()
         self.start_timers()
-        self.load_ics_and_refresh()
+        self.load_ics_and_refresh(offline=offline_first)
         self._dragging = False
         self._drag_pos = None
         icon_path = resource_path(ICON_PATH)
@@ -170,6 +231,10 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             cfg = {
                 "ics_url": "https://www.shuyz.com/githubfiles/china-holiday-calender/master/holidayCal.ics",
+                "ics_mirrors": [
+                    "https://www.shuyz.com/githubfiles/china-holiday-calender/master/holidayCal.ics",
+                    GITHUB_RAW_URL,
+                ],
                 "offwork_time": "18:00",
                 "autostart": False,
                 "smart_count": True,
@@ -231,7 +296,33 @@ class MainWindow(QtWidgets.QMainWindow):
         self.list_layout = QtWidgets.QVBoxLayout()
         self.list_container.setLayout(self.list_layout)
         self.scroll.setWidget(self.list_container)
-        v.addWidget(self.scroll, 1)
+
+        # === 全年日历热力图 ===
+        calendar_page = QtWidgets.QWidget()
+        calendar_layout = QtWidgets.QVBoxLayout()
+        calendar_layout.setContentsMargins(0, 0, 0, 0)
+        legend = QtWidgets.QLabel(legend_html())
+        legend.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        calendar_layout.addWidget(legend)
+        self.calendar_heatmap = CalendarHeatmap()
+        self.calendar_scroll = QtWidgets.QScrollArea()
+        self.calendar_scroll.setWidgetResizable(True)
+        self.calendar_scroll.setWidget(self.calendar_heatmap)
+        # 页面首次显示、完成布局后滚动条才有范围，届时再滚动到今年
+        self.calendar_scroll.verticalScrollBar().rangeChanged.connect(lambda *_: self.scroll_calendar_to_today())
+        calendar_layout.addWidget(self.calendar_scroll, 1)
+        calendar_page.setLayout(calendar_layout)
+
+        self.view_tabs = QtWidgets.QTabWidget()
+        self.view_tabs.addTab(self.scroll, "列表")
+        self.view_tabs.addTab(calendar_page, "日历")
+        v.addWidget(self.view_tabs, 1)
+
+        # === 其他时区：下一个假期开始时刻 ===
+        self.zone_label = QtWidgets.QLabel("")
+        self.zone_label.setWordWrap(True)
+        self.zone_label.setVisible(bool(self.zone_countdown.zones))
+        v.addWidget(self.zone_label)
 
         # === 底部：下班设置 & 统计 ===
         bottom = QtWidgets.QHBoxLayout()
@@ -262,6 +353,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # --- 假期统计 ---
         stats_layout = QtWidgets.QVBoxLayout()
+        self.stats_range_combo = QtWidgets.QComboBox()
+        self.stats_range_combo.currentIndexChanged.connect(lambda _: self.refresh_stats())
+        stats_layout.addWidget(self.stats_range_combo)
         self.total_label = QtWidgets.QLabel("总假期天数: -")
         self.excl_makeup_label = QtWidgets.QLabel("排除调休: 0")
         self.excl_makeup_weekend_label = QtWidgets.QLabel("排除调休和双休: 0")
@@ -277,6 +371,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.message_label = QtWidgets.QLabel("")
         self.message_label.setStyleSheet("color: gray; font-size: 12px;")
         msg_layout.addWidget(self.message_label)
+        self.message_timer = QtCore.QTimer(self)
+        self.message_timer.setSingleShot(True)
+        self.message_timer.timeout.connect(lambda: self.message_label.setText(""))
         msg_layout.addStretch()
         v.addLayout(msg_layout)
 
@@ -292,7 +389,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowOpacity(self.opacity)
 
         # 托盘
-        self.tray = QtWidgets.QSystemTrayIcon(self)
+        if self.tray is None:
+            self.tray = QtWidgets.QSystemTrayIcon(self)
+        else:
+            self.tray.setParent(self)
         icon_path = resource_path(ICON_PATH)
         icon = QtGui.QIcon(icon_path)
 
@@ -303,9 +403,19 @@ class MainWindow(QtWidgets.QMainWindow):
             pix.fill(QtGui.QColor("orange"))
             icon = QtGui.QIcon(pix)
         self.tray.setIcon(icon)
+        # 托盘图标上显示距下一个假期的天数（按需重绘，不跟随 1 秒定时器）
+        self.tray_badge = TrayBadge(self.tray, self.service, icon,
+                                    show_offwork=self.config.get("tray_show_offwork", False), parent=self)
+        self.tray_badge.set_offwork_table(self.offwork_table)
         menu = QtWidgets.QMenu()
         show_action = menu.addAction("显示主界面")
         show_action.triggered.connect(self.show_and_raise)
+        self.version_menu = menu.addMenu("数据版本")
+        self.version_menu.aboutToShow.connect(self.populate_version_menu)
+        self.autostart_action = menu.addAction("开机自启（仅托盘）")
+        self.autostart_action.setCheckable(True)
+        self.autostart_action.setChecked(bool(self.config.get("autostart", False)))
+        self.autostart_action.toggled.connect(self.on_autostart_toggled)
         exit_action = menu.addAction("退出")
         exit_action.triggered.connect(self.force_quit)
         self.tray.setContextMenu(menu)
@@ -318,7 +428,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def show_message(self, text: str, duration: int = 3000):
         """在左下角固定label中输出短暂消息"""
         self.message_label.setText(text)
-        QtCore.QTimer.singleShot(duration, lambda: self.message_label.setText(""))
+        # 复用同一个单次定时器：新消息会重新计时，旧消息的定时器不会提前清掉它
+        self.message_timer.start(duration)
 
     # === 替换逻辑：按钮与开关消息 ===
     def on_refresh_clicked(self):
@@ -326,6 +437,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.load_ics_and_refresh()
 
 
+    def on_autostart_toggled(self, checked):
+        """写入 / 删除系统启动项；开机时以 --tray 仅托盘模式启动"""
+        if checked:
+            ok = enable_autostart(APP_NAME, app_entry(), tray_only=True)
+        else:
+            ok = disable_autostart(APP_NAME)
+        if not ok:
+            self.autostart_action.blockSignals(True)
+            self.autostart_action.setChecked(not checked)
+            self.autostart_action.blockSignals(False)
+            self.notify("错误", "当前系统不支持自动设置开机自启，请手动添加启动项。")
+            return
+        self.config["autostart"] = checked
+        self.save_config()
+        self.show_message("已开启开机自启" if checked else "已关闭开机自启")
+
     def on_pin_changed(self, state):
         self.toggle_topmost(state)
         self.show_message("窗口已置顶" if state else "窗口已取消置顶")
@@ -426,6 +553,18 @@ class MainWindow(QtWidgets.QMainWindow):
                               QtWidgets.QSystemTrayIcon.MessageIcon.Information, 2000)
 
 
+    def showEvent(self, event):
+        # 窗口可见时才需要每秒刷新倒计时
+        super().showEvent(event)
+        if self.ui_timer is not None and not self.ui_timer.isActive():
+            self.update_countdowns()
+            self.ui_timer.start(1000)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.ui_timer is not None:
+            self.ui_timer.stop()
+
     def force_quit(self):
         self._force_quit = True
         self.tray.hide()
@@ -450,16 +589,26 @@ class MainWindow(QtWidgets.QMainWindow):
             item = self.list_layout.takeAt(0)
             widget = item.widget()
             if widget:
+                # 只 setParent(None) 时控件仍挂在 Qt 对象树之外存活，交给事件循环销毁
                 widget.setParent(None)
+                widget.deleteLater()
 
-    def load_ics_and_refresh(self):
+    def load_ics_and_refresh(self, offline=False):
         """
         尝试从远端拉取 ICS 并更新本地缓存；若失败则回退到本地缓存（如果存在）。
         1. 请求成功后校验内容完整性（BEGIN:VCALENDAR / END:VCALENDAR / 至少一个 VEVENT）。
         2. 保存时采用原子写入（先写入临时文件再替换）。
         3. 如果远端数据无效但本地有缓存，使用本地并提示；如果本地也没有缓存则报错并返回。
+        offline=True 时只读本地缓存（托盘模式下由后台刷新负责联网）。
         """
-        ics_url = self.config.get("ics_url")
+        if offline:
+            data = self.cache_store.active_text() or read_cached_ics(resource_path(ICS_CACHE_PATH))
+            if data:
+                # 本地缓存解析失败时退回正常的联网流程
+                self.ingest(data, update_snapshot=not self.cache_store.pinned, fallback=self.load_ics_and_refresh)
+                return
+            # 本地没有可用缓存：退回正常的联网流程
+
         data = None
         cache_path = resource_path(ICS_CACHE_PATH)
         cache_dir = os.path.dirname(cache_path) or "."
@@ -470,17 +619,16 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # 1) 尝试请求远端 ICS
         try:
-            resp = requests.get(ics_url, timeout=10)
-            resp.raise_for_status()
-            candidate = resp.text
-
-            # 简单的完整性校验 —— 确保是一个 calendar 且至少有一个 VEVENT
-            text_lower = candidate.upper()
-            valid = ("BEGIN:VCALENDAR" in text_lower) and ("END:VCALENDAR" in text_lower) and ("BEGIN:VEVENT" in text_lower)
-
-            if not valid:
-                # 远端返回但内容看起来不完整 -> 不覆盖本地缓存
-                raise ValueError("远端 ICS 内容校验失败（不包含 BEGIN:VCALENDAR/END:VCALENDAR/BEGIN:VEVENT）")
+            # 多镜像竞速：第一个通过完整性校验（BEGIN:VCALENDAR/END:VCALENDAR/BEGIN:VEVENT）的响应胜出
+            try:
+                result = race_fetch(mirror_urls(self.config), is_valid_ics, timeout=10, health=self.mirror_health)
+            except MirrorsExhausted as race_exc:
+                if race_exc.all_invalid:
+                    # 远端返回但内容看起来不完整 -> 不覆盖本地缓存
+                    raise ValueError("远端 ICS 内容校验失败（不包含 BEGIN:VCALENDAR/END:VCALENDAR/BEGIN:VEVENT）")
+                raise
+            candidate = result.text
+            print(f"✅ 镜像 {result.url} 胜出（{result.latency:.2f}s）")
 
             # 远端 ICS 看起来有效，保存到本地（原子写入）
             try:
@@ -493,6 +641,10 @@ class MainWindow(QtWidgets.QMainWindow):
                 print(f"✅ 已更新本地 ICS 缓存: {cache_path}")
                 self.show_message("已成功更新假期数据（使用远端 ICS）", duration=4000)
                 data = candidate
+                try:
+                    self.cache_store.put(candidate, etag=result.etag)
+                except OSError as store_exc:
+                    print(f"⚠️ 写入 ICS 版本库失败: {store_exc}")
             except Exception as save_exc:
                 # 保存失败：回退到本地缓存（如果存在）
                 print(f"⚠️ 保存本地 ICS 失败: {save_exc}")
@@ -544,23 +696,172 @@ class MainWindow(QtWidgets.QMainWindow):
             # 恢复按钮文本（如果未提前 return）
             self.refresh_btn.setText("刷新 ICS")
 
+        # 数据版本被手动固定（回滚）时，始终使用固定的版本
+        pinned = self.cache_store.pinned_text()
+        if pinned is not None:
+            data = pinned
+
         # 2) 解析 data 并刷新 UI
         if data:
+            self.ingest(data, update_snapshot=pinned is None)
+
+    # ===========================
+    #  ICS -> 假期列表
+    # ===========================
+    def ingest(self, data: str, update_snapshot: bool = True, done_message: str = None, fallback=None):
+        """
+        应用一份 ICS 文本：快照命中时立即应用；否则在后台线程解析（自带数据串行解析约 1.3s），
+        完成后经 holidays_parsed 信号回到 GUI 线程应用，期间界面保持上一份数据。
+        done_message: 应用后在状态栏显示的提示
+        fallback: 解析失败时在 GUI 线程调用（不传则弹出错误提示）
+        """
+        self._ingest_generation += 1
+        generation = self._ingest_generation
+        self._ingest_done = (done_message, fallback)
+
+        try:
+            cached = self.cached_holidays(data)
+        except Exception as snap_exc:
+            print(f"⚠️ 读取假期快照失败，改为重新解析：{snap_exc}")
+            cached = None
+        if cached is not None:
+            self.on_holidays_parsed(generation, cached, None)
+            return
+
+        def worker():
             try:
-                holidays = parse_ics(data)
-                holidays = merge_and_filter_holidays(holidays)
-                self.holidays = holidays
-                self.refresh_list()
-                self.refresh_stats()
+                holidays, error = self.parse_holidays(data, update_snapshot), None
             except Exception as parse_exc:
-                print(f"⚠️ 解析 ICS 失败：{parse_exc}")
-                self.notify("错误", f"解析假期数据失败：{parse_exc}")
+                holidays, error = None, parse_exc
+            try:
+                self.holidays_parsed.emit(generation, holidays, error)
+            except RuntimeError:
+                # 窗口已销毁
+                pass
+
+        self.refresh_btn.setText("正在解析假期数据...")
+        self._ingest_thread = threading.Thread(target=worker, name="ics-ingest", daemon=True)
+        self._ingest_thread.start()
+
+    def on_holidays_parsed(self, generation: int, holidays, error):
+        if generation != self._ingest_generation:
+            # 之后又有新的数据被应用 / 正在解析，丢弃过时的结果
+            return
+        self.refresh_btn.setText("刷新 ICS")
+        done_message, fallback = self._ingest_done
+        if error is None:
+            try:
+                self.apply_holidays(holidays)
+            except Exception as apply_exc:
+                error = apply_exc
+        if error is not None:
+            print(f"⚠️ 解析 ICS 失败：{error}")
+            if fallback is not None:
+                fallback()
+            else:
+                self.notify("错误", f"解析假期数据失败：{error}")
+            return
+        if done_message:
+            self.show_message(done_message, duration=4000)
+
+    def ingest_busy(self) -> bool:
+        return self._ingest_thread is not None and self._ingest_thread.is_alive()
+
+    def wait_ingest(self, timeout: float = None) -> bool:
+        """等待后台解析结束并把结果投递到界面（模拟 / 测试脚本用）；超时返回 False"""
+        if self._ingest_thread is not None:
+            self._ingest_thread.join(timeout)
+            if self._ingest_thread.is_alive():
+                return False
+        QtCore.QCoreApplication.sendPostedEvents()
+        return True
+
+    def cached_holidays(self, data: str):
+        """
+        与预编译快照同源（哈希一致）时直接从快照还原假期列表（含今年已结束的假期），不解析 ICS；
+        未命中（或配置了额外 ICS）时返回 None。
+        """
+        if self.config.get("extra_ics_paths"):
+            return None
+        snapshot_path = user_data_path(SNAPSHOT_PATH)
+        bundled_path = resource_path(SNAPSHOT_PATH)
+        digest = source_digest(data)
+        paths = [snapshot_path] if bundled_path == snapshot_path else [snapshot_path, bundled_path]
+        for snapshot in (self.cache_store.get_snapshot(digest), *map(load_snapshot, paths)):
+            if snapshot_matches(snapshot, data):
+                return snapshot_holidays(snapshot, today=localize(self.clock.now()).date(), keep_ended=True)
+        return None
+
+    def parse_holidays(self, data: str, update_snapshot: bool = True) -> List[Holiday]:
+        """
+        解析 ICS 并重新生成快照，下次启动即可命中（在后台线程中运行，不碰界面）。
+        重新生成的快照写到用户数据目录（打包后的资源目录只读），随包附带的快照只读取。
+        update_snapshot=False 时（回滚到旧版本）只把快照挂到版本库里该版本上，不覆盖全局快照。
+        """
+        extra_paths = self.config.get("extra_ics_paths")
+        holidays = parse_ics_parallel(data, clock=self.clock)
+        # 额外的本地 ICS 文件 / 目录（未变化的文件由索引直接复用）
+        if extra_paths:
+            holidays += parse_ics_files(extra_paths, index_path=user_data_path(ICS_INDEX_PATH), clock=self.clock)
+        holidays = merge_and_filter_holidays(holidays, clock=self.clock, keep_ended=True)
+
+        if not extra_paths:
+            try:
+                snapshot = build_snapshot(data, holidays=holidays, clock=self.clock)
+                if update_snapshot:
+                    save_snapshot(snapshot, user_data_path(SNAPSHOT_PATH))
+                self.cache_store.attach_snapshot(source_digest(data), snapshot)
+            except OSError as snap_exc:
+                print(f"⚠️ 保存假期快照失败：{snap_exc}")
+        return holidays
+
+    def populate_version_menu(self):
+        """托盘“数据版本”子菜单：列出缓存中的各版本，勾选当前激活版本"""
+        self.version_menu.clear()
+        versions = self.cache_store.versions()
+        if not versions:
+            self.version_menu.addAction("（暂无缓存版本）").setEnabled(False)
+            return
+        for i, v in enumerate(versions):
+            # 旧索引里是无时区的时间，新记录带 +08:00，显示时统一去掉偏移
+            label = f"{datetime.fromisoformat(v['fetched_at']):%Y-%m-%d %H:%M:%S}  {v['sha256'][:8]}"
+            if i == 0:
+                label += "（最新）"
+            action = self.version_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(v["sha256"] == self.cache_store.active)
+            action.triggered.connect(lambda _, sha=v["sha256"]: self.activate_data_version(sha))
+
+    def activate_data_version(self, sha: str):
+        """切换到缓存中的某个版本；有快照时不重新解析，也不需要联网"""
+        if sha == self.cache_store.active:
+            # 已是当前版本：数据不变，不重新应用也不改写快照
+            return
+        if not self.cache_store.activate(sha):
+            return
+        data = self.cache_store.get_text(sha)
+        if not data:
+            self.notify("错误", "该版本的缓存文件已丢失。")
+            return
+        self.ingest(data, update_snapshot=not self.cache_store.pinned,
+                    done_message=f"已切换到数据版本 {sha[:8]}")
+
+    def apply_holidays(self, holidays: List[Holiday]):
+        self.service.set_holidays(holidays)
+        self.zone_countdown.prepare([h.begin for h in self.service.holidays()])
+        self._zone_holiday = None
+        self.rebuild_offwork_schedule()
+        self.tray_badge.update()
+        self.refresh_list()
+        self.refresh_calendar()
+        self.populate_stats_ranges()
+        self.refresh_stats()
 
     def refresh_list(self):
         self.clear_list()
         self.items = []
         flag_head = False
-        for h in self.holidays:
+        for h in self.service.upcoming():
             if not flag_head:
                 item = HolidayItemWidget(MainWindow.HOLIDAY_HAED)
                 self.items.append(item)
@@ -571,45 +872,124 @@ class MainWindow(QtWidgets.QMainWindow):
             self.list_layout.addWidget(item)
         self.list_layout.addStretch()
 
+    def refresh_calendar(self):
+        """
+        数据变化时更新热力图（内部比较日期类型表，未变化不会重画）。
+        只在首次有数据或跨年时滚动到今年，整点刷新不打断用户的滚动位置。
+        """
+        self.calendar_heatmap.set_holidays(self.service.holidays())
+        self.calendar_heatmap.set_today(localize(self.clock.now()).date())
+        self.scroll_calendar_to_today()
+
+    def scroll_calendar_to_today(self):
+        year = localize(self.clock.now()).year
+        if year == self._calendar_year or year not in self.calendar_heatmap.years:
+            return
+        top = self.calendar_heatmap.year_top(year)
+        bar = self.calendar_scroll.verticalScrollBar()
+        if bar.maximum() < top and bar.maximum() == 0:
+            return      # 尚未布局
+        self._calendar_year = year
+        bar.setValue(top)
+
+    def populate_stats_ranges(self):
+        """根据统计索引覆盖的年份重建统计范围下拉框，尽量保留当前选择"""
+        current = self.stats_range_combo.currentData()
+        self.stats_range_combo.blockSignals(True)
+        self.stats_range_combo.clear()
+        self.stats_range_combo.addItem("全部", "all")
+        self.stats_range_combo.addItem("本月", "month")
+        self.stats_range_combo.addItem("本季度", "quarter")
+        for year in self.service.years():
+            self.stats_range_combo.addItem(f"{year}年", f"year:{year}")
+        index = self.stats_range_combo.findData(current)
+        self.stats_range_combo.setCurrentIndex(max(index, 0))
+        self.stats_range_combo.blockSignals(False)
+
     def refresh_stats(self):
-        total, excl_makeup, excl_makeup_weekend = compute_smart_holiday_days(self.holidays)
+        scope = self.stats_range_combo.currentData() or "all"
+        today = self.clock.now()
+        if scope == "month":
+            result = self.service.stats(today.year, month=today.month)
+        elif scope == "quarter":
+            result = self.service.stats(today.year, quarter=(today.month - 1) // 3 + 1)
+        elif scope.startswith("year:"):
+            result = self.service.stats(int(scope.split(":")[1]))
+        else:
+            result = self.service.stats()
+        total, excl_makeup, excl_makeup_weekend = result
         self.total_label.setText(f"总天数: {total}")
         self.excl_makeup_label.setText(f"排除调休: {excl_makeup}")
         self.excl_makeup_weekend_label.setText(f"排除调休和双休: {excl_makeup_weekend}")
 
+    def update_zone_countdown(self, now):
+        """多时区展示：只在目标假期变化时重算各时区墙上时间，每秒只做一次减法"""
+        zc = self.zone_countdown
+        if not zc.zones:
+            return
+        remaining = zc.remaining(now)
+        if self._zone_holiday is None or remaining is None or remaining.total_seconds() <= 0:
+            self._zone_holiday = next(
+                (h for h, left in self.service.countdowns(now) if left.total_seconds() > 0), None)
+            zc.set_target(self._zone_holiday.begin if self._zone_holiday else None)
+            if self._zone_holiday is None:
+                self.zone_label.setText("")
+                return
+            parts = [f"{z.split('/')[-1]} {local:%m-%d %H:%M}" for z, local in zc.local_times]
+            self._zone_prefix = f"{self._zone_holiday.name}（上海）开始于：" + " · ".join(parts)
+            remaining = zc.remaining(now)
+
+        sec = int(remaining.total_seconds())
+        d, h, m, s = sec // 86400, (sec % 86400) // 3600, (sec % 3600) // 60, sec % 60
+        self.zone_label.setText(f"{self._zone_prefix} ｜ 还有 {d}天 {h:02d}:{m:02d}:{s:02d}")
+
     def update_countdowns(self):
-        now = datetime.now()
+        now = self.clock.now()
         for item in self.items:
             if item.holiday.flag_None:
                 continue
             item.update_countdown(now=now)
+        # 多时区倒计时用带时区的当前时刻，与本机所在时区无关
+        self.update_zone_countdown(self.clock.now(timezone.utc))
+        self.calendar_heatmap.set_today(localize(now).date())
 
-        try:
-            # === 中午下班倒计时 ===
-            hh, mm = map(int, self.config.get("offwork_mid_time", "12:00").split(":"))
-            mid_off = datetime.combine(datetime.today(), dt_time(hour=hh, minute=mm))
-            t_mid = time_until(mid_off, now=now)
-            if t_mid.total_seconds() <= 0:
-                self.mid_countdown_label.setText("中午下班倒计时：已过时间")
-            else:
-                sec = int(t_mid.total_seconds())
-                h, m, s = sec // 3600, (sec % 3600) // 60, sec % 60
-                self.mid_countdown_label.setText(f"中午下班倒计时：{h}时 {m}分 {s}秒")
-
-            # === 晚上下班倒计时 ===
-            hh, mm = map(int, self.config.get("offwork_time", "18:00").split(":"))
-            night_off = datetime.combine(datetime.today(), dt_time(hour=hh, minute=mm))
-            t_night = time_until(night_off, now=now)
-            if t_night.total_seconds() <= 0:
-                self.night_countdown_label.setText("晚上下班倒计时：已过时间")
-            else:
-                sec = int(t_night.total_seconds())
-                h, m, s = sec // 3600, (sec % 3600) // 60, sec % 60
-                self.night_countdown_label.setText(f"晚上下班倒计时：{h}时 {m}分 {s}秒")
-
-        except Exception:
+        # === 中午 / 晚上下班倒计时：只与预计算的时刻表表头比较 ===
+        if self.offwork_table is None:
             self.mid_countdown_label.setText("中午下班倒计时：格式错误")
             self.night_countdown_label.setText("晚上下班倒计时：格式错误")
+            return
+        now_local = localize(now)
+        self.mid_countdown_label.setText(
+            self.format_offwork("中午下班", self.offwork_table.next("mid", now_local), now_local))
+        self.night_countdown_label.setText(
+            self.format_offwork("晚上下班", self.offwork_table.next("night", now_local), now_local))
+
+    @staticmethod
+    def format_offwork(title: str, target, now) -> str:
+        if target is None:
+            return f"{title}：近期无需上班"
+        sec = int(time_until(target, now=now).total_seconds())
+        if target.date() == now.date():
+            h, m, s = sec // 3600, (sec % 3600) // 60, sec % 60
+            return f"{title}倒计时：{h}时 {m}分 {s}秒"
+        d, h, m = sec // 86400, (sec % 86400) // 3600, (sec % 3600) // 60
+        weekday = "一二三四五六日"[target.weekday()]
+        return f"{title}：下次 {target:%m-%d} 周{weekday} {target:%H:%M}（{d}天 {h}时 {m}分）"
+
+    def rebuild_offwork_schedule(self):
+        """数据或配置变化时重建下班时刻表；配置有误时置空，界面显示格式错误"""
+        try:
+            schedule = OffworkSchedule(self.config, self.service.holidays())
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ 下班时间配置有误：{e}")
+            self.offwork_table = None
+        else:
+            if self.offwork_table is None:
+                self.offwork_table = OffworkTable(schedule)
+            else:
+                self.offwork_table.invalidate(schedule)
+        if self.tray_badge is not None:
+            self.tray_badge.set_offwork_table(self.offwork_table)
 
     def apply_offwork_time(self, which="both"):
         try:
@@ -630,6 +1010,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             if changed:
                 self.save_config()
+                self.rebuild_offwork_schedule()
                 self.show_message("配置已保存")
         except Exception:
             self.notify("错误", "时间格式应为 HH:MM（24 小时）")
@@ -637,10 +1018,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def show_status_message(self, msg: str, duration: int = 2000):
         """在状态栏显示短暂提示（自动淡出）"""
-        label = QtWidgets.QLabel(msg)
-        self.status_bar.addWidget(label)
-        self.status_bar.showMessage(msg)
-
-        # 使用 QTimer 延时清空
-        QtCore.QTimer.singleShot(duration, lambda: self.status_bar.clearMessage())
+        # 不再每次 addWidget 一个 QLabel（常驻数周会一直累积），直接用带超时的临时消息
+        self.status_bar.showMessage(msg, duration)
 
@@ -0,0 +1,134 @@
+# ui/tray_badge.py
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from PyQt6 import QtWidgets, QtGui, QtCore
+
+from holidays.timezones import localize
+
+# 即使没有任何变化，也至少每隔这么久重新核对一次（应对休眠 / 改系统时间）
+MAX_WAIT_MS = 60 * 60 * 1000
+ICON_SIZE = 64
+# 图标缓存上限：天数每天只变一次，常驻数月时不必保留所有出现过的数字
+ICON_CACHE_SIZE = 8
+
+
+class TrayBadge(QtCore.QObject):
+    """
+    把“距下一个假期的天数”画进托盘图标，tooltip 里写明假期名（可选附带下班倒计时）。
+    - 每个显示值只渲染一次 QPixmap，之后从缓存取（最近用过的几个值，LRU）
+    - 只有显示的数字真的变了才调用 setIcon / setToolTip
+    - 不挂在 1 秒定时器上：算出下一次显示会变化的时刻，用单次定时器等到那时
+    """
+
+    def __init__(self, tray: QtWidgets.QSystemTrayIcon, service, base_icon: QtGui.QIcon,
+                 show_offwork: bool = False, parent=None):
+        """service: HolidayService，下一个假期从它查询；数据变化后调用 update()"""
+        super().__init__(parent)
+        self.tray = tray
+        self.service = service
+        self.clock = service.clock
+        self.base_icon = base_icon
+        self.show_offwork = show_offwork
+        self.offwork_table = None
+
+        self._icons: "OrderedDict[str, QtGui.QIcon]" = OrderedDict()
+        self._shown_text: Optional[str] = None
+        self._shown_tooltip: Optional[str] = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.update)
+
+    def set_offwork_table(self, table):
+        self.offwork_table = table
+        self.update()
+
+    # ===========================
+    #  计算显示内容与下一次变化时刻
+    # ===========================
+    def compute(self, now: datetime) -> Tuple[Optional[str], str, Optional[datetime]]:
+        """返回 (图标文字, tooltip, 下一次需要更新的时刻)"""
+        text, tooltip, deadline = None, "节假日倒计时", None
+
+        h = self.service.next_holiday(now)
+        if h is not None:
+            if h.begin <= now:
+                text = "休"
+                tooltip = f"{h.name} 假期中（至 {h.end:%m-%d}）"
+                deadline = h.end + timedelta(seconds=1)
+            else:
+                remaining = h.begin - now
+                days = remaining.days
+                text = str(days) if days < 1000 else "999"
+                tooltip = f"距 {h.name} 还有 {days} 天（{h.begin:%m-%d}）"
+                # remaining 小于 days 天时显示值减一
+                deadline = h.begin - timedelta(days=days)
+                if deadline <= now:
+                    deadline = h.begin
+
+        if self.show_offwork and self.offwork_table is not None:
+            target = self.offwork_table.next("night", now)
+            if target is not None:
+                minutes = int((target - now).total_seconds() // 60)
+                tooltip += f"\n下班还有 {minutes // 60}时 {minutes % 60}分"
+                # 分钟数下一次变化的时刻
+                minute_change = target - timedelta(minutes=minutes)
+                if minute_change <= now:
+                    minute_change = now + timedelta(minutes=1)
+                deadline = minute_change if deadline is None else min(deadline, minute_change)
+
+        return text, tooltip, deadline
+
+    def update(self):
+        now = localize(self.clock.now())
+        text, tooltip, deadline = self.compute(now)
+
+        if text != self._shown_text:
+            self.tray.setIcon(self.icon_for(text))
+            self._shown_text = text
+        if tooltip != self._shown_tooltip:
+            self.tray.setToolTip(tooltip)
+            self._shown_tooltip = tooltip
+
+        wait_ms = MAX_WAIT_MS
+        if deadline is not None:
+            wait_ms = min(wait_ms, max(0, int((deadline - now).total_seconds() * 1000)) + 50)
+        self._timer.start(wait_ms)
+
+    # ===========================
+    #  渲染（按显示值缓存）
+    # ===========================
+    def icon_for(self, text: Optional[str]) -> QtGui.QIcon:
+        if text is None:
+            return self.base_icon
+        icon = self._icons.get(text)
+        if icon is None:
+            icon = QtGui.QIcon(self.render(text))
+            self._icons[text] = icon
+            if len(self._icons) > ICON_CACHE_SIZE:
+                self._icons.popitem(last=False)
+        else:
+            self._icons.move_to_end(text)
+        return icon
+
+    @staticmethod
+    def render(text: str) -> QtGui.QPixmap:
+        pix = QtGui.QPixmap(ICON_SIZE, ICON_SIZE)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+
+        painter = QtGui.QPainter(pix)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(QtGui.QColor("#e8590c"))
+        painter.drawRoundedRect(2, 2, ICON_SIZE - 4, ICON_SIZE - 4, 12, 12)
+
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setPixelSize({1: 44, 2: 38}.get(len(text), 28))
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor("white"))
+        painter.drawText(pix.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pix
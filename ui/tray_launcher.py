@@ -0,0 +1,119 @@
+# ui/tray_launcher.py
+"""
+仅托盘模式（开机自启使用）：启动时只创建托盘图标和菜单，
+主窗口在第一次需要显示时才构建；首次联网刷新推迟一个随机的启动宽限期，
+避开登录时最忙的那段时间。
+"""
+import json
+import os
+import random
+import threading
+
+from PyQt6 import QtWidgets, QtGui, QtCore
+
+from utils.paths import resource_path, user_data_path
+
+CONFIG_PATH = "config.json"
+ICON_PATH = "icon.ico"
+ICS_CACHE_PATH = "holiday_data.ics"
+ICS_STORE_DIR = "ics_cache"
+MIRROR_HEALTH_PATH = "mirror_health.json"
+
+# 首次刷新的随机延迟范围（秒）
+STARTUP_GRACE_SECONDS = (30, 120)
+
+
+class TrayLauncher(QtCore.QObject):
+    def __init__(self, config_path=CONFIG_PATH, grace_seconds=STARTUP_GRACE_SECONDS):
+        super().__init__()
+        self.config_path = config_path
+        self.config = self.load_config()
+        self.window = None
+        # 版本库与镜像健康度只建一份：后台刷新线程和之后构建的主窗口共用（内部加锁）
+        self._cache_store = None
+        self._mirror_health = None
+
+        self.tray = QtWidgets.QSystemTrayIcon()
+        icon = QtGui.QIcon(resource_path(ICON_PATH))
+        if icon.isNull():
+            pix = QtGui.QPixmap(32, 32)
+            pix.fill(QtGui.QColor("orange"))
+            icon = QtGui.QIcon(pix)
+        self.tray.setIcon(icon)
+        self.tray.setToolTip("节假日倒计时")
+
+        self.menu = QtWidgets.QMenu()
+        show_action = self.menu.addAction("显示主界面")
+        show_action.triggered.connect(self.show_window)
+        exit_action = self.menu.addAction("退出")
+        exit_action.triggered.connect(QtWidgets.QApplication.quit)
+        self.tray.setContextMenu(self.menu)
+        self.tray.activated.connect(self.on_tray_activated)
+        self.tray.show()
+
+        # 首次刷新推迟随机宽限期，之后按配置间隔刷新（直到主窗口接管）
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_in_background)
+        delay_ms = int(random.uniform(*grace_seconds) * 1000)
+        QtCore.QTimer.singleShot(delay_ms, self.start_refreshing)
+
+    def load_config(self):
+        path = resource_path(self.config_path)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 读取配置失败：{e}")
+            return {}
+
+    def shared_state(self):
+        """(IcsCacheStore, MirrorHealth)，在 GUI 线程中首次用到时创建"""
+        if self._cache_store is None:
+            from holidays.cache_store import IcsCacheStore
+            from holidays.mirrors import MirrorHealth
+
+            self._cache_store = IcsCacheStore(
+                user_data_path(ICS_STORE_DIR),
+                max_versions=int(self.config.get("ics_cache_versions", 10)),
+                max_bytes=int(self.config.get("ics_cache_max_kb", 2048)) * 1024,
+            )
+            self._mirror_health = MirrorHealth(user_data_path(MIRROR_HEALTH_PATH))
+        return self._cache_store, self._mirror_health
+
+    def start_refreshing(self):
+        if self.window is not None:
+            return
+        self.refresh_in_background()
+        interval_ms = int(self.config.get("refresh_interval_minutes", 60)) * 60 * 1000
+        self.refresh_timer.start(interval_ms)
+
+    def refresh_in_background(self):
+        """在后台线程中下载 ICS 并写入缓存，不阻塞事件循环，也不构建任何界面"""
+        if self.window is not None:
+            return
+
+        from holidays.fetcher import mirror_urls, refresh_cache
+
+        store, health = self.shared_state()
+
+        def worker():
+            refresh_cache(mirror_urls(self.config), resource_path(ICS_CACHE_PATH), store=store, health=health)
+
+        threading.Thread(target=worker, name="ics-refresh", daemon=True).start()
+
+    def on_tray_activated(self, reason):
+        if reason == QtWidgets.QSystemTrayIcon.ActivationReason.Trigger:
+            self.show_window()
+
+    def show_window(self):
+        """第一次显示时才导入并构建主窗口，托盘图标交给主窗口继续使用"""
+        if self.window is None:
+            from ui.main_window import MainWindow
+
+            self.refresh_timer.stop()
+            self.tray.activated.disconnect(self.on_tray_activated)
+            store, health = self.shared_state()
+            self.window = MainWindow(tray=self.tray, offline_first=True, cache_store=store, mirror_health=health)
+        self.window.show_and_raise()
@@ -3,29 +3,55 @@ import sys
 import os
 import platform
 
-def enable_autostart(app_name: str, script_path: str) -> bool:
+def app_entry() -> str:
+    """当前程序的入口：打包后为 exe 本身，源码运行时为 main.py"""
+    if getattr(sys, "frozen", False):
+        return sys.executable
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+def _entry_path(app_name: str) -> str:
+    """各平台启动项文件的位置（不支持的平台返回空字符串）"""
+    system = platform.system()
+    if system == "Windows":
+        startup = os.path.join(os.environ.get("APPDATA", ""), "Microsoft", "Windows", "Start Menu", "Programs", "Startup")
+        return os.path.join(startup, f"start_{app_name}.bat")
+    if system == "Linux":
+        return os.path.join(os.path.expanduser("~/.config/autostart"), f"{app_name}.desktop")
+    return ""
+
+def launch_command(script_path: str, tray_only: bool = True, python: str = "python") -> str:
+    """
+    启动命令行：打包后的 exe 直接运行，源码用 python 运行。
+    tray_only=True 时追加 --tray，开机只创建托盘图标，主窗口按需构建。
+    """
+    if script_path.lower().endswith(".exe"):
+        cmd = f'"{script_path}"'
+    else:
+        cmd = f'{python} "{script_path}"'
+    return cmd + (" --tray" if tray_only else "")
+
+def enable_autostart(app_name: str, script_path: str, tray_only: bool = True) -> bool:
     """
     尝试启用开机自启。实现会根据平台写入启动项或给出指示。
     注意：写系统启动项通常需要权限；这里尽量自动化但也提供回退说明。
+    默认以仅托盘模式启动（见 ui/tray_launcher.py）。
     Returns True if operation succeeded (best-effort).
     """
     system = platform.system()
     try:
         if system == "Windows":
             # create a shortcut in the Startup folder
-            startup = os.path.join(os.environ["APPDATA"], "Microsoft", "Windows", "Start Menu", "Programs", "Startup")
             # create a .lnk requires pywin32; as fallback, create a .bat
-            bat_path = os.path.join(startup, f"start_{app_name}.bat")
+            bat_path = _entry_path(app_name)
             with open(bat_path, "w", encoding="utf-8") as f:
-                f.write(f'python "{script_path}"\n')
+                f.write(launch_command(script_path, tray_only) + "\n")
             return True
         elif system == "Linux":
             # write a .desktop autostart entry
-            autostart_dir = os.path.expanduser("~/.config/autostart")
-            os.makedirs(autostart_dir, exist_ok=True)
-            desktop_file = os.path.join(autostart_dir, f"{app_name}.desktop")
+            desktop_file = _entry_path(app_name)
+            os.makedirs(os.path.dirname(desktop_file), exist_ok=True)
             with open(desktop_file, "w", encoding="utf-8") as f:
-                f.write(f"[Desktop Entry]\nType=Application\nExec=python3 {script_path}\nHidden=false\nNoDisplay=false\nX-GNOME-Autostart-enabled=true\nName={app_name}\n")
+                f.write(f"[Desktop Entry]\nType=Application\nExec={launch_command(script_path, tray_only, python='python3')}\nHidden=false\nNoDisplay=false\nX-GNOME-Autostart-enabled=true\nName={app_name}\n")
             return True
         elif system == "Darwin":
             # macOS: instruct user to create a LaunchAgent plist or use osascript to register
@@ -38,5 +64,16 @@ def enable_autostart(app_name: str, script_path: str) -> bool:
         return False
 
 def disable_autostart(app_name: str) -> bool:
-    # implement reverse actions if desired
-    return True
+    """删除 enable_autostart 写入的启动项；本来就没有时也算成功"""
+    path = _entry_path(app_name)
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+        return True
+    except OSError as e:
+        print("autostart disable failed:", e)
+        return False
+
+def is_autostart_enabled(app_name: str) -> bool:
+    path = _entry_path(app_name)
+    return bool(path) and os.path.exists(path)
@@ -0,0 +1,396 @@
+# utils/faultnet.py
+"""
+网络故障注入：本地假 ICS 服务器 + 刷新路径场景测试。
+
+服务器可配置 延迟 / 带宽 / 中途断开 / 错误编码 / 状态码 / 超大响应；
+场景测试对每种故障驱动一次 MainWindow.load_ics_and_refresh()，记录
+端到端刷新耗时、刷新期间事件循环的最大卡顿、是否正确回退到本地缓存、
+传输字节数以及弹出的托盘气泡数。
+
+    python -m utils.faultnet                       # 跑全部场景
+    python -m utils.faultnet --only slow_body gbk_body
+    python -m utils.faultnet serve --latency 2 --status 503   # 只起服务器，手动把 ics_url 指过来
+
+与 utils.simulate 共用 headless_window：offscreen 平台、临时工作目录，不会改动真实的配置与缓存。
+"""
+import argparse
+import hashlib
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+REMOTE = "remote"
+CACHE = "cache"
+
+
+# ===========================
+#  故障配置
+# ===========================
+@dataclass
+class Fault:
+    status: int = 200
+    latency: float = 0.0                  # 发出响应头之前等待的秒数
+    bandwidth: Optional[int] = None       # 字节/秒，None 为不限速
+    truncate_at: Optional[int] = None     # 发送到该字节数后直接断开连接
+    encoding: str = "utf-8"               # 响应体实际使用的编码
+    charset: Optional[str] = "utf-8"      # Content-Type 中声明的 charset，None 为不声明
+    content_type: str = "text/calendar"
+    chunked: bool = False                 # 使用分块传输（不发 Content-Length）
+    pad_to: Optional[int] = None          # 用注释行把响应体填充到该字节数
+    body: Optional[str] = None            # 替换整个响应体（如运营商劫持页）
+    bom: bool = False
+
+
+@dataclass
+class Scenario:
+    name: str
+    fault: Fault
+    expect: str                           # REMOTE：应采用远端数据；CACHE：应保留并使用本地缓存
+    note: str = ""
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("ok", Fault(), REMOTE, "正常响应"),
+    Scenario("slow_headers", Fault(latency=2.0), REMOTE, "响应头延迟 2s"),
+    Scenario("slow_body", Fault(bandwidth=16 * 1024), REMOTE, "16KB/s 慢速下载"),
+    Scenario("utf8_bom", Fault(bom=True), REMOTE, "UTF-8 带 BOM"),
+    Scenario("truncated", Fault(truncate_at=4096), CACHE, "Content-Length 完整但 4KB 后断开"),
+    Scenario("truncated_chunked", Fault(truncate_at=4096, chunked=True), CACHE, "分块传输 4KB 后断开"),
+    Scenario("oversized", Fault(pad_to=12 * 1024 * 1024), CACHE, "12MB 响应体"),
+    Scenario("gbk_body", Fault(encoding="gbk"), CACHE, "声明 UTF-8，实际 GBK"),
+    Scenario("gbk_no_charset", Fault(encoding="gbk", charset=None), CACHE, "未声明 charset，实际 GBK"),
+    Scenario("captive_portal", Fault(content_type="text/html",
+                                     body="<html><body>请先登录 Wi-Fi</body></html>"), CACHE, "返回 HTML 登录页"),
+    Scenario("status_404", Fault(status=404), CACHE),
+    Scenario("status_500", Fault(status=500), CACHE),
+    Scenario("status_503", Fault(status=503), CACHE),
+    Scenario("hang", Fault(latency=15.0), CACHE, "响应头迟迟不来（超过 10s 超时）"),
+]
+
+
+# ===========================
+#  假 ICS 服务器
+# ===========================
+class FaultServer:
+    """在 127.0.0.1 随机端口上提供 ICS，按当前 Fault 注入故障；统计请求数与实际发出的字节数"""
+
+    def __init__(self, ics_text: str, fault: Optional[Fault] = None, port: int = 0):
+        self.ics_text = ics_text
+        self.fault = fault or Fault()
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}/holidayCal.ics"
+
+    def start(self) -> "FaultServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fault-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def set_fault(self, fault: Fault):
+        with self._lock:
+            self.fault = fault
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def _count(self, n: int):
+        with self._lock:
+            self.bytes_sent += n
+
+    def render(self, fault: Fault) -> bytes:
+        text = fault.body if fault.body is not None else self.ics_text
+        if fault.pad_to:
+            pad_line = "X-PADDING:" + "x" * 990 + "\r\n"
+            missing = max(fault.pad_to - len(text.encode(fault.encoding)), 0)
+            text = text.replace("BEGIN:VCALENDAR", "BEGIN:VCALENDAR\r\n" + pad_line * (missing // len(pad_line) + 1), 1)
+        body = text.encode(fault.encoding)
+        if fault.bom:
+            body = b"\xef\xbb\xbf" + body
+        return body
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    fault = server.fault
+                    server.requests += 1
+                if fault.latency:
+                    time.sleep(fault.latency)
+
+                body = server.render(fault) if fault.status == 200 else f"HTTP {fault.status}".encode()
+                content_type = fault.content_type
+                if fault.charset:
+                    content_type += f"; charset={fault.charset}"
+                try:
+                    self.send_response(fault.status)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("ETag", '"%s"' % hashlib.sha256(body).hexdigest()[:16])
+                    if fault.chunked:
+                        self.send_header("Transfer-Encoding", "chunked")
+                    else:
+                        self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self._send_body(fault, body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # 客户端取消（竞速输掉 / 超过大小上限）
+                    pass
+
+            def _send_body(self, fault: Fault, body: bytes):
+                limit = len(body) if fault.truncate_at is None else min(fault.truncate_at, len(body))
+                step = 4096
+                sent = 0
+                while sent < limit:
+                    chunk = body[sent:min(sent + step, limit)]
+                    if fault.chunked:
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    else:
+                        self.wfile.write(chunk)
+                    self.wfile.flush()
+                    sent += len(chunk)
+                    server._count(len(chunk))
+                    if fault.bandwidth:
+                        time.sleep(len(chunk) / fault.bandwidth)
+                if fault.truncate_at is not None:
+                    # 不发结束块 / 不补齐 Content-Length，直接断开
+                    self.close_connection = True
+                    self.connection.shutdown(2)
+                    return
+                if fault.chunked:
+                    self.wfile.write(b"0\r\n\r\n")
+
+        return Handler
+
+
+# ===========================
+#  场景测试
+# ===========================
+@dataclass
+class ScenarioResult:
+    scenario: Scenario
+    latency: float = 0.0          # 刷新调用的端到端耗时（秒）
+    max_lag: float = 0.0          # 刷新期间 10ms 定时器的最大迟到（秒）
+    outcome: str = ""             # 实际采用的数据：REMOTE / CACHE / "?"
+    bytes_sent: int = 0
+    requests: int = 0
+    balloons: int = 0
+    problems: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _drop_last_vevent(ics_text: str) -> str:
+    """本地缓存用一份少一个 VEVENT 的 ICS，便于区分最终用的是哪一份"""
+    cut = ics_text.rfind("BEGIN:VEVENT")
+    end = ics_text.find("END:VEVENT", cut)
+    if cut < 0 or end < 0:
+        return ics_text
+    return ics_text[:cut] + ics_text[end + len("END:VEVENT"):].lstrip("\r\n")
+
+
+def _measure_lag(app, action, busy=lambda: False, tick_ms: int = 10) -> float:
+    """
+    在事件循环里执行 action，直到 busy() 为假（后台解析结束），
+    返回期间 tick_ms 定时器两次触发间的最大迟到（秒）
+    """
+    from PyQt6 import QtCore
+
+    loop = QtCore.QEventLoop()
+    timer = QtCore.QTimer()
+    timer.setInterval(tick_ms)
+    last = [time.perf_counter()]
+    worst = [0.0]
+    started = [False]
+
+    def on_tick():
+        now = time.perf_counter()
+        worst[0] = max(worst[0], now - last[0] - tick_ms / 1000)
+        last[0] = now
+        if started[0] and not busy():
+            started[0] = False
+            QtCore.QTimer.singleShot(5 * tick_ms, loop.quit)
+
+    def run():
+        action()
+        started[0] = True
+
+    timer.timeout.connect(on_tick)
+    timer.start()
+    QtCore.QTimer.singleShot(2 * tick_ms, run)
+    loop.exec()
+    timer.stop()
+    return max(worst[0], 0.0)
+
+
+def run_scenarios(ics_path: str, scenarios: Optional[List[Scenario]] = None,
+                  now: Optional[datetime] = None) -> List[ScenarioResult]:
+    from holidays.clock import FixedClock, SystemClock
+
+    from .simulate import headless_window
+
+    with open(ics_path, "r", encoding="utf-8") as f:
+        remote_text = f.read()
+    cached_text = _drop_last_vevent(remote_text)
+
+    clock = FixedClock(now or SystemClock().now())
+    server = FaultServer(remote_text).start()
+    config = {"ics_url": server.url, "ics_mirrors": [server.url]}
+    results: List[ScenarioResult] = []
+    try:
+        for scenario in scenarios or SCENARIOS:
+            with headless_window(clock, cached_text, config, prefix="holiday-faultnet-") as (app, window, work_dir):
+                result = ScenarioResult(scenario)
+                balloons = []
+                window.notify = lambda title, text: balloons.append((title, text))
+
+                server.set_fault(scenario.fault)
+                t0 = [0.0]
+                elapsed = [0.0]
+
+                def refresh():
+                    t0[0] = time.perf_counter()
+                    window.load_ics_and_refresh()
+
+                def busy():
+                    # 端到端耗时算到后台解析结束为止
+                    if window.ingest_busy():
+                        return True
+                    elapsed[0] = elapsed[0] or time.perf_counter() - t0[0]
+                    return False
+
+                result.max_lag = _measure_lag(app, refresh, busy)
+                window.wait_ingest()
+                result.latency = elapsed[0]
+                result.bytes_sent = server.bytes_sent
+                result.requests = server.requests
+                result.balloons = len(balloons)
+
+                _check_outcome(window, work_dir, remote_text, cached_text, clock, result)
+            results.append(result)
+    finally:
+        server.stop()
+    return results
+
+
+def _expected_holidays(ics_text: str, clock) -> list:
+    """与界面相同的解析 + 合并流程，但不读写快照 / 缓存，不影响被测窗口的状态"""
+    from holidays.parser import parse_ics
+    from holidays.processor import merge_and_filter_holidays
+
+    return merge_and_filter_holidays(parse_ics(ics_text, clock=clock), clock=clock, keep_ended=True)
+
+
+def _check_outcome(window, work_dir: str, remote_text: str, cached_text: str, clock,
+                   result: ScenarioResult):
+    with open(os.path.join(work_dir, "holiday_data.ics"), "r", encoding="utf-8") as f:
+        on_disk = _sha(f.read())
+    if on_disk == _sha(remote_text):
+        result.outcome = REMOTE
+    elif on_disk == _sha(cached_text):
+        result.outcome = CACHE
+    else:
+        result.outcome = "?"
+        result.problems.append("本地缓存被写成了既不是远端也不是原缓存的内容")
+
+    expect = result.scenario.expect
+    if result.outcome in (REMOTE, CACHE) and result.outcome != expect:
+        result.problems.append(f"期望使用{'远端数据' if expect == REMOTE else '本地缓存'}，实际为 {result.outcome}")
+
+    # 界面上的假期应来自期望的那份数据
+    expected = _expected_holidays(remote_text if expect == REMOTE else cached_text, clock)
+    shown = [(h.name, h.begin) for h in window.service.holidays()]
+    if shown != [(h.name, h.begin) for h in expected]:
+        result.problems.append("界面显示的假期与期望的数据不一致")
+    if any("�" in h.name for h in window.service.holidays()):
+        result.problems.append("假期名称出现乱码（U+FFFD）")
+    if result.balloons > 1:
+        result.problems.append(f"一次刷新弹出了 {result.balloons} 个托盘气泡")
+
+
+def format_results(results: List[ScenarioResult]) -> str:
+    lines = [f"{'场景':<20}{'期望':<8}{'实际':<8}{'耗时':>8}{'最大卡顿':>10}{'字节':>12}{'请求':>6}{'气泡':>6}  结果"]
+    for r in results:
+        lines.append(
+            f"{r.scenario.name:<20}{r.scenario.expect:<8}{r.outcome:<8}"
+            f"{r.latency:>7.2f}s{r.max_lag * 1000:>8.0f}ms{r.bytes_sent:>12}{r.requests:>6}{r.balloons:>6}  "
+            + ("✓" if r.ok else "✗ " + "；".join(r.problems))
+        )
+    failed = sum(1 for r in results if not r.ok)
+    lines.append(f"共 {len(results)} 个场景，失败 {failed} 个")
+    return "\n".join(lines)
+
+
+def _serve(argv) -> int:
+    parser = argparse.ArgumentParser(description="启动注入故障的本地 ICS 服务器")
+    parser.add_argument("--ics", default="holiday_data.ics")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--status", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=int, default=None, help="字节/秒")
+    parser.add_argument("--truncate-at", type=int, default=None)
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--charset", default="utf-8", help="声明的 charset，传空字符串表示不声明")
+    parser.add_argument("--chunked", action="store_true")
+    parser.add_argument("--pad-to", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    with open(args.ics, "r", encoding="utf-8") as f:
+        ics_text = f.read()
+    fault = Fault(status=args.status, latency=args.latency, bandwidth=args.bandwidth,
+                  truncate_at=args.truncate_at, encoding=args.encoding, charset=args.charset or None,
+                  chunked=args.chunked, pad_to=args.pad_to)
+    server = FaultServer(ics_text, fault, port=args.port).start()
+    print(f"[faultnet] {server.url}  {fault}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "serve":
+        return _serve(argv[1:])
+
+    parser = argparse.ArgumentParser(description="刷新路径网络故障场景测试")
+    parser.add_argument("--ics", default="holiday_data.ics")
+    parser.add_argument("--only", nargs="*", default=None, help="只跑指定场景")
+    parser.add_argument("--now", default=None, help="固定当前时刻，如 2023-01-01T08:00（使 ICS 中的假期尚未过期）")
+    args = parser.parse_args(argv)
+
+    scenarios = [s for s in SCENARIOS if not args.only or s.name in args.only]
+    results = run_scenarios(os.path.abspath(args.ics), scenarios,
+                            now=datetime.fromisoformat(args.now) if args.now else None)
+    print(format_results(results))
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# utils/paths.py
+import os
+import sys
+
+APP_DIR_NAME = "HolidayCountdown"
+
+
+def resource_path(relative_path):
+    """获取打包后资源的正确路径"""
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+
+def user_data_dir():
+    """
+    程序运行时生成的文件（快照等）的可写目录。
+    源码运行时就是当前目录；打包后资源目录只读或为临时解压目录，改用：
+      Windows: %APPDATA%\\HolidayCountdown
+      其它:    $XDG_DATA_HOME/HolidayCountdown（默认 ~/.local/share/HolidayCountdown）
+    """
+    if not getattr(sys, "frozen", False) and not hasattr(sys, '_MEIPASS'):
+        return os.path.abspath(".")
+    if sys.platform.startswith("win"):
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def user_data_path(relative_path):
+    """user_data_dir 下的路径（目录不存在时创建）"""
+    base = user_data_dir()
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, relative_path)
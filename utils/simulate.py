@@ -0,0 +1,226 @@
+# utils/simulate.py
+"""
+加速时间模拟：用虚拟时钟驱动主窗口的每秒刷新（tick）与定时刷新（refresh），
+在几秒内回放数月的运行，记录每一步的耗时与输出异常。
+
+    python -m utils.simulate --start 2025-01-01 --days 365 --tick 600 --refresh 3600
+
+在无显示环境下自动使用 Qt offscreen 平台；全程离线，只读取给定的 ICS 文件，
+工作目录切到临时目录，不会改动真实的配置与缓存。
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+_COUNTDOWN_RE = re.compile(r"^(\d+)天 (\d+):(\d+):(\d+)$")
+_NEGATIVE_RE = re.compile(r"(^|[^\d])-\d")
+
+
+@dataclass
+class StepCost:
+    samples: List[float] = field(default_factory=list)   # 秒
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+
+    def summary(self) -> str:
+        if not self.samples:
+            return "n=0"
+        ordered = sorted(self.samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        mean = sum(ordered) / len(ordered)
+        return f"n={len(ordered)} mean={mean * 1000:.3f}ms p99={p99 * 1000:.3f}ms max={ordered[-1] * 1000:.3f}ms"
+
+
+@dataclass
+class SimulationReport:
+    start: datetime
+    end: datetime
+    tick: StepCost = field(default_factory=StepCost)
+    refresh: StepCost = field(default_factory=StepCost)
+    anomalies: List[Tuple[datetime, str, str]] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    def anomaly(self, at: datetime, kind: str, detail: str):
+        self.anomalies.append((at, kind, detail))
+
+    def summary(self) -> str:
+        lines = [
+            f"模拟区间: {self.start} -> {self.end}（实际耗时 {self.wall_seconds:.1f}s）",
+            f"tick:    {self.tick.summary()}",
+            f"refresh: {self.refresh.summary()}",
+            f"异常: {len(self.anomalies)}",
+        ]
+        for at, kind, detail in self.anomalies[:50]:
+            lines.append(f"  {at:%Y-%m-%d %H:%M:%S} [{kind}] {detail}")
+        if len(self.anomalies) > 50:
+            lines.append(f"  ...（其余 {len(self.anomalies) - 50} 条省略）")
+        return "\n".join(lines)
+
+
+def _parse_countdown(text: str) -> Optional[int]:
+    m = _COUNTDOWN_RE.match(text)
+    if not m:
+        return None
+    d, h, mi, s = map(int, m.groups())
+    return ((d * 24 + h) * 60 + mi) * 60 + s
+
+
+def _check_tick(window, now_local: datetime, last_remaining: Dict[str, int], report: SimulationReport):
+    """检查一次 tick 之后界面输出是否合理"""
+    for item in window.items:
+        if item.holiday.flag_None:
+            continue
+        text = item.countdown_label.text()
+        key = f"{item.holiday.name}@{item.holiday.begin:%Y-%m-%d}"
+        remaining = _parse_countdown(text)
+        if remaining is None:
+            if text != "进行中/已开始":
+                report.anomaly(now_local, "holiday-label", f"{key}: {text!r}")
+            continue
+        prev = last_remaining.get(key)
+        if prev is not None and remaining > prev:
+            report.anomaly(now_local, "countdown-increased", f"{key}: {prev}s -> {remaining}s")
+        last_remaining[key] = remaining
+
+    for slot, label in (("mid", window.mid_countdown_label), ("night", window.night_countdown_label)):
+        text = label.text()
+        if "格式错误" in text or "已过时间" in text or _NEGATIVE_RE.search(text):
+            report.anomaly(now_local, "offwork-label", text)
+        if window.offwork_table is not None:
+            target = window.offwork_table.next(slot, now_local)
+            if target is not None and target <= now_local:
+                report.anomaly(now_local, "offwork-stale", f"{slot}: {target}")
+
+    if window.zone_countdown.zones and window.zone_countdown.target is not None:
+        if window.zone_countdown.remaining(now_local).total_seconds() < 0:
+            report.anomaly(now_local, "zone-negative", window.zone_label.text())
+
+
+def _check_refresh(window, now_local: datetime, report: SimulationReport):
+    for h in (item.holiday for item in window.items if not item.holiday.flag_None):
+        if h.end < now_local - timedelta(days=1):
+            report.anomaly(now_local, "stale-holiday", f"{h.name} 已于 {h.end:%Y-%m-%d} 结束仍在列表中")
+
+
+@contextmanager
+def headless_window(clock, ics_text: str, config: Optional[dict] = None, prefix: str = "holiday-sim-"):
+    """
+    无界面运行主窗口的公共脚手架（simulate / soak / faultnet 共用）：
+    offscreen QApplication、临时工作目录（写入 holiday_data.ics 与 config.json）、
+    替换全局时钟、离线构建 MainWindow（等首次后台解析完成）并停掉它自己的定时器。
+    产出 (app, window, work_dir)；退出时关闭窗口并恢复工作目录与时钟，删除临时目录。
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6 import QtWidgets
+
+    from holidays.clock import set_clock
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+    work_dir = tempfile.mkdtemp(prefix=prefix)
+    with open(os.path.join(work_dir, "holiday_data.ics"), "w", encoding="utf-8", newline="") as f:
+        f.write(ics_text)
+    with open(os.path.join(work_dir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump(config or {}, f, ensure_ascii=False)
+
+    old_clock = set_clock(clock)
+    old_cwd = os.getcwd()
+    os.chdir(work_dir)
+    window = None
+    try:
+        from ui.main_window import MainWindow
+
+        window = MainWindow(offline_first=True, clock=clock)
+        window.wait_ingest()
+        window.ui_timer.stop()
+        window.refresh_timer.stop()
+        yield app, window, work_dir
+    finally:
+        if window is not None:
+            window.force_quit()
+        os.chdir(old_cwd)
+        set_clock(old_clock)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def read_ics(path: str) -> str:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def run_simulation(ics_path: str, start: datetime, days: float,
+                   tick: timedelta = timedelta(minutes=10),
+                   refresh_every: timedelta = timedelta(hours=1),
+                   config: Optional[dict] = None) -> SimulationReport:
+    from holidays.clock import VirtualClock
+    from holidays.timezones import localize
+
+    # 时钟返回带时区的时刻，起止时间也统一成上海时间再比较
+    start = localize(start)
+    clock = VirtualClock(start)
+    end = start + timedelta(days=days)
+    report = SimulationReport(start=start, end=end)
+    wall = time.perf_counter()
+    try:
+        with headless_window(clock, read_ics(ics_path), config) as (app, window, _):
+            last_remaining: Dict[str, int] = {}
+            next_refresh = start + refresh_every
+            now = start
+            while now < end:
+                clock.advance(tick)
+                now = clock.now()
+                now_local = localize(now)
+
+                if now >= next_refresh:
+                    next_refresh += refresh_every
+                    t0 = time.perf_counter()
+                    window.load_ics_and_refresh(offline=True)
+                    window.wait_ingest()
+                    report.refresh.add(time.perf_counter() - t0)
+                    last_remaining.clear()
+                    _check_refresh(window, now_local, report)
+
+                t0 = time.perf_counter()
+                window.update_countdowns()
+                report.tick.add(time.perf_counter() - t0)
+                _check_tick(window, now_local, last_remaining, report)
+                app.processEvents()
+    finally:
+        report.wall_seconds = time.perf_counter() - wall
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="虚拟时钟加速模拟")
+    parser.add_argument("--ics", default="holiday_data.ics")
+    parser.add_argument("--start", default=None, help="起始时刻（上海墙上时间），如 2025-01-01T08:00")
+    parser.add_argument("--days", type=float, default=90)
+    parser.add_argument("--tick", type=int, default=600, help="每步虚拟秒数")
+    parser.add_argument("--refresh", type=int, default=3600, help="刷新间隔（虚拟秒）")
+    parser.add_argument("--zones", nargs="*", default=[], help="额外时区，用于覆盖夏令时边界")
+    args = parser.parse_args(argv)
+
+    from holidays.clock import SystemClock
+
+    start = datetime.fromisoformat(args.start) if args.start else SystemClock().now()
+    config = {"extra_timezones": args.zones} if args.zones else {}
+    report = run_simulation(os.path.abspath(args.ics), start, args.days,
+                            tick=timedelta(seconds=args.tick),
+                            refresh_every=timedelta(seconds=args.refresh),
+                            config=config)
+    print(report.summary())
+    return 1 if report.anomalies else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
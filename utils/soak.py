@@ -0,0 +1,195 @@
+# utils/soak.py
+"""
+长时间浸泡测试：在 offscreen Qt 平台上无界面地反复执行 刷新 + tick + 消息提示，
+模拟托盘常驻数周，记录 RSS、Qt 对象数量与 Python 分配（tracemalloc），
+预热之后仍持续增长即判定为泄漏并返回非零。
+
+    python -m utils.soak --cycles 2000 --ticks 10
+
+与 utils.simulate 一样全程离线、工作目录切到临时目录，不会改动真实的配置与缓存。
+RSS 统计在 Windows / macOS 上需要另外安装 psutil（可选依赖）。
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:  # 可选依赖（不在 requirements.txt 中）：没有时 Linux 下退回读取 /proc，其他平台不统计 RSS
+    psutil = None
+
+
+def current_rss() -> Optional[int]:
+    """当前进程常驻内存（字节），无法获取时返回 None"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class SoakSample:
+    cycle: int
+    rss: Optional[int]
+    widgets: int          # QApplication.allWidgets()，含已脱离父对象但未销毁的控件
+    children: int         # 主窗口下的 QObject 子对象
+    traced: int           # tracemalloc 当前分配字节数
+
+
+@dataclass
+class SoakReport:
+    cycles: int
+    ticks: int
+    samples: List[SoakSample] = field(default_factory=list)
+    leaks: List[str] = field(default_factory=list)
+    top_allocations: List[str] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    def summary(self) -> str:
+        first, last = self.samples[0], self.samples[-1]
+        rss = "n/a" if first.rss is None or last.rss is None else \
+            f"{first.rss / 2**20:.1f}MB -> {last.rss / 2**20:.1f}MB"
+        lines = [
+            f"浸泡 {self.cycles} 轮 × {self.ticks} tick（实际耗时 {self.wall_seconds:.1f}s）",
+            f"RSS:        {rss}",
+            f"Qt 控件:    {first.widgets} -> {last.widgets}",
+            f"窗口子对象: {first.children} -> {last.children}",
+            f"Python 分配: {first.traced / 1024:.1f}KB -> {last.traced / 1024:.1f}KB",
+            f"泄漏: {len(self.leaks)}",
+        ]
+        lines += [f"  {leak}" for leak in self.leaks]
+        if self.leaks and self.top_allocations:
+            lines.append("分配增长最多的位置:")
+            lines += [f"  {line}" for line in self.top_allocations]
+        return "\n".join(lines)
+
+
+def _growth(samples: List[SoakSample], attr: str) -> Tuple[float, float]:
+    """(末尾相对基线的增量, 后半段的最小二乘斜率 / 每千轮)"""
+    values = [(s.cycle, getattr(s, attr)) for s in samples if getattr(s, attr) is not None]
+    if len(values) < 2:
+        return 0.0, 0.0
+    delta = values[-1][1] - values[0][1]
+    tail = values[len(values) // 2:]
+    if len(tail) < 2:
+        return delta, 0.0
+    mean_x = sum(x for x, _ in tail) / len(tail)
+    mean_y = sum(y for _, y in tail) / len(tail)
+    var = sum((x - mean_x) ** 2 for x, _ in tail)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in tail) / var if var else 0.0
+    return delta, slope * 1000
+
+
+def _flush_deferred_deletes(app):
+    """deleteLater 的对象要回到事件循环才销毁；脚本驱动时手动投递"""
+    from PyQt6 import QtCore
+
+    app.processEvents()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete.value)
+    gc.collect()
+
+
+def run_soak(ics_path: str, cycles: int = 2000, ticks: int = 10, warmup: int = 50,
+             sample_every: int = 50, start: Optional[datetime] = None,
+             max_rss_growth: int = 32 * 2**20, max_traced_growth: int = 1 * 2**20,
+             max_object_growth: int = 0, config: Optional[dict] = None) -> SoakReport:
+    from PyQt6 import QtCore, QtWidgets
+
+    from holidays.clock import SystemClock, VirtualClock
+    from utils.simulate import headless_window, read_ics
+
+    clock = VirtualClock(start or SystemClock().now())
+    report = SoakReport(cycles=cycles, ticks=ticks)
+    wall = time.perf_counter()
+    try:
+        with headless_window(clock, read_ics(ics_path), config, prefix="holiday-soak-") as (app, window, _):
+
+            def sample(cycle: int):
+                _flush_deferred_deletes(app)
+                report.samples.append(SoakSample(
+                    cycle=cycle,
+                    rss=current_rss(),
+                    widgets=len(QtWidgets.QApplication.allWidgets()),
+                    children=len(window.findChildren(QtCore.QObject)),
+                    traced=tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+                ))
+
+            baseline = None
+            for cycle in range(1, warmup + cycles + 1):
+                # 一轮 = 一次整点刷新 + 若干次倒计时 tick + 两条消息提示
+                window.load_ics_and_refresh(offline=True)
+                window.wait_ingest()
+                for _ in range(ticks):
+                    clock.advance(timedelta(seconds=360))
+                    window.update_countdowns()
+                window.show_message(f"soak {cycle}", duration=10)
+                window.show_status_message(f"soak {cycle}", duration=10)
+                app.processEvents()
+
+                if cycle == warmup:
+                    # 先空采样一次：采样本身创建的 sip 包装对象 / 枚举缓存不计入基线之后的增长
+                    sample(0)
+                    report.samples.clear()
+                    tracemalloc.start()
+                    baseline = tracemalloc.take_snapshot()
+                    sample(0)
+                elif cycle > warmup and (cycle - warmup) % sample_every == 0:
+                    sample(cycle - warmup)
+
+            if baseline is not None:
+                _flush_deferred_deletes(app)
+                ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen *>")]
+                diff = tracemalloc.take_snapshot().filter_traces(ignore).compare_to(
+                    baseline.filter_traces(ignore), "lineno")
+                report.top_allocations = [str(stat) for stat in diff[:10] if stat.size_diff > 0]
+                tracemalloc.stop()
+    finally:
+        report.wall_seconds = time.perf_counter() - wall
+
+    # === 判定：预热后仍在增长 ===
+    for attr, limit, unit, title in (
+        ("widgets", max_object_growth, 1, "Qt 控件数量"),
+        ("children", max_object_growth, 1, "主窗口子对象数量"),
+        ("traced", max_traced_growth, 1024, "Python 分配（KB）"),
+        ("rss", max_rss_growth, 2**20, "RSS（MB）"),
+    ):
+        delta, slope = _growth(report.samples, attr)
+        if delta > limit and slope > 0:
+            report.leaks.append(f"{title} 增长 {delta / unit:.1f}（后半段每千轮 +{slope / unit:.1f}）")
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="托盘常驻浸泡测试（内存 / Qt 对象增长）")
+    parser.add_argument("--ics", default="holiday_data.ics")
+    parser.add_argument("--cycles", type=int, default=2000, help="刷新轮数（预热之后）")
+    parser.add_argument("--ticks", type=int, default=10, help="每轮倒计时 tick 次数")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--sample-every", type=int, default=50)
+    parser.add_argument("--start", default=None, help="起始时刻（上海墙上时间），如 2025-01-01T08:00")
+    parser.add_argument("--max-rss-mb", type=float, default=32)
+    parser.add_argument("--max-traced-kb", type=float, default=1024)
+    parser.add_argument("--max-objects", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = run_soak(os.path.abspath(args.ics), cycles=args.cycles, ticks=args.ticks,
+                      warmup=args.warmup, sample_every=args.sample_every,
+                      start=datetime.fromisoformat(args.start) if args.start else None,
+                      max_rss_growth=int(args.max_rss_mb * 2**20),
+                      max_traced_growth=int(args.max_traced_kb * 1024),
+                      max_object_growth=args.max_objects)
+    print(report.summary())
+    return 1 if report.leaks else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())